@@ -0,0 +1,75 @@
+# benchmarks/dashboard_memory.py
+"""
+Memory regression check for the dashboard.
+
+Renders every dashboard function N times outside of a Streamlit server
+(st.* calls are no-ops in bare mode) and reports the traced Python heap and
+the number of figures left open in pyplot after each round. Exits with
+status 1 if the heap keeps growing after the warm-up round or any pyplot
+figure is left open.
+
+Usage:
+    python -m benchmarks.dashboard_memory --rounds 20
+"""
+import argparse
+import gc
+import sys
+import tracemalloc
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+
+from scripts import data_visualization  # noqa: E402
+
+DASHBOARD_FUNCTIONS = [
+    data_visualization.introduction,
+    data_visualization.describe_tables,
+    data_visualization.visualize_outliers_in_abstraction,
+    data_visualization.visualize_water_sources_by_availability,
+    data_visualization.visualize_abstraction_bar_chart,
+    data_visualization.visualize_grouped_abstraction,
+    data_visualization.visualize_total_abstraction_capacity,
+    data_visualization.human_resources_analysis,
+    data_visualization.treatment_plant_visualizations,
+    data_visualization.water_quality_analysis,
+    data_visualization.commercial_analysis,
+    data_visualization.plot_financial_data,
+    data_visualization.plot_distribution_network_data,
+    data_visualization.visualize_column_outliers,
+]
+
+
+def render_dashboard():
+    for function in DASHBOARD_FUNCTIONS:
+        function()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--max-growth-kib", type=float, default=512,
+                        help="Allowed heap growth between the first and the last round")
+    args = parser.parse_args(argv)
+
+    tracemalloc.start()
+    sizes = []
+    for round_number in range(1, args.rounds + 1):
+        render_dashboard()
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+        sizes.append(current)
+        print(f"round {round_number:3d}: heap {current / 1024:10.1f} KiB, open pyplot figures {len(plt.get_fignums())}")
+
+    growth_kib = (sizes[-1] - sizes[0]) / 1024
+    print(f"heap growth after warm-up: {growth_kib:.1f} KiB")
+    if plt.get_fignums() or growth_kib > args.max_growth_kib:
+        print("FAIL: dashboard rendering leaks memory")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
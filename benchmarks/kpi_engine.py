@@ -0,0 +1,61 @@
+# benchmarks/kpi_engine.py
+"""
+KPI engine benchmark.
+
+Builds a synthetic commercial x financial frame of N utility-periods and
+times scripts.kpi.compute_kpis against the same formulas applied row by
+row with DataFrame.apply, the way a per-record recomputation would do it.
+The row-wise baseline is timed on --baseline-rows rows and extrapolated.
+
+Usage:
+    python -m benchmarks.kpi_engine --rows 10000 1000000
+"""
+import argparse
+import time
+
+import pandas as pd
+
+from benchmarks.snapshot_formats import best_of, synthetic_frame
+from scripts.kpi import INPUT_COLUMNS, KPI_FORMULAS, compute_kpis
+
+
+def synthetic_utility_periods(rows, seed=0):
+    """Returns `rows` random commercial x financial rows, one financial row per commercial row."""
+    commercial = synthetic_frame("commercial", rows, seed=seed)
+    financial = synthetic_frame("financial", rows, seed=seed + 1)
+    commercial["idCommercial"] = financial["idCommercial"] = range(1, rows + 1)
+    financial["idFinancial"] = range(1, rows + 1)
+    return pd.merge(commercial, financial, on="idCommercial")
+
+
+def row_wise(frame):
+    def compute(row):
+        columns = {column: float(row[column]) for column in INPUT_COLUMNS}
+        for name, formula in KPI_FORMULAS.items():
+            columns[name] = float(formula(columns))
+        return pd.Series({name: columns[name] for name in KPI_FORMULAS})
+    return frame.apply(compute, axis=1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the vectorized KPI engine.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 1_000_000])
+    parser.add_argument("--baseline-rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    baseline = synthetic_utility_periods(args.baseline_rows)
+    started = time.perf_counter()
+    row_wise(baseline)
+    per_row = (time.perf_counter() - started) / args.baseline_rows
+
+    for rows in args.rows:
+        frame = synthetic_utility_periods(rows)
+        seconds = best_of(args.repeat, lambda: compute_kpis(frame))
+        print(f"{rows:,} utility-periods, {len(KPI_FORMULAS)} KPIs:")
+        print(f"  vectorized  {seconds * 1000:10.1f} ms")
+        print(f"  row-wise    {per_row * rows * 1000:10.1f} ms (extrapolated from {args.baseline_rows:,} rows)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# benchmarks/snapshot_formats.py
+"""
+CSV vs Parquet snapshot benchmark.
+
+Generates a synthetic table with the snapshot schema of a WSMS table, writes
+it both as CSV and as a typed Parquet file, and times full and projected
+reads of each. Projected reads load only the --columns a chart plots.
+
+Usage:
+    python -m benchmarks.snapshot_formats --rows 10000 1000000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from scripts.snapshot import arrow_schema
+from scripts.snapshot_schema import TABLE_SCHEMAS, snapshot_columns
+
+
+def synthetic_frame(table_name, rows, seed=0):
+    """Returns `rows` random rows with the non-BLOB columns and types of a table."""
+    rng = np.random.default_rng(seed)
+    data = {}
+    for column, kind in TABLE_SCHEMAS[table_name].items():
+        if kind == "int":
+            data[column] = rng.integers(1, 10_000, rows)
+        elif kind == "float":
+            data[column] = rng.random(rows) * 100
+        elif kind == "str":
+            data[column] = pd.Series(rng.integers(0, 500, rows)).map("name {}".format)
+    return pd.DataFrame(data)
+
+
+def best_of(repeat, function):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def run(table_name, rows, columns, repeat):
+    df = synthetic_frame(table_name, rows)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = os.path.join(tmp_dir, f"{table_name}.csv")
+        parquet_path = os.path.join(tmp_dir, f"{table_name}.parquet")
+        df.to_csv(csv_path, index=False)
+        pq.write_table(pa.Table.from_pandas(df, schema=arrow_schema(table_name), preserve_index=False), parquet_path)
+
+        results = {
+            "csv full": best_of(repeat, lambda: pd.read_csv(csv_path)),
+            "csv projected": best_of(repeat, lambda: pd.read_csv(csv_path, usecols=columns)),
+            "parquet full": best_of(repeat, lambda: pq.read_table(parquet_path, memory_map=True).to_pandas()),
+            "parquet projected": best_of(
+                repeat, lambda: pq.read_table(parquet_path, columns=columns, memory_map=True).to_pandas()),
+        }
+        sizes = {"csv": os.path.getsize(csv_path), "parquet": os.path.getsize(parquet_path)}
+
+    print(f"{table_name}, {rows:,} rows: csv {sizes['csv'] / 2**20:.1f} MiB, parquet {sizes['parquet'] / 2**20:.1f} MiB")
+    for name, seconds in results.items():
+        print(f"  {name:<18} {seconds * 1000:10.1f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare CSV and Parquet snapshot reads.")
+    parser.add_argument("--table", default="water_quality", choices=list(TABLE_SCHEMAS))
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 1_000_000])
+    parser.add_argument("--columns", nargs="+", default=None,
+                        help="Columns of the projected reads, defaults to the first three")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    columns = args.columns or snapshot_columns(args.table)[:3]
+    for rows in args.rows:
+        run(args.table, rows, columns, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
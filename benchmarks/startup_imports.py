@@ -0,0 +1,53 @@
+# benchmarks/startup_imports.py
+"""
+Startup import benchmark.
+
+Imports a module in a fresh interpreter with `python -X importtime` and
+reports the total import time plus the slowest modules by cumulative time.
+Run from the repository root:
+
+    python -m benchmarks.startup_imports                   # app startup
+    python -m benchmarks.startup_imports scripts.dashboard # plotting stack
+"""
+import argparse
+import subprocess
+import sys
+
+
+def import_times(module, python=sys.executable):
+    """
+    Imports `module` in a subprocess and parses the -X importtime report.
+
+    :return: List of (cumulative_us, self_us, module_name), in import order.
+    """
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()[1:]))  # Nesting shown as indentation
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report the import time of a module.")
+    parser.add_argument("module", nargs="?", default="app")
+    parser.add_argument("--top", type=int, default=25, help="Number of slowest modules to list")
+    args = parser.parse_args(argv)
+
+    rows = import_times(args.module)
+    top_level = [row for row in rows if not row[2].startswith(" ")]
+    total_us = sum(row[0] for row in top_level)
+
+    print(f"import {args.module}: {total_us / 1000:.1f} ms over {len(rows)} modules")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:14.1f} {self_us / 1000:9.1f}  {name.strip()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# benchmarks/submit_latency.py
+"""
+Per-submit latency of form inserts, before and after the statement registry.
+
+"before" builds the INSERT text on every call and runs it on a new plain
+cursor, as insert_record used to; "after" takes the statement from
+scripts/sql_templates.py and runs it on the connection's prepared cursor.
+Without --db only the statement construction is timed. With --db the
+inserts are executed on a pooled connection inside a transaction that is
+rolled back at the end, so no rows are kept.
+
+Usage:
+    python -m benchmarks.submit_latency
+    python -m benchmarks.submit_latency --db --submits 2000
+"""
+import argparse
+import statistics
+import time
+
+from scripts.snapshot_schema import form_columns
+from scripts.sql_templates import insert_statement, prepared_cursor
+
+BENCH_TABLE = "type_of_application"
+BENCH_COLUMNS = ("Title", "Description")
+
+
+def build_before(table_name, columns):
+    columns_str = ', '.join(columns)
+    placeholders = ', '.join(['%s'] * len(columns))
+    return f"INSERT INTO `{table_name}` ({columns_str}) VALUES ({placeholders})"
+
+
+def build_after(table_name, columns):
+    return insert_statement(table_name, tuple(columns))
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return {
+        "mean": statistics.fmean(samples),
+        "p50": samples[len(samples) // 2],
+        "p95": samples[int(len(samples) * 0.95) - 1],
+    }
+
+
+def report(name, samples):
+    stats = percentiles(samples)
+    print(f"  {name:<8} mean {stats['mean'] * 1e6:9.2f} us   p50 {stats['p50'] * 1e6:9.2f} us   p95 {stats['p95'] * 1e6:9.2f} us")
+
+
+def time_builds(submits):
+    columns = form_columns("commercial")  # Widest WSMS form
+    print(f"statement construction, commercial ({len(columns)} columns), {submits} submits")
+    for name, build in (("before", build_before), ("after", build_after)):
+        samples = []
+        for _ in range(submits):
+            started = time.perf_counter()
+            build("commercial", columns)
+            samples.append(time.perf_counter() - started)
+        report(name, samples)
+
+
+def time_inserts(submits):
+    from scripts.db_pool import get_pool
+
+    pool = get_pool()
+    connection = pool.acquire()
+    print(f"INSERT into {BENCH_TABLE}, {submits} submits (rolled back)")
+    try:
+        values = ["benchmark", "submit latency"]
+
+        samples = []
+        for _ in range(submits):
+            started = time.perf_counter()
+            cursor = connection.cursor()
+            cursor.execute(build_before(BENCH_TABLE, BENCH_COLUMNS), values)
+            cursor.close()
+            samples.append(time.perf_counter() - started)
+        report("before", samples)
+
+        samples = []
+        for _ in range(submits):
+            started = time.perf_counter()
+            statement = insert_statement(BENCH_TABLE, BENCH_COLUMNS)
+            cursor, reusable = prepared_cursor(connection, statement)
+            cursor.execute(statement, values)
+            if not reusable:
+                cursor.close()
+            samples.append(time.perf_counter() - started)
+        report("after", samples)
+    finally:
+        connection.rollback()
+        pool.release(connection)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare per-submit insert latency before and after the statement registry.")
+    parser.add_argument("--submits", type=int, default=1000)
+    parser.add_argument("--db", action="store_true", help="Also time the inserts against the database")
+    args = parser.parse_args(argv)
+
+    time_builds(args.submits)
+    if args.db:
+        time_inserts(args.submits)
+
+
+if __name__ == "__main__":
+    main()
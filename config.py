@@ -3,6 +3,37 @@ import streamlit as st
 import os
 import mysql.connector
 
+# Connection pool settings (see scripts/db_pool.py)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))  # Idle connections kept open
+DB_POOL_MAX_OVERFLOW = int(os.getenv("DB_POOL_MAX_OVERFLOW", "10"))  # Extra connections allowed under load
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))  # Max connection age in seconds
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))  # Max seconds to wait for a free connection
+DB_PREPARED_STATEMENTS = os.getenv("DB_PREPARED_STATEMENTS", "1") != "0"  # Server-side prepared inserts/selects (see scripts/sql_templates.py)
+
+# Seconds a cached dropdown lookup stays valid (see scripts/lookup_cache.py)
+LOOKUP_CACHE_TTL = float(os.getenv("LOOKUP_CACHE_TTL", "300"))
+
+# Memory budget of the rendered dashboard chart cache (see scripts/chart_cache.py)
+CHART_CACHE_MAX_BYTES = int(os.getenv("CHART_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+# Background form submissions (see scripts/submission_queue.py)
+SUBMIT_WORKERS = int(os.getenv("SUBMIT_WORKERS", "4"))  # Worker threads inserting submitted rows
+SUBMIT_QUEUE_SIZE = int(os.getenv("SUBMIT_QUEUE_SIZE", "32"))  # Max queued or running submissions
+SUBMIT_MAX_ATTEMPTS = int(os.getenv("SUBMIT_MAX_ATTEMPTS", "4"))  # Attempts per submission on transient errors
+SUBMIT_RETRY_BACKOFF = float(os.getenv("SUBMIT_RETRY_BACKOFF", "0.5"))  # Seconds before the first retry, doubled each time
+SUBMIT_DEDUP_TTL = float(os.getenv("SUBMIT_DEDUP_TTL", "120"))  # Seconds an identical payload is rejected as a duplicate (see scripts/submission_dedup.py)
+
+# Incremental snapshot sync (see scripts/snapshot.py)
+SNAPSHOT_CHUNK_SIZE = int(os.getenv("SNAPSHOT_CHUNK_SIZE", "10000"))  # Rows pulled per query
+SNAPSHOT_VERIFY_INTERVAL = float(os.getenv("SNAPSHOT_VERIFY_INTERVAL", str(6 * 3600)))  # Seconds between checksum passes
+SNAPSHOT_MAX_PARTS = int(os.getenv("SNAPSHOT_MAX_PARTS", "32"))  # Part files per table before they are compacted
+
+# Values kept per level of the quantile sketches; rank error is about 1/k (see scripts/quantile_sketch.py)
+QUANTILE_SKETCH_K = int(os.getenv("QUANTILE_SKETCH_K", "200"))
+
+# Rows per executemany transaction of the spreadsheet import (see scripts/bulk_import.py)
+BULK_IMPORT_BATCH_SIZE = int(os.getenv("BULK_IMPORT_BATCH_SIZE", "500"))
+
 def is_cloud_env():
     # Check for the existence of an environment variable or another method to detect cloud
     return os.getenv("STREAMLIT_ENV") == "cloud"
@@ -0,0 +1,89 @@
+# scripts/blob_store.py
+"""
+Content-addressed local store for uploaded files.
+
+Uploads used to be read fully into memory and inserted as LONGBLOB row
+values, which inflated MySQL packets and slowed every SELECT * on those
+tables. store_upload streams an upload in chunks into data/blobs/, keyed by
+its sha256 (identical files are stored once), and returns a small JSON
+reference with the digest and file metadata; that reference is what goes
+into the row.
+"""
+import hashlib
+import json
+import os
+import tempfile
+
+BLOB_DIR = os.path.join("data", "blobs")
+CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+
+def blob_path(digest):
+    """Returns the file path of a blob, fanned out by the first two hex digits."""
+    return os.path.join(BLOB_DIR, digest[:2], digest)
+
+
+def store_upload(uploaded_file):
+    """
+    Streams an uploaded file into the blob store.
+
+    :param uploaded_file: File-like object, e.g. the result of st.file_uploader, or None.
+    :return: JSON reference {"sha256", "name", "type", "size"} to store in the row, or None.
+    """
+    if uploaded_file is None:
+        return None
+
+    os.makedirs(BLOB_DIR, exist_ok=True)
+    uploaded_file.seek(0)
+    sha256 = hashlib.sha256()
+    size = 0
+    fd, tmp_path = tempfile.mkstemp(dir=BLOB_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            for chunk in iter(lambda: uploaded_file.read(CHUNK_SIZE), b""):
+                sha256.update(chunk)
+                out.write(chunk)
+                size += len(chunk)
+
+        digest = sha256.hexdigest()
+        path = blob_path(digest)
+        if os.path.exists(path):
+            os.remove(tmp_path)  # Same content already stored
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return json.dumps({
+        "sha256": digest,
+        "name": getattr(uploaded_file, "name", None),
+        "type": getattr(uploaded_file, "type", None),
+        "size": size,
+    })
+
+
+def parse_reference(value):
+    """Returns the metadata dict of a stored reference, or None for legacy in-row BLOBs."""
+    if isinstance(value, (bytes, bytearray)):
+        try:
+            value = value.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+    if not isinstance(value, str) or not value.startswith("{"):
+        return None
+    try:
+        reference = json.loads(value)
+    except ValueError:
+        return None
+    return reference if isinstance(reference, dict) and "sha256" in reference else None
+
+
+def open_blob(value):
+    """Opens the stored file of a reference for reading in binary mode."""
+    reference = parse_reference(value)
+    if reference is None:
+        raise ValueError("Not a blob store reference")
+    return open(blob_path(reference["sha256"]), "rb")
@@ -0,0 +1,319 @@
+# scripts/bulk_import.py
+"""
+Bulk import of WSMS rows from CSV or Excel files.
+
+Utilities send their quarterly indicators as spreadsheets with thousands of
+rows, which used to be typed in one form submission (and one transaction) at
+a time. This module streams a CSV/XLSX file, maps its header to the columns
+the data entry form of the table inserts, validates every row against the
+table schema and inserts the valid rows in executemany batches, one
+transaction per batch. Invalid rows, and rows the database refuses, are
+written to a reject file together with the reason.
+
+Usage:
+    python -m scripts.bulk_import commercial data/commercial_q3.xlsx --batch-size 1000
+"""
+import argparse
+import csv
+import math
+import os
+import time
+
+import pandas as pd
+import streamlit as st
+from config import BULK_IMPORT_BATCH_SIZE
+from .help_function import DatabaseHelper
+from .snapshot import TABLE_PRIMARY_KEYS
+from .snapshot_schema import TABLE_SCHEMAS, form_columns
+
+REJECT_DIR = os.path.join("data", "rejects")
+EXCEL_EXTENSIONS = (".xlsx", ".xlsm")
+
+# Primary key column -> table, to check foreign keys against their parent table
+PARENT_TABLES = {primary_key: table_name for table_name, primary_key in TABLE_PRIMARY_KEYS.items()}
+
+
+def read_records(source, chunk_size):
+    """
+    Streams a CSV or XLSX file as chunks of records.
+
+    :param source: File path or uploaded file object.
+    :param chunk_size: Maximum number of records per chunk.
+    :return: Iterator of lists of {header: raw value} dicts.
+    """
+    name = str(getattr(source, "name", source)).lower()
+    if name.endswith(EXCEL_EXTENSIONS):
+        yield from _read_excel_records(source, chunk_size)
+        return
+    for chunk in pd.read_csv(source, dtype=str, keep_default_na=False, chunksize=chunk_size):
+        yield chunk.to_dict("records")
+
+
+def _read_excel_records(source, chunk_size):
+    # pandas.read_excel loads the whole sheet, the read-only openpyxl reader streams it
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(source, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = ["" if cell is None else str(cell) for cell in next(rows, ())]
+        chunk = []
+        for row in rows:
+            if all(cell is None for cell in row):
+                continue
+            chunk.append(dict(zip(header, row)))
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    finally:
+        workbook.close()
+
+
+def map_header(table_name, header):
+    """
+    Maps file headers to the form columns of a table (case and spacing are ignored).
+
+    :return: Dict form column -> file header.
+    :raise ValueError: If a required column is missing from the file.
+    """
+    by_name = {str(name).strip().lower(): name for name in header}
+    mapping = {}
+    missing = []
+    for column in form_columns(table_name):
+        name = by_name.get(column.lower())
+        if name is not None:
+            mapping[column] = name
+        elif TABLE_SCHEMAS[table_name][column] != "blob":  # Uploads cannot come from a spreadsheet
+            missing.append(column)
+    if missing:
+        raise ValueError(f"Missing columns for {table_name}: {', '.join(missing)}")
+    return mapping
+
+
+def convert_value(kind, raw):
+    """Converts a raw cell to the column type; empty cells become NULL."""
+    text = "" if raw is None else str(raw).strip()
+    if text == "":
+        return None
+    if kind == "int":
+        number = float(text)
+        if not number.is_integer():
+            raise ValueError(f"expected an integer, got {text!r}")
+        return int(number)
+    if kind == "float":
+        number = float(text)
+        if not math.isfinite(number):
+            raise ValueError(f"expected a number, got {text!r}")
+        return number
+    return text
+
+
+def validate_record(table_name, record, mapping, parent_ids):
+    """
+    Validates one record and returns its values in form_columns() order.
+
+    :param parent_ids: Dict foreign key column -> set of existing parent ids.
+    :return: Tuple (values, error); values is None when the record is rejected.
+    """
+    schema = TABLE_SCHEMAS[table_name]
+    values = []
+    for column in form_columns(table_name):
+        header = mapping.get(column)
+        try:
+            value = convert_value(schema[column], record.get(header)) if header is not None else None
+        except ValueError as err:
+            return None, f"{column}: {err}"
+        if column in parent_ids and value not in parent_ids[column]:
+            return None, f"{column}: no {PARENT_TABLES[column]} row with id {value}"
+        values.append(value)
+    return values, None
+
+
+class RejectWriter:
+    """Writes rejected rows with their file row number and reason; the file is created on the first reject."""
+
+    def __init__(self, path, header):
+        self.path = path
+        self.header = list(header)
+        self.count = 0
+        self._file = None
+        self._writer = None
+
+    def write(self, row_number, record, error):
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._file = open(self.path, "w", newline="", encoding="utf-8")
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(["row", "error"] + self.header)
+        self._writer.writerow([row_number, error] + [record.get(name) for name in self.header])
+        self.count += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
+
+def default_reject_path(table_name):
+    return os.path.join(REJECT_DIR, f"{table_name}-{time.strftime('%Y%m%d-%H%M%S')}.csv")
+
+
+def _insert_batch(db_helper, table_name, batch, rejects):
+    """Inserts one batch; when the database refuses it, retries row by row to isolate the bad rows."""
+    columns = form_columns(table_name)
+    success, message, inserted = db_helper.insert_many(table_name, columns, [values for _, _, values in batch])
+    if success:
+        return inserted
+
+    inserted = 0
+    for row_number, record, values in batch:
+        success, message, _ = db_helper.insert_record(table_name, columns, values, return_id=False)
+        if success:
+            inserted += 1
+        else:
+            rejects.write(row_number, record, message)
+    return inserted
+
+
+def fetch_parent_ids(db_helper, table_name):
+    """
+    Reads the ids of every parent table referenced by a WSMS table, bypassing the lookup cache.
+
+    :return: Dict foreign key column -> set of existing ids.
+    :raise RuntimeError: If a parent table cannot be read.
+    """
+    parent_ids = {}
+    for column in form_columns(table_name):
+        if column not in PARENT_TABLES:
+            continue
+        # Parents added within the lookup cache TTL must not be rejected as unknown
+        result = db_helper.fetch_data(PARENT_TABLES[column], [column], use_cache=False)
+        if isinstance(result, tuple):
+            raise RuntimeError(f"Could not read {PARENT_TABLES[column]} ids: {result[1]}")
+        parent_ids[column] = {row[0] for row in result}
+    return parent_ids
+
+
+def import_file(source, table_name, batch_size=BULK_IMPORT_BATCH_SIZE, reject_path=None, progress=None):
+    """
+    Imports a CSV/XLSX file into a WSMS table in batches.
+
+    :param source: File path or uploaded file object.
+    :param table_name: One of the WSMS tables.
+    :param batch_size: Rows per executemany transaction.
+    :param reject_path: CSV file receiving the rejected rows, defaults to data/rejects/<table>-<time>.csv.
+    :param progress: Optional callable receiving a dict after each batch.
+    :return: Summary dict with rows, inserted, rejected, batches, seconds and reject_path.
+    :raise RuntimeError: If the parent table ids cannot be read.
+    """
+    if table_name not in TABLE_PRIMARY_KEYS:
+        raise ValueError(f"Unknown table: {table_name}")
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+
+    reject_path = reject_path or default_reject_path(table_name)
+    db_helper = DatabaseHelper()
+    parent_ids = fetch_parent_ids(db_helper, table_name)
+
+    summary = {"rows": 0, "inserted": 0, "rejected": 0, "batches": 0, "seconds": 0.0, "reject_path": None}
+    rejects = None
+    mapping = None
+    row_number = 1  # The header is row 1
+    started = time.perf_counter()
+    try:
+        for chunk in read_records(source, batch_size):
+            if mapping is None:
+                header = list(chunk[0])
+                mapping = map_header(table_name, header)
+                rejects = RejectWriter(reject_path, header)
+
+            batch_started = time.perf_counter()
+            rejected_before = rejects.count
+            batch = []
+            for record in chunk:
+                row_number += 1
+                values, error = validate_record(table_name, record, mapping, parent_ids)
+                if error is None:
+                    batch.append((row_number, record, values))
+                else:
+                    rejects.write(row_number, record, error)
+
+            inserted = _insert_batch(db_helper, table_name, batch, rejects) if batch else 0
+            summary["rows"] += len(chunk)
+            summary["inserted"] += inserted
+            summary["rejected"] = rejects.count
+            summary["batches"] += 1
+            if progress is not None:
+                progress({
+                    "batch": summary["batches"],
+                    "rows": len(chunk),
+                    "inserted": inserted,
+                    "rejected": rejects.count - rejected_before,
+                    "seconds": time.perf_counter() - batch_started,
+                    "total_rows": summary["rows"],
+                    "total_inserted": summary["inserted"],
+                    "total_rejected": summary["rejected"],
+                })
+    finally:
+        if rejects is not None:
+            rejects.close()
+        db_helper.close_connection()
+
+    summary["seconds"] = time.perf_counter() - started
+    if summary["rejected"]:
+        summary["reject_path"] = reject_path
+    return summary
+
+
+def format_progress(report):
+    return (f"batch {report['batch']}: {report['inserted']}/{report['rows']} rows inserted "
+            f"in {report['seconds']:.2f}s, {report['rejected']} rejected "
+            f"(total {report['total_inserted']} inserted, {report['total_rejected']} rejected)")
+
+
+def render_bulk_import():
+    """Streamlit page importing a spreadsheet into one of the WSMS tables."""
+    table_name = st.selectbox("Table / តារាង", list(TABLE_PRIMARY_KEYS))
+    st.caption("Columns: " + ", ".join(form_columns(table_name)))
+    upload = st.file_uploader("Upload CSV or Excel file / ផ្ទុកឯកសារ CSV ឬ Excel", type=["csv", "xlsx", "xlsm"])
+    batch_size = st.number_input("Batch size / ចំនួនជួរក្នុងមួយបាច់", min_value=1, value=BULK_IMPORT_BATCH_SIZE, step=100)
+
+    if upload is None or not st.button("Import / នាំចូល"):
+        return
+
+    status = st.empty()
+    try:
+        summary = import_file(upload, table_name, batch_size=int(batch_size),
+                              progress=lambda report: status.info(format_progress(report)))
+    except (ValueError, RuntimeError) as err:
+        st.error(str(err))
+        return
+
+    st.success(f"{summary['inserted']} of {summary['rows']} rows imported into {table_name} "
+               f"in {summary['batches']} batches ({summary['seconds']:.1f}s)")
+    if summary["reject_path"]:
+        st.warning(f"{summary['rejected']} rows rejected")
+        with open(summary["reject_path"], "rb") as reject_file:
+            st.download_button("Download rejected rows", reject_file.read(),
+                               file_name=os.path.basename(summary["reject_path"]), mime="text/csv")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import a CSV/XLSX file into a WSMS table.")
+    parser.add_argument("table", choices=list(TABLE_PRIMARY_KEYS))
+    parser.add_argument("path", help="CSV or XLSX file")
+    parser.add_argument("--batch-size", type=int, default=BULK_IMPORT_BATCH_SIZE)
+    parser.add_argument("--rejects", default=None, help="Reject file, defaults to data/rejects/<table>-<time>.csv")
+    args = parser.parse_args(argv)
+
+    summary = import_file(args.path, args.table, batch_size=args.batch_size, reject_path=args.rejects,
+                          progress=lambda report: print(format_progress(report)))
+    print(f"{summary['inserted']} of {summary['rows']} rows imported into {args.table} in {summary['seconds']:.1f}s")
+    if summary["reject_path"]:
+        print(f"{summary['rejected']} rejected rows written to {summary['reject_path']}")
+    return 1 if summary["rejected"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
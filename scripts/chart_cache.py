@@ -0,0 +1,66 @@
+# scripts/chart_cache.py
+"""
+Process-wide cache of rendered dashboard charts.
+
+Re-drawing every seaborn/matplotlib chart on each Streamlit rerun dominates
+warm dashboard loads. Rendered PNGs are kept per (chart id, data version,
+parameters) in an LRU bounded by CHART_CACHE_MAX_BYTES, so a rerun with
+unchanged snapshots only sends the stored images.
+"""
+import threading
+from collections import OrderedDict
+
+from config import CHART_CACHE_MAX_BYTES
+
+
+class ChartCache:
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._images = OrderedDict()  # key -> PNG bytes, least recently used first
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            image = self._images.get(key)
+            if image is None:
+                self.misses += 1
+                return None
+            self._images.move_to_end(key)
+            self.hits += 1
+            return image
+
+    def put(self, key, image):
+        if len(image) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._images.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._images[key] = image
+            self._size += len(image)
+            while self._size > self.max_bytes:
+                _, evicted = self._images.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+            self._size = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._images),
+                "bytes": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+chart_cache = ChartCache(max_bytes=CHART_CACHE_MAX_BYTES)
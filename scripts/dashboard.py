@@ -0,0 +1,78 @@
+# scripts/dashboard.py
+"""
+Section registry for the WSMS dashboard.
+
+The dashboard used to draw all thirteen analyses on every rerun before the
+first chart became visible. Analyses are now grouped into sections and only
+the section picked in the section bar is computed; the render time and the
+time to the first chart of each view are measured.
+"""
+import time
+
+import streamlit as st
+
+from .data_visualization import (# Water Resources
+                                 introduction,
+                                 describe_tables,
+                                 visualize_outliers_in_abstraction,
+                                 visualize_column_outliers,
+                                 visualize_water_sources_by_availability,
+                                 visualize_abstraction_bar_chart,
+                                 visualize_grouped_abstraction,
+                                 visualize_total_abstraction_capacity,
+                                 # Human Resources
+                                 human_resources_analysis,
+                                 # Treatment Plant
+                                 treatment_plant_visualizations,
+                                 # Water quality
+                                 water_quality_analysis,
+                                 # Commercial
+                                 commercial_analysis,
+                                 # financials
+                                 plot_financial_data,
+                                 # Distribution Nework
+                                 plot_distribution_network_data
+                                 )
+from .figures import first_chart_seconds, start_render_clock
+
+# Section title -> visualization functions, in display order
+DASHBOARD_SECTIONS = {
+    "Overview": [introduction, describe_tables],
+    "Raw Water Sources": [
+        visualize_outliers_in_abstraction,
+        visualize_water_sources_by_availability,
+        visualize_abstraction_bar_chart,
+        visualize_grouped_abstraction,
+        visualize_total_abstraction_capacity,
+    ],
+    "Human Resources": [human_resources_analysis],
+    "Treatment Plants": [treatment_plant_visualizations],
+    "Water Quality": [water_quality_analysis],
+    "Commercial": [commercial_analysis],
+    "Financial": [plot_financial_data],
+    "Distribution Network": [plot_distribution_network_data],
+    "Outliers": [visualize_column_outliers],
+}
+
+
+def render_dashboard():
+    """Renders the selected dashboard section and records its timings."""
+    section = st.radio("Section", list(DASHBOARD_SECTIONS), horizontal=True, key="dashboard_section")
+
+    start_render_clock()
+    started = time.perf_counter()
+    for visualization in DASHBOARD_SECTIONS[section]:
+        visualization()
+    render_seconds = time.perf_counter() - started
+    first_chart = first_chart_seconds()
+
+    metrics = {"section": section, "render_seconds": render_seconds, "first_chart_seconds": first_chart}
+    history = st.session_state.setdefault("dashboard_metrics", [])
+    history.append(metrics)
+    del history[:-50]  # Keep the most recent views only
+
+    caption = f"{section} rendered in {render_seconds:.2f}s"
+    if first_chart is not None:
+        caption += f", first chart after {first_chart:.2f}s"
+    st.caption(caption)
+    return metrics
@@ -1,56 +1,27 @@
 import streamlit as st
-from config import get_connection,is_cloud_env
 import pandas as pd
 import numpy as np
-import os
 import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.express as px
+from .figures import render_figure
+from .kpi import KPI_FORMULAS, get_kpi_frame, kpi_comparison, kpi_mismatch_summary
+from .moments import get_moments_store
+from .quantile_sketch import get_sketch
+from .rollups import get_rollup, rollup_by_source
+from .snapshot import TABLE_PRIMARY_KEYS
+from .snapshot_schema import TABLE_SCHEMAS, measure_columns
+from .water_compliance import PARAMETERS, get_compliance_index, threshold_table
+from .wsms_frames import get_frame
 
 
 
 
-def fetch_and_save_data(table_name, save_path):
-    conn = get_connection()  # Make sure your local database connection works
-    query = f"SELECT * FROM {table_name};"
-    df = pd.read_sql(query, conn)
-    conn.close()
-    df.to_csv(save_path, index=False)  # Save the data to a CSV file
-    return df
-
-# Example usage
-fetch_and_save_data("raw_watersource", "data/raw_watersource.csv")
-fetch_and_save_data("human_resources", "data/human_resources.csv")
-fetch_and_save_data("treatment_plant", "data/treatment_plant.csv")
-fetch_and_save_data("water_quality", "data/water_quality.csv")
-fetch_and_save_data("commercial", "data/commercial.csv")
-fetch_and_save_data("financial", "data/financial.csv")
-fetch_and_save_data("distribution_network", "data/distribution_network.csv")
-
 def fetch_data(table_name):
-    # Dictionary to map table names to file paths
-    table_to_file = {
-        "raw_watersource": "data/raw_watersource.csv",
-        "human_resources": "data/human_resources.csv",
-        "treatment_plant": "data/treatment_plant.csv",
-        "water_quality": "data/water_quality.csv",
-        "commercial": "data/commercial.csv",
-        "financial": "data/financial.csv",
-        "distribution_network": "data/distribution_network.csv"
-    }
-
-    # Load the data from the CSV file
-    file_path = table_to_file.get(table_name)
-    if file_path:
-        df = pd.read_csv(file_path)
-        return df
-    else:
-        raise ValueError(f"Unknown table: {table_name}")
+    # Shared frame of the local snapshot, cached until `python -m scripts.snapshot` rewrites it
+    return get_frame(table_name)
 
 
-    
- 
-
 # Visualization function for outlier detection and box plot
 def visualize_outliers_in_abstraction():
     st.subheader("Outliers in Total Abstraction")
@@ -58,14 +29,8 @@ def visualize_outliers_in_abstraction():
     # Fetch data
     data1 = fetch_data("raw_watersource")
     
-    # Calculate the IQR for outlier detection
-    Q1 = data1['total_abstraction'].quantile(0.25)
-    Q3 = data1['total_abstraction'].quantile(0.75)
-    IQR = Q3 - Q1
-    
-    # Define the lower and upper bounds for outliers
-    lower_bound = Q1 - 1.5 * IQR
-    upper_bound = Q3 + 1.5 * IQR
+    # IQR bounds for outlier detection, from the column's quantile sketch
+    lower_bound, upper_bound, _, _ = get_sketch("raw_watersource", "total_abstraction").outlier_bounds(1.5)
     
     # Find outliers
     outliers = data1[(data1['total_abstraction'] < lower_bound) | (data1['total_abstraction'] > upper_bound)]
@@ -73,11 +38,11 @@ def visualize_outliers_in_abstraction():
     st.write(outliers)
     
     # Plot a box plot for total abstraction
-    fig, ax = plt.subplots(figsize=(6, 4))
-    ax.boxplot(data1['total_abstraction'], vert=False, patch_artist=True, boxprops=dict(facecolor='lightblue'))
-    ax.set_title('Box Plot for Total Abstraction')
-    ax.set_xlabel('Total Abstraction (m³)')
-    st.pyplot(fig)
+    def draw(fig, ax):
+        ax.boxplot(data1['total_abstraction'], vert=False, patch_artist=True, boxprops=dict(facecolor='lightblue'))
+        ax.set_title('Box Plot for Total Abstraction')
+        ax.set_xlabel('Total Abstraction (m³)')
+    render_figure(draw, chart_id='visualize_outliers_in_abstraction/1', figsize=(6, 4))
 
     st.write("""
 
@@ -92,6 +57,34 @@ def visualize_outliers_in_abstraction():
       - **Range**: The total abstraction values range from 0 to near 4000 m³, indicating variability in the amount of water abstracted from different sources.
     """)
 
+# Visualization function for the sketched outlier bounds of any measurement column
+def visualize_column_outliers():
+    st.subheader("Outlier Bounds of Any Column")
+
+    table_name = st.selectbox("Table", list(TABLE_PRIMARY_KEYS), key="outlier_table")
+    column = st.selectbox("Column", measure_columns(table_name), key="outlier_column")
+    whisker = st.slider("Whisker (x IQR)", 0.5, 3.0, 1.5, 0.5, key="outlier_whisker")
+
+    # Served from the column's quantile sketch, the table is not read
+    sketch = get_sketch(table_name, column)
+    if not sketch.count:
+        st.info("No values recorded for this column yet.")
+        return
+    lower_bound, upper_bound, q1, q3 = sketch.outlier_bounds(whisker)
+    below, above = sketch.rank(np.nextafter(lower_bound, -np.inf)), 1 - sketch.rank(upper_bound)
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Lower bound", f"{lower_bound:,.4g}")
+    col2.metric("Upper bound", f"{upper_bound:,.4g}")
+    col3.metric("Outliers (approx.)", f"{(below + above) * sketch.count:,.0f} of {sketch.count:,}")
+
+    percentiles = [0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99]
+    st.dataframe(pd.DataFrame({
+        "percentile": [f"p{round(q * 100)}" for q in percentiles],
+        "value": [sketch.quantile(q) for q in percentiles],
+    }), hide_index=True)
+
+
 # Visualization function for water sources availability
 def visualize_water_sources_by_availability():
     st.subheader("Water Sources by Availability Year Round")
@@ -100,8 +93,8 @@ def visualize_water_sources_by_availability():
     data1 = fetch_data("raw_watersource")
     
     # Separate water sources into available year-round and not available year-round
-    available_year_round = data1[data1['availability_year_round'] == 1]
-    not_available_year_round = data1[data1['availability_year_round'] == 0]
+    available_year_round = data1[data1['availability_year_round'] == 1].copy()
+    not_available_year_round = data1[data1['availability_year_round'] == 0].copy()
     
     # Count the number of sources in each group
     available_count = available_year_round.shape[0]
@@ -187,14 +180,13 @@ def visualize_abstraction_bar_chart():
     data1 = fetch_data("raw_watersource")
     
     # Create the bar chart
-    fig, ax = plt.subplots(figsize=(10, 6))
-    ax.barh(data1['RawWaterSource_name'], data1['total_abstraction'], color='blue')
-    
-    ax.set_xlabel('Total Abstraction (m³)')
-    ax.set_ylabel('Raw Water Source Name')
-    ax.set_title('Total Abstraction by Raw Water Source')
-    
-    st.pyplot(fig)
+    def draw(fig, ax):
+        ax.barh(data1['RawWaterSource_name'], data1['total_abstraction'], color='blue')
+
+        ax.set_xlabel('Total Abstraction (m³)')
+        ax.set_ylabel('Raw Water Source Name')
+        ax.set_title('Total Abstraction by Raw Water Source')
+    render_figure(draw, chart_id='visualize_abstraction_bar_chart/1', figsize=(10, 6))
 
     st.write("""
     - **Water Sources and Abstraction Volumes**:
@@ -221,30 +213,23 @@ def visualize_abstraction_bar_chart():
 def visualize_grouped_abstraction():
     st.subheader("Total Abstraction by Availability Year Round and Unavailable")
     
-    # Fetch data
-    data1 = fetch_data("raw_watersource")
-    
-    # Group by availability and sum total abstraction
-    grouped = data1.groupby('availability_year_round').agg(
-        total_abstraction_sum=('total_abstraction', 'sum'),
-        water_sources=('RawWaterSource_name', lambda x: ', '.join(x))
-    ).reset_index()
+    # Total abstraction per availability, from the rollup
+    grouped = get_rollup("raw_watersource_by_availability").reset_index()
     
     # Plotting the grouped data
-    fig, ax = plt.subplots(figsize=(8, 5))
-    bars = ax.bar(grouped['availability_year_round'], grouped['total_abstraction_sum'], color=['red', 'green'])
-    
-    ax.set_xticks(grouped['availability_year_round'])
-    ax.set_xticklabels(['Not Available Year Round', 'Available Year Round'])
-    ax.set_ylabel('Total Abstraction (m³)')
-    ax.set_title('Total Abstraction by Availability Year Round')
-    
-    # Adding data labels on the bars
-    for bar in bars:
-        yval = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2, yval + 100, round(yval, 1), ha='center', va='bottom')
-    
-    st.pyplot(fig)
+    def draw(fig, ax):
+        bars = ax.bar(grouped['availability_year_round'], grouped['total_abstraction_sum'], color=['red', 'green'])
+
+        ax.set_xticks(grouped['availability_year_round'])
+        ax.set_xticklabels(['Not Available Year Round', 'Available Year Round'])
+        ax.set_ylabel('Total Abstraction (m³)')
+        ax.set_title('Total Abstraction by Availability Year Round')
+
+        # Adding data labels on the bars
+        for bar in bars:
+            yval = bar.get_height()
+            ax.text(bar.get_x() + bar.get_width()/2, yval + 100, round(yval, 1), ha='center', va='bottom')
+    render_figure(draw, chart_id='visualize_grouped_abstraction/1', figsize=(8, 5))
 
     st.write("""
     - **Bars**: There are two bars in the chart.
@@ -267,21 +252,22 @@ def visualize_total_abstraction_capacity():
     data1 = data1.sort_values(by='total_abstraction', ascending=False)
     
     # Plot line chart
-    plt.figure(figsize=(12, 6))
-    sns.lineplot(
-        x='RawWaterSource_name', 
-        y='total_abstraction', 
-        data=data1, 
-        marker='o',
-        linewidth=2.5,
-        color='blue'
-    )
-    plt.title('Total Abstraction Capacity Trend', fontsize=16, fontweight='bold')
-    plt.xlabel('Raw Water Source', fontsize=12)
-    plt.ylabel('Total Abstraction (in cubic meters)', fontsize=12)
-    plt.xticks(rotation=45, fontsize=10, ha='right')
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
-    st.pyplot(plt)
+    def draw(fig, ax):
+        sns.lineplot(
+            x='RawWaterSource_name',
+            y='total_abstraction',
+            data=data1,
+            marker='o',
+            linewidth=2.5,
+            color='blue',
+            ax=ax
+        )
+        ax.set_title('Total Abstraction Capacity Trend', fontsize=16, fontweight='bold')
+        ax.set_xlabel('Raw Water Source', fontsize=12)
+        ax.set_ylabel('Total Abstraction (in cubic meters)', fontsize=12)
+        plt.setp(ax.get_xticklabels(), rotation=45, fontsize=10, ha='right')
+        ax.grid(axis='y', linestyle='--', alpha=0.7)
+    render_figure(draw, chart_id='visualize_total_abstraction_capacity/1', figsize=(12, 6))
 
     st.write("""
     - **Bars**: Each bar represents the total abstraction capacity of a water source, with varying heights indicating different capacities.
@@ -298,9 +284,7 @@ The graph could help policymakers or engineers prioritize resource allocation, i
 
 # Fetch data function for human resources analysis
 def fetch_data_for_human_resources():
-    data1 = fetch_data("raw_watersource")  # Fetch raw water source data
-    data2 = fetch_data("human_resources")  # Fetch human resources data
-    return pd.merge(data1, data2, on='idRawWaterSource')
+    return get_frame("source_staff")  # raw water source merged with human resources
 
 # Streamlit app for human resources analysis
 def human_resources_analysis():
@@ -310,14 +294,14 @@ def human_resources_analysis():
     # Fetch and merge data
     df_merged12 = fetch_data_for_human_resources()
     
-    fig, ax = plt.subplots(figsize=(8, 8))
-    df_merged12.groupby('RawWaterSource_name')['total_staff'].sum().plot.pie(
-        autopct='%1.1f%%', startangle=90, ax=ax, legend=False
-    )
-    ax.set_ylabel('')  # Remove y-axis label for cleaner layout
-    ax.set_title('Proportion of Total Staff by Raw Water Source')
-    plt.tight_layout()
-    st.pyplot(fig)
+    def draw(fig, ax):
+        rollup_by_source("human_resources_by_source")['total_staff_sum'].plot.pie(
+            autopct='%1.1f%%', startangle=90, ax=ax, legend=False
+        )
+        ax.set_ylabel('')  # Remove y-axis label for cleaner layout
+        ax.set_title('Proportion of Total Staff by Raw Water Source')
+        fig.tight_layout()
+    render_figure(draw, chart_id='human_resources_analysis/1', figsize=(8, 8))
     st.write("""
     - **Distribution**: The chart shows a wide range of staff numbers across different water sources.
     - **High Staff Numbers**: Mekong River, Tonle Sap Lake, and Bassac River have the highest staff numbers.
@@ -327,33 +311,33 @@ def human_resources_analysis():
 
     # Human Resources - Comparison of Total Staff, Staff per 1000 Subscribers, and Training Sessions
     st.subheader("Comparison of Total Staff, Staff per 1000 Subscribers, and Training Sessions")
-    fig, ax = plt.subplots(figsize=(16, 8))
-    bar_width = 0.25  # Width of the bars
-    index = np.arange(len(df_merged12['RawWaterSource_name']))  # The x locations for the groups
-    
-    # Create bars for each category
-    bars1 = ax.bar(index, df_merged12['total_staff'], bar_width, label='Total Staff', color='skyblue')
-    bars2 = ax.bar(index + bar_width, df_merged12['staff_per_1000_subscribers'], bar_width, label='Staff per 1000 Subscribers', color='lightgreen')
-    bars3 = ax.bar(index + 2 * bar_width, df_merged12['training_sessions'], bar_width, label='Training Sessions', color='salmon')
-
-    # Set labels and title
-    ax.set_xlabel('Water Resouces')
-    ax.set_ylabel('Count')
-    ax.set_title('Water Resources Overview')
-    ax.set_xticks(index + bar_width)
-    ax.set_xticklabels(df_merged12['RawWaterSource_name'], rotation=45, ha='right')
-    
-    # Add legend
-    ax.legend()
-
-    # Add data labels
-    for bars in [bars1, bars2, bars3]:
-        for bar in bars:
-            yval = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width() / 2, yval, int(yval), ha='center', va='bottom')
-    
-    plt.tight_layout()
-    st.pyplot(fig)
+    def draw(fig, ax):
+        bar_width = 0.25  # Width of the bars
+        index = np.arange(len(df_merged12['RawWaterSource_name']))  # The x locations for the groups
+
+        # Create bars for each category
+        bars1 = ax.bar(index, df_merged12['total_staff'], bar_width, label='Total Staff', color='skyblue')
+        bars2 = ax.bar(index + bar_width, df_merged12['staff_per_1000_subscribers'], bar_width, label='Staff per 1000 Subscribers', color='lightgreen')
+        bars3 = ax.bar(index + 2 * bar_width, df_merged12['training_sessions'], bar_width, label='Training Sessions', color='salmon')
+
+        # Set labels and title
+        ax.set_xlabel('Water Resouces')
+        ax.set_ylabel('Count')
+        ax.set_title('Water Resources Overview')
+        ax.set_xticks(index + bar_width)
+        ax.set_xticklabels(df_merged12['RawWaterSource_name'], rotation=45, ha='right')
+
+        # Add legend
+        ax.legend()
+
+        # Add data labels
+        for bars in [bars1, bars2, bars3]:
+            for bar in bars:
+                yval = bar.get_height()
+                ax.text(bar.get_x() + bar.get_width() / 2, yval, int(yval), ha='center', va='bottom')
+
+        fig.tight_layout()
+    render_figure(draw, chart_id='human_resources_analysis/2', figsize=(16, 8))
 
     st.write("""
     - **Distribution**: The chart shows a wide range of staff numbers, staff per 1000 subscribers, and training sessions across different water resources.
@@ -391,21 +375,21 @@ def human_resources_analysis():
     - **Note**: Staff per 1000 Subscribers is calculated as (total staff / subscribers) * 1000.
     """)
 
-    fig, ax = plt.subplots(figsize=(12, 6))
-    sns.lineplot(
-        x='RawWaterSource_name', 
-        y='training_sessions', 
-        marker='o', 
-        data=df_merged12, 
-        color='green', 
-        ax=ax
-    )
-    ax.set_title('Training Sessions Trend per Raw Water Source')
-    ax.set_xlabel('Raw Water Source Name')
-    ax.set_ylabel('Training Sessions')
-    plt.xticks(rotation=90)
-    plt.tight_layout()
-    st.pyplot(fig)
+    def draw(fig, ax):
+        sns.lineplot(
+            x='RawWaterSource_name',
+            y='training_sessions',
+            marker='o',
+            data=df_merged12,
+            color='green',
+            ax=ax
+        )
+        ax.set_title('Training Sessions Trend per Raw Water Source')
+        ax.set_xlabel('Raw Water Source Name')
+        ax.set_ylabel('Training Sessions')
+        ax.tick_params(axis='x', labelrotation=90)
+        fig.tight_layout()
+    render_figure(draw, chart_id='human_resources_analysis/3', figsize=(12, 6))
 
 
 
@@ -430,16 +414,15 @@ def human_resources_analysis():
     # Function for Treatment Plant visualizations
 def treatment_plant_visualizations():
 
-    data1 = fetch_data("raw_watersource")
     data3 = fetch_data("treatment_plant")
-    # Merge the data
-    df_merged13 = pd.merge(data1, data3, on='idRawWaterSource')
+    # Merged raw water source and treatment plant data
+    df_merged13 = get_frame("source_plant")
 
-    fig, ax = plt.subplots(figsize=(8, 8))
-    df_pie = df_merged13.groupby('RawWaterSource_name')['treatment_losses'].sum()
-    ax.pie(df_pie, labels=df_pie.index, autopct='%1.1f%%', startangle=140, colors=sns.color_palette("pastel"))
-    ax.set_title('Proportion of Treatment Losses by Plant')
-    st.pyplot(fig)
+    def draw(fig, ax):
+        df_pie = rollup_by_source("treatment_plant_by_source")['treatment_losses_sum']
+        ax.pie(df_pie, labels=df_pie.index, autopct='%1.1f%%', startangle=140, colors=sns.color_palette("pastel"))
+        ax.set_title('Proportion of Treatment Losses by Plant')
+    render_figure(draw, chart_id='treatment_plant_visualizations/1', figsize=(8, 8))
 
 
     st.subheader("Key Insights")
@@ -458,15 +441,15 @@ def treatment_plant_visualizations():
 
     # Scatter Plot: Chemical Consumption vs Treatment Losses
     st.subheader("Chemical Consumption vs Treatment Losses")
-    fig, axs = plt.subplots(2, 2, figsize=(12, 8))
     chemicals = ['pac_consumption', 'alum_consumption', 'chlorine_consumption', 'lime_consumption']
-    for i, col in enumerate(chemicals):
-        sns.scatterplot(x=data3[col], y=data3['treatment_losses'], ax=axs[i//2, i%2])
-        axs[i//2, i%2].set_title(f'{col} vs Treatment Losses')
-        axs[i//2, i%2].set_xlabel(col)
-        axs[i//2, i%2].set_ylabel('Treatment Losses')
-    plt.tight_layout()
-    st.pyplot(fig)
+    def draw(fig, axs):
+        for i, col in enumerate(chemicals):
+            sns.scatterplot(x=data3[col], y=data3['treatment_losses'], ax=axs[i//2, i%2])
+            axs[i//2, i%2].set_title(f'{col} vs Treatment Losses')
+            axs[i//2, i%2].set_xlabel(col)
+            axs[i//2, i%2].set_ylabel('Treatment Losses')
+        fig.tight_layout()
+    render_figure(draw, chart_id='treatment_plant_visualizations/2', figsize=(12, 8), nrows=2, ncols=2)
 
     st.subheader("Interpretation")
 
@@ -501,14 +484,14 @@ def treatment_plant_visualizations():
 
     # Scatter Plot: Chemical Consumption vs Production Capacity
     st.subheader("Chemical Consumption vs Production Capacity")
-    fig, axs = plt.subplots(2, 2, figsize=(12, 8))
-    for i, col in enumerate(chemicals):
-        sns.scatterplot(x=data3[col], y=data3['production_capacity'], ax=axs[i//2, i%2])
-        axs[i//2, i%2].set_title(f'{col} vs Production Capacity')
-        axs[i//2, i%2].set_xlabel(col)
-        axs[i//2, i%2].set_ylabel('Production Capacity')
-    plt.tight_layout()
-    st.pyplot(fig)
+    def draw(fig, axs):
+        for i, col in enumerate(chemicals):
+            sns.scatterplot(x=data3[col], y=data3['production_capacity'], ax=axs[i//2, i%2])
+            axs[i//2, i%2].set_title(f'{col} vs Production Capacity')
+            axs[i//2, i%2].set_xlabel(col)
+            axs[i//2, i%2].set_ylabel('Production Capacity')
+        fig.tight_layout()
+    render_figure(draw, chart_id='treatment_plant_visualizations/3', figsize=(12, 8), nrows=2, ncols=2)
 
     st.subheader("Interpretation and Key Insights")
 
@@ -518,19 +501,19 @@ def treatment_plant_visualizations():
 
     # Fuel and Electricity Consumption vs Treatment Losses
     st.subheader("Fuel and Electricity Consumption vs Treatment Losses")
-    fig, axs = plt.subplots(1, 2, figsize=(12, 6))
-    sns.scatterplot(x=data3['fuel_consumption'], y=data3['treatment_losses'], ax=axs[0])
-    axs[0].set_title('Fuel Consumption vs Treatment Losses')
-    axs[0].set_xlabel('Fuel Consumption')
-    axs[0].set_ylabel('Treatment Losses')
+    def draw(fig, axs):
+        sns.scatterplot(x=data3['fuel_consumption'], y=data3['treatment_losses'], ax=axs[0])
+        axs[0].set_title('Fuel Consumption vs Treatment Losses')
+        axs[0].set_xlabel('Fuel Consumption')
+        axs[0].set_ylabel('Treatment Losses')
 
-    sns.scatterplot(x=data3['electricity_consumption'], y=data3['treatment_losses'], ax=axs[1])
-    axs[1].set_title('Electricity Consumption vs Treatment Losses')
-    axs[1].set_xlabel('Electricity Consumption')
-    axs[1].set_ylabel('Treatment Losses')
+        sns.scatterplot(x=data3['electricity_consumption'], y=data3['treatment_losses'], ax=axs[1])
+        axs[1].set_title('Electricity Consumption vs Treatment Losses')
+        axs[1].set_xlabel('Electricity Consumption')
+        axs[1].set_ylabel('Treatment Losses')
 
-    plt.tight_layout()
-    st.pyplot(fig)
+        fig.tight_layout()
+    render_figure(draw, chart_id='treatment_plant_visualizations/4', figsize=(12, 6), nrows=1, ncols=2)
 
     st.subheader("Interpretation and Key Insights")
 
@@ -540,19 +523,19 @@ def treatment_plant_visualizations():
 
     # Fuel and Electricity Consumption vs Production Capacity
     st.subheader("Fuel and Electricity Consumption vs Production Capacity")
-    fig, axs = plt.subplots(1, 2, figsize=(12, 6))
-    sns.scatterplot(x=data3['fuel_consumption'], y=data3['production_capacity'], ax=axs[0])
-    axs[0].set_title('Fuel Consumption vs Production Capacity')
-    axs[0].set_xlabel('Fuel Consumption')
-    axs[0].set_ylabel('Production Capacity')
+    def draw(fig, axs):
+        sns.scatterplot(x=data3['fuel_consumption'], y=data3['production_capacity'], ax=axs[0])
+        axs[0].set_title('Fuel Consumption vs Production Capacity')
+        axs[0].set_xlabel('Fuel Consumption')
+        axs[0].set_ylabel('Production Capacity')
 
-    sns.scatterplot(x=data3['electricity_consumption'], y=data3['production_capacity'], ax=axs[1])
-    axs[1].set_title('Electricity Consumption vs Production Capacity')
-    axs[1].set_xlabel('Electricity Consumption')
-    axs[1].set_ylabel('Production Capacity')
+        sns.scatterplot(x=data3['electricity_consumption'], y=data3['production_capacity'], ax=axs[1])
+        axs[1].set_title('Electricity Consumption vs Production Capacity')
+        axs[1].set_xlabel('Electricity Consumption')
+        axs[1].set_ylabel('Production Capacity')
 
-    plt.tight_layout()
-    st.pyplot(fig)
+        fig.tight_layout()
+    render_figure(draw, chart_id='treatment_plant_visualizations/5', figsize=(12, 6), nrows=1, ncols=2)
 
     st.subheader("Interpretation and Key Insights")
 
@@ -565,26 +548,26 @@ def treatment_plant_visualizations():
     correlation = data3['fuel_consumption'].corr(data3['electricity_consumption'])
     st.write(f"Correlation between Fuel Consumption and Electricity Consumption: {correlation:.2f}")
 
-    fig, ax = plt.subplots(figsize=(8, 6))
-    sns.scatterplot(x=data3['fuel_consumption'], y=data3['electricity_consumption'], s=100, ax=ax)
-    ax.set_title('Fuel Consumption vs. Electricity Consumption')
-    ax.set_xlabel('Fuel Consumption')
-    ax.set_ylabel('Electricity Consumption')
-    ax.text(275, 5100, f'Correlation: {correlation:.2f}', fontsize=12)
-    st.pyplot(fig)
+    def draw(fig, ax):
+        sns.scatterplot(x=data3['fuel_consumption'], y=data3['electricity_consumption'], s=100, ax=ax)
+        ax.set_title('Fuel Consumption vs. Electricity Consumption')
+        ax.set_xlabel('Fuel Consumption')
+        ax.set_ylabel('Electricity Consumption')
+        ax.text(275, 5100, f'Correlation: {correlation:.2f}', fontsize=12)
+    render_figure(draw, chart_id='treatment_plant_visualizations/6', figsize=(8, 6))
     st.write("""
     Correlation between Fuel Consumption and Electricity Consumption: The graph shows a nearly perfect diagonal line from the bottom left to the top right, indicating a strong positive correlation between fuel consumption and electricity consumption. The correlation coefficient is labeled as 1.00, suggesting a perfect positive correlation. This means that as fuel consumption increases, electricity consumption also increases proportionally. Key Insights: Strong Positive Correlation: The perfect correlation (1.00) indicates that fuel and electricity consumption are closely linked. Any increase in fuel consumption is directly associated with an increase in electricity consumption. Efficiency Considerations: The strong correlation might suggest that both fuel and electricity are being consumed in tandem, possibly due to the operational requirements of the treatment plants. Understanding this relationship can help in optimizing the use of both resources to improve overall efficiency.
     """)
 
-    fig, ax = plt.subplots(figsize=(12, 8))
-    df_stacked = df_merged13.set_index('RawWaterSource_name')[chemicals]
-    df_stacked.plot(kind='bar', stacked=True, ax=ax, colormap='viridis')
-    ax.set_title('Chemical Consumption Across Treatment Plants (Stacked)')
-    ax.set_xlabel('Treatment Plant of Water Resources')
-    ax.set_ylabel('Consumption (in units)')
-    plt.xticks(rotation=90)
-    plt.tight_layout()
-    st.pyplot(fig)
+    def draw(fig, ax):
+        df_stacked = df_merged13.set_index('RawWaterSource_name')[chemicals]
+        df_stacked.plot(kind='bar', stacked=True, ax=ax, colormap='viridis')
+        ax.set_title('Chemical Consumption Across Treatment Plants (Stacked)')
+        ax.set_xlabel('Treatment Plant of Water Resources')
+        ax.set_ylabel('Consumption (in units)')
+        ax.tick_params(axis='x', labelrotation=90)
+        fig.tight_layout()
+    render_figure(draw, chart_id='treatment_plant_visualizations/7', figsize=(12, 8))
 
 
     st.write("""
@@ -593,27 +576,24 @@ def treatment_plant_visualizations():
 
 def water_quality_analysis():
 
-    data1 = fetch_data("raw_watersource")
-    data3 = fetch_data("treatment_plant")
     data4 = fetch_data("water_quality")
-    df_merged13 = pd.merge(data1, data3, on='idRawWaterSource')
-    # Merge data for analysis
-    df_merged134 = pd.merge(data4, df_merged13, on='idTreatmentPlant')
+    # Merged data for analysis
+    df_merged134 = get_frame("plant_quality")
 
     st.title("Water Quality Analysis")
 
     # Section 2: Treatment Losses vs Water Quality Parameters
     st.subheader("Treatment Losses vs Water Quality Parameters")
     
-    plt.figure(figsize=(12, 6))
-    sns.scatterplot(x='turbidity', y='treatment_losses', data=df_merged134, label='Turbidity', color='r')
-    sns.scatterplot(x='ph_level', y='treatment_losses', data=df_merged134, label='pH Level', color='g')
-    sns.scatterplot(x='total_dissolved_solids', y='treatment_losses', data=df_merged134, label='Total Dissolved Solids', color='b')
-    plt.title('Treatment Losses vs Water Quality Parameters')
-    plt.xlabel('Water Quality Parameters')
-    plt.ylabel('Treatment Losses (%)')
-    plt.legend()
-    st.pyplot(plt)
+    def draw(fig, ax):
+        sns.scatterplot(x='turbidity', y='treatment_losses', data=df_merged134, label='Turbidity', color='r', ax=ax)
+        sns.scatterplot(x='ph_level', y='treatment_losses', data=df_merged134, label='pH Level', color='g', ax=ax)
+        sns.scatterplot(x='total_dissolved_solids', y='treatment_losses', data=df_merged134, label='Total Dissolved Solids', color='b', ax=ax)
+        ax.set_title('Treatment Losses vs Water Quality Parameters')
+        ax.set_xlabel('Water Quality Parameters')
+        ax.set_ylabel('Treatment Losses (%)')
+        ax.legend()
+    render_figure(draw, chart_id='water_quality_analysis/1', figsize=(12, 6))
 
     # Section 3: Average Levels of Key Water Quality Parameters
     st.subheader("Average Levels of Key Water Quality Parameters")
@@ -621,40 +601,42 @@ def water_quality_analysis():
     quality_params = ['ph_level', 'arsenic_level', 'total_dissolved_solids', 'lead_level', 'nitrate_level']
     data4_melted = data4.melt(id_vars=['code'], value_vars=quality_params, var_name='Parameter', value_name='Level')
 
-    plt.figure(figsize=(14, 10))
-    sns.boxplot(x='Parameter', y='Level', data=data4_melted)
-    plt.title('Average Levels of Key Water Quality Parameters')
-    plt.xlabel('Water Quality Parameter')
-    plt.ylabel('Level')
-    plt.xticks(rotation=45)
-    st.pyplot(plt)
+    def draw(fig, ax):
+        sns.boxplot(x='Parameter', y='Level', data=data4_melted, ax=ax)
+        ax.set_title('Average Levels of Key Water Quality Parameters')
+        ax.set_xlabel('Water Quality Parameter')
+        ax.set_ylabel('Level')
+        ax.tick_params(axis='x', labelrotation=45)
+    render_figure(draw, chart_id='water_quality_analysis/2', figsize=(14, 10))
 
     # Section 4: Correlation Heatmap
     st.subheader("Correlation Heatmap of Treatment and Water Quality Data")
     
-    plt.figure(figsize=(12, 8))
-    numeric_df = data4.select_dtypes(include=[np.number])
-    correlation_matrix = numeric_df.corr()
-    sns.heatmap(correlation_matrix, annot=False, cmap='coolwarm', linewidths=0.5)
-    plt.title('Correlation Heatmap of Treatment and Water Quality Data')
-    st.pyplot(plt)
+    # Read off the incrementally maintained moments instead of data4.corr()
+    moments = get_moments_store("water_quality").summary()
+    correlation_matrix = moments.correlation()
+    def draw(fig, ax):
+        sns.heatmap(correlation_matrix, annot=False, cmap='coolwarm', linewidths=0.5, ax=ax)
+        ax.set_title('Correlation Heatmap of Treatment and Water Quality Data')
+    # Rows inserted since the last snapshot change the matrix too
+    render_figure(draw, chart_id='water_quality_analysis/3', params=(moments.rows,), figsize=(12, 8))
+
+    # Section 5: Drinking-Water Compliance
+    st.subheader("Drinking-Water Compliance by Treatment Plant")
+    compliance = get_compliance_index()
+    parameters = st.multiselect("Parameters", PARAMETERS, default=['arsenic_level', 'lead_level', 'nitrate_level'])
+    st.metric("Compliant samples", f"{compliance.compliance_rate(parameters or None):.1%}")
+    st.dataframe(compliance.plants_exceeding(parameters or None))
+    with st.expander("Limits"):
+        st.dataframe(threshold_table(), hide_index=True)
 
 def commercial_analysis():
 
-    data1 = fetch_data("raw_watersource")
-    data2 = fetch_data("human_resources")
-    data3 = fetch_data("treatment_plant")
-    data4 = fetch_data("water_quality")
-    data5 = fetch_data("commercial")
-    data6 = fetch_data("financial")
-
-    df_merged13 = pd.merge(data1, data3, on='idRawWaterSource')
-
-    # Merge data for analysis
-    df_merged135 = pd.merge(data5, df_merged13, on='idTreatmentPlant')
-    df_merged135.drop(columns=['code_x', 'code_y'], inplace=True)
-    # Merge DataFrames if needed (example merging on idTreatmentPlant)
-    df_merged1356 = pd.merge(df_merged135, data6, on='idCommercial')
+    # Merged data for analysis
+    df_merged135 = get_frame("commercial_plant")
+    df_merged1356 = get_kpi_frame()  # KPI columns computed from the raw inputs (see scripts/kpi.py)
+    # Per water source aggregates of the commercial table
+    commercial_by_source = rollup_by_source("commercial_by_plant")
 
     st.title("Commercial Analysis")
 
@@ -675,188 +657,171 @@ def commercial_analysis():
 
     # Scatter plot with trendline
     st.subheader("Water Production vs. Water Sold by Commercial Entities")
-    plt.figure(figsize=(17, 6))
+    def draw(fig, ax):
+        # Scatter plot to show relationship
+        sns.scatterplot(data=df_merged1356, x='Water_Production', y='water_sold', color='blue', ax=ax)
 
-    # Scatter plot to show relationship
-    sns.scatterplot(data=df_merged1356, x='Water_Production', y='water_sold', color='blue')
+        # Adding a regression line to show the trend
+        sns.regplot(data=df_merged1356, x='Water_Production', y='water_sold', scatter=False, color='orange', ax=ax)
 
-    # Adding a regression line to show the trend
-    sns.regplot(data=df_merged1356, x='Water_Production', y='water_sold', scatter=False, color='orange')
-
-    plt.title('Water Production vs. Water Sold by Commercial Entities')
-    plt.xlabel('Water Production (m³)')
-    plt.ylabel('Water Sold (m³)')
-    st.pyplot(plt)
+        ax.set_title('Water Production vs. Water Sold by Commercial Entities')
+        ax.set_xlabel('Water Production (m³)')
+        ax.set_ylabel('Water Sold (m³)')
+    render_figure(draw, chart_id='commercial_analysis/1', figsize=(17, 6))
 
     # Violin plot
-    st.subheader("Average Daily Consumption per Capita by Commercial Entities")
-    plt.figure(figsize=(17, 6))
-
-    # Create a violin plot to visualize the distribution
-    sns.violinplot(data=df_merged1356, x='RawWaterSource_name', y='average_consumption_per_capita', palette='viridis')
-
-    # Adding labels and title
-    plt.title('Average Daily Consumption per Capita by Commercial Entities')
-    plt.xlabel('Commercial Entities of Water Resources')
-    plt.ylabel('Average Consumption per Capita (m³)')
-    plt.xticks(rotation=45)
-    st.pyplot(plt)
+    st.subheader("Average Consumption per Capita by Commercial Entities")
+    def draw(fig, ax):
+        # Create a violin plot to visualize the distribution
+        sns.violinplot(data=df_merged1356, x='RawWaterSource_name', y='average_consumption_per_capita', palette='viridis', ax=ax)
+
+        # Adding labels and title
+        ax.set_title('Average Consumption per Capita by Commercial Entities')
+        ax.set_xlabel('Commercial Entities of Water Resources')
+        ax.set_ylabel('Average Consumption per Capita (m³)')
+        ax.tick_params(axis='x', labelrotation=45)
+    render_figure(draw, chart_id='commercial_analysis/2', figsize=(17, 6))
 
     # Section 4: Water Losses vs. Non-Revenue Water
     st.subheader("Water Losses vs. Non-Revenue Water")
-    plt.figure(figsize=(20,16))
-    ax=df_merged1356.set_index('RawWaterSource_name')[['water_losses', 'non_revenue_water']].plot(kind='bar', stacked=True)
-    plt.title('Water Losses vs. Non-Revenue Water')
-    plt.xlabel('Commercial Entities of Water Resources')
-    plt.ylabel('Water Volume')
-    plt.xticks(rotation=90)  # Rotate x-axis labels to 90 degrees
-    # Adjust x-axis tick labels font size
-    ax.tick_params(axis='x', labelsize=8)
-    plt.tight_layout()
-    st.pyplot(plt)
+    def draw(fig, ax):
+        df_merged1356.set_index('RawWaterSource_name')[['water_losses', 'non_revenue_water']].plot(kind='bar', stacked=True, ax=ax)
+        ax.set_title('Water Losses vs. Non-Revenue Water')
+        ax.set_xlabel('Commercial Entities of Water Resources')
+        ax.set_ylabel('Water Volume (in m³)')
+        # Rotate x-axis labels to 90 degrees and adjust their font size
+        ax.tick_params(axis='x', labelrotation=90, labelsize=8)
+        fig.tight_layout()
+    render_figure(draw, chart_id='commercial_analysis/3', figsize=(20, 16))
 
     # Stacked bar chart
     st.subheader("Financial Overview: Cash from Water Sales and Other Cash")
-    plt.figure(figsize=(20, 6))
-
-    # Plotting a stacked bar chart
-    df_merged1356.set_index('RawWaterSource_name')[['cash_from_water_sales', 'other_cash']].plot(kind='bar', stacked=True, color=['green', 'purple'])
-
-    plt.title('Financial Overview: Cash from Water Sales and Other Cash')
-    plt.xlabel('Commercial Entities of Water Resources')
-    plt.ylabel('Cash Amount in ($)')
-    plt.xticks(rotation=80,fontsize=5)
-    plt.legend(["Cash from Water Sales", "Other Cash"])
+    def draw(fig, ax):
+        # Plotting a stacked bar chart
+        df_merged1356.set_index('RawWaterSource_name')[['cash_from_water_sales', 'other_cash']].plot(kind='bar', stacked=True, color=['green', 'purple'], ax=ax)
 
-    st.pyplot(plt)
+        ax.set_title('Financial Overview: Cash from Water Sales and Other Cash')
+        ax.set_xlabel('Commercial Entities of Water Resources')
+        ax.set_ylabel('Cash Amount in ($)')
+        ax.tick_params(axis='x', labelrotation=80, labelsize=5)
+        ax.legend(["Cash from Water Sales", "Other Cash"])
+    render_figure(draw, chart_id='commercial_analysis/4', figsize=(20, 6))
 
     # Section 6: Tariff Comparison
     st.subheader("Tariff Comparison by Commercial Entities")
-    plt.figure(figsize=(20, 7))
     df_tariff = df_merged1356[['RawWaterSource_name', 'residential_tariff', 'commercial_tariff', 'government_tariff']].set_index('RawWaterSource_name')
-    ax = df_tariff.plot(kind='bar')
-    plt.title('Tariff Comparison by Commercial Entities', fontsize=14)
-    plt.ylabel('Tariff Amount', fontsize=12)
-    plt.xticks(rotation=90)  # Rotate x-axis labels to 90 degrees
+    def draw(fig, ax):
+        df_tariff.plot(kind='bar', ax=ax)
+        ax.set_title('Tariff Comparison by Commercial Entities', fontsize=14)
+        ax.set_ylabel('Tariff Amount', fontsize=12)
 
-    # Adjust x-axis tick labels font size
-    ax.tick_params(axis='x', labelsize=8)
+        # Rotate x-axis labels to 90 degrees and adjust their font size
+        ax.tick_params(axis='x', labelrotation=90, labelsize=8)
 
-    plt.tight_layout()
-    st.pyplot(plt)
+        fig.tight_layout()
+    render_figure(draw, chart_id='commercial_analysis/5', figsize=(20, 7))
   
 
 
     # Section 8: Service Coverage Area (Stacked Bar Chart)
     st.subheader("Service Coverage Area (License and Network)")
 
-    # Melting the dataframe for easier plotting
+    # Mean coverage per water source, from the commercial rollup
     coverage_areas = ['service_coverage_license_area', 'service_coverage_network_area']
-    data5_coverage_melted = df_merged1356.melt(id_vars=['RawWaterSource_name'], value_vars=coverage_areas, var_name='CoverageType', value_name='Coverage')
-
-    # Grouping by RawWaterSource_name and CoverageType to avoid duplicates and get the mean coverage
-    data_grouped = data5_coverage_melted.groupby(['RawWaterSource_name', 'CoverageType']).agg({'Coverage': 'mean'}).reset_index()
-
-    # Pivoting the grouped data for the stacked bar chart
-    data_pivoted = data_grouped.pivot(index='RawWaterSource_name', columns='CoverageType', values='Coverage')
+    data_pivoted = commercial_by_source[[f'{area}_mean' for area in coverage_areas]]
+    data_pivoted.columns = pd.Index(coverage_areas, name='CoverageType')
 
     # Plotting a stacked bar chart
-    plt.figure(figsize=(12, 8))
-    data_pivoted.plot(kind='bar', stacked=True, color=['skyblue', 'orange'], width=0.8)
+    def draw(fig, ax):
+        data_pivoted.plot(kind='bar', stacked=True, color=['skyblue', 'orange'], width=0.8, ax=ax)
 
-    # Title and labels
-    plt.title('Service Coverage Area (License and Network)', fontsize=16)
-    plt.xlabel('Commercial Entity of Water Resources', fontsize=12)
-    plt.ylabel('Coverage Area (in percentage)', fontsize=12)
+        # Title and labels
+        ax.set_title('Service Coverage Area (License and Network)', fontsize=16)
+        ax.set_xlabel('Commercial Entity of Water Resources', fontsize=12)
+        ax.set_ylabel('Coverage Area (in percentage)', fontsize=12)
 
-    # Adjusting the x-axis tick labels font size
-    plt.xticks(rotation=90, fontsize=10)  # Rotate labels for better visibility
+        # Adjusting the x-axis tick labels font size
+        ax.tick_params(axis='x', labelrotation=90, labelsize=10)  # Rotate labels for better visibility
 
-    # Adjusting the legend font size
-    plt.legend(title='Coverage Type', fontsize=10)
+        # Adjusting the legend font size
+        ax.legend(title='Coverage Type', fontsize=10)
 
-    # Ensuring the layout is tight to avoid overlap
-    plt.tight_layout()
+        # Ensuring the layout is tight to avoid overlap
+        fig.tight_layout()
 
     # Display the plot in Streamlit
-    st.pyplot(plt)
+    render_figure(draw, chart_id='commercial_analysis/6', figsize=(12, 8))
 
     # Section 9: Total Water Production and Water Sold (Stacked Bar Chart)
     st.subheader("Total Water Production and Water Sold")
 
-    # Melting the dataframe to reshape for easier plotting
+    # Total volumes per water source, from the commercial rollup
     water_metrics = ['Water_Production', 'water_sold']
-    data5_water_melted = df_merged1356.melt(id_vars=['RawWaterSource_name'], value_vars=water_metrics, var_name='WaterMetric', value_name='Volume')
-
-    # Grouping by RawWaterSource_name and WaterMetric to aggregate values
-    data_grouped = data5_water_melted.groupby(['RawWaterSource_name', 'WaterMetric']).agg({'Volume': 'sum'}).reset_index()
-
-    # Pivoting the grouped data for the stacked bar chart
-    data_pivoted = data_grouped.pivot(index='RawWaterSource_name', columns='WaterMetric', values='Volume')
+    data_pivoted = commercial_by_source[[f'{metric}_sum' for metric in water_metrics]]
+    data_pivoted.columns = pd.Index(water_metrics, name='WaterMetric')
 
     # Plotting a stacked bar chart
-    plt.figure(figsize=(12, 8))
-    data_pivoted.plot(kind='bar', stacked=True, color=['blue', 'orange'], width=0.8)
+    def draw(fig, ax):
+        data_pivoted.plot(kind='bar', stacked=True, color=['blue', 'orange'], width=0.8, ax=ax)
 
-    # Title and labels
-    plt.title('Total Water Production and Water Sold', fontsize=16)
-    plt.xlabel('Commercial Entity of Water Resources', fontsize=12)
-    plt.ylabel('Volume (in cubic meters)', fontsize=12)
+        # Title and labels
+        ax.set_title('Total Water Production and Water Sold', fontsize=16)
+        ax.set_xlabel('Commercial Entity of Water Resources', fontsize=12)
+        ax.set_ylabel('Volume (in cubic meters)', fontsize=12)
 
-    # Adjusting the x-axis tick labels font size
-    plt.xticks(rotation=90, fontsize=10)  # Rotate labels for better visibility
+        # Adjusting the x-axis tick labels font size
+        ax.tick_params(axis='x', labelrotation=90, labelsize=10)  # Rotate labels for better visibility
 
-    # Adjusting the legend font size
-    plt.legend(title='Water Metric', fontsize=10)
+        # Adjusting the legend font size
+        ax.legend(title='Water Metric', fontsize=10)
 
-    # Ensuring the layout is tight to avoid overlap
-    plt.tight_layout()
+        # Ensuring the layout is tight to avoid overlap
+        fig.tight_layout()
 
     # Display the plot in Streamlit
-    st.pyplot(plt)
+    render_figure(draw, chart_id='commercial_analysis/7', figsize=(12, 8))
 
     # Section 10: Non-Revenue Water (Bar Chart)
     st.subheader("Non-Revenue Water in m³")
 
-    # Grouping by RawWaterSource_name to handle any potential duplicates by summing the non-revenue water values
-    data_grouped = df_merged1356.groupby('RawWaterSource_name')['non_revenue_water'].sum().reset_index()
+    # Computed non-revenue water (see scripts/kpi.py), the one charted in Section 4, totalled per water source
+    data_grouped = df_merged1356.groupby('RawWaterSource_name', as_index=False)['non_revenue_water'].sum()
 
     # Plotting a bar chart for Non-Revenue Water
-    plt.figure(figsize=(10, 6))
-    sns.barplot(x='RawWaterSource_name', y='non_revenue_water', data=data_grouped)
+    def draw(fig, ax):
+        sns.barplot(x='RawWaterSource_name', y='non_revenue_water', data=data_grouped, ax=ax)
 
-    # Adding title and labels
-    plt.title('Non-Revenue Water in m³', fontsize=16)
-    plt.xlabel('Commercial Entity of Water Resources', fontsize=12)
-    plt.ylabel('Non-Revenue Water (in m³)', fontsize=12)
+        # Adding title and labels
+        ax.set_title('Non-Revenue Water in m³', fontsize=16)
+        ax.set_xlabel('Commercial Entity of Water Resources', fontsize=12)
+        ax.set_ylabel('Non-Revenue Water (in m³)', fontsize=12)
 
-    # Adjusting the x-axis tick labels font size
-    plt.xticks(rotation=90, fontsize=10)  # Rotate labels for better visibility
+        # Adjusting the x-axis tick labels font size
+        ax.tick_params(axis='x', labelrotation=90, labelsize=10)  # Rotate labels for better visibility
 
-    # Ensuring the layout is tight to avoid overlap
-    plt.tight_layout()
+        # Ensuring the layout is tight to avoid overlap
+        fig.tight_layout()
 
     # Display the plot in Streamlit
-    st.pyplot(plt)
+    render_figure(draw, chart_id='commercial_analysis/8', figsize=(10, 6))
 
-def plot_financial_data():
-    st.header('Financials Analysis')
+    # Section 11: Totals by License Area Profile (Table)
+    st.subheader("Commercial Totals by License Area Profile")
+    profile_totals = get_rollup("commercial_by_profile")[[
+        'rows', 'population_served_sum', 'Water_Production_sum', 'water_sold_sum',
+        'total_water_connections_sum', 'customer_complaints_sum',
+    ]]
+    st.dataframe(profile_totals.rename(columns={'rows': 'records'}))
 
-    data1 = fetch_data("raw_watersource")
-    data2 = fetch_data("human_resources")
-    data3 = fetch_data("treatment_plant")
-    data4 = fetch_data("water_quality")
-    data5 = fetch_data("commercial")
-    data6 = fetch_data("financial")
+    # Section 12: Entered vs Computed KPIs (Table)
+    st.subheader("Entered vs Computed Commercial KPIs")
+    visualize_kpi_check("commercial")
 
-    df_merged13 = pd.merge(data1, data3, on='idRawWaterSource')
+def plot_financial_data():
+    st.header('Financials Analysis')
 
-    # Merge data for analysis
-    df_merged135 = pd.merge(data5, df_merged13, on='idTreatmentPlant')
-    df_merged135.drop(columns=['code_x', 'code_y'], inplace=True)
-    # Merge DataFrames if needed (example merging on idTreatmentPlant)
-    df_merged1356 = pd.merge(df_merged135, data6, on='idCommercial')
-    df = df_merged1356.copy()
+    # Merged data for analysis, KPI columns computed from the raw inputs (see scripts/kpi.py)
+    df = get_kpi_frame()
 
     # Set the aesthetic style of the plots
     sns.set_style("whitegrid")
@@ -865,97 +830,104 @@ def plot_financial_data():
     st.subheader('Cash Flow from Water Sales for Each Commercial Entity')
     df_cash_flow = df[['RawWaterSource_name', 'cash_from_water_sales']]
     df_cash_flow = df_cash_flow.set_index('RawWaterSource_name')
-    df_cash_flow.plot(kind='bar', stacked=True, figsize=(10, 6), color=['green'])
-    plt.title('Cash Flow from Water Sales for Each Commercial Water Resource')
-    plt.xlabel('Commercial Entity Water Sources')
-    plt.ylabel('Cash from Water Sales ($)')
-    plt.xticks(rotation=90)
-    plt.tight_layout()
-    st.pyplot(plt)
+    def draw(fig, ax):
+        df_cash_flow.plot(kind='bar', stacked=True, color=['green'], ax=ax)
+        ax.set_title('Cash Flow from Water Sales for Each Commercial Water Resource')
+        ax.set_xlabel('Commercial Entity Water Sources')
+        ax.set_ylabel('Cash from Water Sales ($)')
+        ax.tick_params(axis='x', labelrotation=90)
+        fig.tight_layout()
+    render_figure(draw, chart_id='plot_financial_data/1', figsize=(10, 6))
 
     # Amount Billed for Water Sales and Other Services (Stacked Bar Chart)
     st.subheader('Amount Billed for Water Sales and Other Services')
     df_billing = df[['RawWaterSource_name', 'amount_billed_for_water_sales', 'amount_billed_for_other_services']]
     df_billing = df_billing.set_index('RawWaterSource_name')
-    df_billing.plot(kind='bar', stacked=True, figsize=(12, 8), color=['blue', 'orange'])
-    plt.title('Amount Billed for Water Sales and Other Services')
-    plt.xlabel('Commercial Entity of Water Sources')
-    plt.ylabel('Amount ($)')
-    plt.xticks(rotation=90)
-    plt.tight_layout()
-    st.pyplot(plt)
+    def draw(fig, ax):
+        df_billing.plot(kind='bar', stacked=True, color=['blue', 'orange'], ax=ax)
+        ax.set_title('Amount Billed for Water Sales and Other Services')
+        ax.set_xlabel('Commercial Entity of Water Sources')
+        ax.set_ylabel('Amount ($)')
+        ax.tick_params(axis='x', labelrotation=90)
+        fig.tight_layout()
+    render_figure(draw, chart_id='plot_financial_data/2', figsize=(12, 8))
 
     # Accounts Receivable and Bill Collection Ratios (Stacked Bar Chart)
     st.subheader('Accounts Receivable and Bill Collection Ratios')
     df_financial = df[['RawWaterSource_name', 'accounts_receivable', 'bill_collection_ratio']]
     df_financial = df_financial.set_index('RawWaterSource_name')
-    df_financial.plot(kind='bar', stacked=True, figsize=(12, 8), color=['red', 'purple'])
-    plt.title('Accounts Receivable and Bill Collection Ratios')
-    plt.xlabel('Commercial Entity of Water Sources')
-    plt.ylabel('Value')
-    plt.xticks(rotation=90)
-    plt.tight_layout()
-    st.pyplot(plt)
+    def draw(fig, ax):
+        df_financial.plot(kind='bar', stacked=True, color=['red', 'purple'], ax=ax)
+        ax.set_title('Accounts Receivable and Bill Collection Ratios')
+        ax.set_xlabel('Commercial Entity of Water Sources')
+        ax.set_ylabel('Value')
+        ax.tick_params(axis='x', labelrotation=90)
+        fig.tight_layout()
+    render_figure(draw, chart_id='plot_financial_data/3', figsize=(12, 8))
 
     # Total Operating Expenses and Production Expenses (Stacked Bar Chart)
     st.subheader('Total Operating Expenses and Production Expenses')
     df_expenses = df[['RawWaterSource_name', 'total_operating_expenses', 'production_expenses']]
     df_expenses = df_expenses.set_index('RawWaterSource_name')
-    df_expenses.plot(kind='bar', stacked=True, figsize=(12, 8), color=['green', 'brown'])
-    plt.title('Total Operating Expenses and Production Expenses')
-    plt.xlabel('Commercial Entity of Water Sources')
-    plt.ylabel('Amount ($)')
-    plt.xticks(rotation=90)
-    plt.tight_layout()
-    st.pyplot(plt)
+    def draw(fig, ax):
+        df_expenses.plot(kind='bar', stacked=True, color=['green', 'brown'], ax=ax)
+        ax.set_title('Total Operating Expenses and Production Expenses')
+        ax.set_xlabel('Commercial Entity of Water Sources')
+        ax.set_ylabel('Amount ($)')
+        ax.tick_params(axis='x', labelrotation=90)
+        fig.tight_layout()
+    render_figure(draw, chart_id='plot_financial_data/4', figsize=(12, 8))
 
     # Net Income for Each Commercial Entity (Stacked Bar Chart)
     st.subheader('Net Income for Each Commercial Entity')
     df_net_income = df[['RawWaterSource_name', 'net_income']]
     df_net_income = df_net_income.set_index('RawWaterSource_name')
-    df_net_income.plot(kind='bar', stacked=True, figsize=(10, 6), color=['teal'])
-    plt.title('Net Income for Each Commercial Entity')
-    plt.xlabel('Commercial Entity of Water Sources')
-    plt.ylabel('Net Income ($)')
-    plt.xticks(rotation=90)
-    plt.tight_layout()
-    st.pyplot(plt)
+    def draw(fig, ax):
+        df_net_income.plot(kind='bar', stacked=True, color=['teal'], ax=ax)
+        ax.set_title('Net Income for Each Commercial Entity')
+        ax.set_xlabel('Commercial Entity of Water Sources')
+        ax.set_ylabel('Net Income ($)')
+        ax.tick_params(axis='x', labelrotation=90)
+        fig.tight_layout()
+    render_figure(draw, chart_id='plot_financial_data/5', figsize=(10, 6))
+
+    # Entered vs Computed KPIs (Table)
+    st.subheader('Entered vs Computed Financial KPIs')
+    visualize_kpi_check("financial")
+
+# Comparison of the hand-entered KPIs of a table with the ones computed from its raw inputs
+def visualize_kpi_check(table_name):
+    names = [name for name in KPI_FORMULAS if name in TABLE_SCHEMAS[table_name]]
+    summary = kpi_mismatch_summary(names)
+    st.write("The charts show the KPIs computed by scripts/kpi.py. Rows whose entered value differs "
+             "by more than 1% from the computed one:")
+    st.dataframe(summary)
+
+    name = st.selectbox("KPI", names, key=f"{table_name}_kpi_check")
+    comparison = kpi_comparison([name])
+    mismatched = comparison[comparison[f"{name}_mismatch"]]
+    st.dataframe(mismatched.drop(columns=f"{name}_mismatch"), hide_index=True)
 
 def plot_distribution_network_data():
 
     st.header('Distribution Network Analysis')
 
-    data1 = fetch_data("raw_watersource")
-    data2 = fetch_data("human_resources")
-    data3 = fetch_data("treatment_plant")
-    data4 = fetch_data("water_quality")
-    data5 = fetch_data("commercial")
-    data6 = fetch_data("financial")
-    data7 = fetch_data("distribution_network")
-
-    df_merged13 = pd.merge(data1, data3, on='idRawWaterSource')
-
-    # Merge data for analysis
-    df_merged135 = pd.merge(data5, df_merged13, on='idTreatmentPlant')
-    df_merged135.drop(columns=['code_x', 'code_y'], inplace=True)
-    # Merge DataFrames if needed (example merging on idTreatmentPlant)
-    df_merged1356 = pd.merge(df_merged135, data6, on='idCommercial')
-    # Merge DataFrames if needed (example merging on idTreatmentPlant)
-    df = pd.merge(df_merged1356, data7, on='idCommercial')
+    # Commercial, financial and distribution network data merged on idCommercial
+    df = get_frame("network")
 
     # Set the aesthetic style of the plots
     sns.set_style("whitegrid")
 
     # Supply Pressure at End Connection for Each Network
     st.subheader('Supply Pressure at End Connection for Each Network')
-    plt.figure(figsize=(10, 6))
-    sns.lineplot(x='RawWaterSource_name', y='Supply_Pressure_end_connection', data=df, marker='o')
-    plt.title('Supply Pressure at End Connection for Each Network')
-    plt.xlabel('Distribution Network Code')
-    plt.ylabel('Supply Pressure (in units)')
-    plt.xticks(rotation=90)
-    plt.tight_layout()
-    st.pyplot(plt)
+    def draw(fig, ax):
+        sns.lineplot(x='RawWaterSource_name', y='Supply_Pressure_end_connection', data=df, marker='o', ax=ax)
+        ax.set_title('Supply Pressure at End Connection for Each Network')
+        ax.set_xlabel('Distribution Network Code')
+        ax.set_ylabel('Supply Pressure (in units)')
+        ax.tick_params(axis='x', labelrotation=90)
+        fig.tight_layout()
+    render_figure(draw, chart_id='plot_distribution_network_data/1', figsize=(10, 6))
 
     # Number of Leaks Repaired in Each Network (Heatmap)
     st.subheader('Number of Leaks Repaired in Each Network')
@@ -964,27 +936,27 @@ def plot_distribution_network_data():
     heatmap_data = df.pivot_table(index='RawWaterSource_name', values='Number_leak_repaired')
 
     # Create the heatmap
-    plt.figure(figsize=(12, 8))
-    sns.heatmap(heatmap_data, annot=True, fmt="g", cmap="YlGnBu", cbar_kws={'label': 'Number of Leaks Repaired'})
-    plt.title('Number of Leaks Repaired in Each Network')
-    plt.xlabel('Distribution Network')
-    plt.ylabel('Commercial Water Sources')
-    plt.tight_layout()
-    st.pyplot(plt)
+    def draw(fig, ax):
+        sns.heatmap(heatmap_data, annot=True, fmt="g", cmap="YlGnBu", cbar_kws={'label': 'Number of Leaks Repaired'}, ax=ax)
+        ax.set_title('Number of Leaks Repaired in Each Network')
+        ax.set_xlabel('Distribution Network')
+        ax.set_ylabel('Commercial Water Sources')
+        fig.tight_layout()
+    render_figure(draw, chart_id='plot_distribution_network_data/2', figsize=(12, 8))
 
 
     # Total Length of the Distribution Network (Horizontal Bar Chart)
     # Total Length of the Distribution Network (Violin Plot)
     st.subheader('Total Length of the Distribution Network')
 
-    plt.figure(figsize=(12, 6))
-    sns.violinplot(x='RawWaterSource_name', y='total_length', data=df, color='purple')
-    plt.title('Total Length of the Distribution Network')
-    plt.xlabel('Distribution Network Code')
-    plt.ylabel('Total Length (in kilometers)')
-    plt.xticks(rotation=90)
-    plt.tight_layout()
-    st.pyplot(plt)
+    def draw(fig, ax):
+        sns.violinplot(x='RawWaterSource_name', y='total_length', data=df, color='purple', ax=ax)
+        ax.set_title('Total Length of the Distribution Network')
+        ax.set_xlabel('Distribution Network Code')
+        ax.set_ylabel('Total Length (in kilometers)')
+        ax.tick_params(axis='x', labelrotation=90)
+        fig.tight_layout()
+    render_figure(draw, chart_id='plot_distribution_network_data/3', figsize=(12, 6))
 
     # Storage Capacity and Supply Duration (Stacked Bar Chart)
     st.subheader('Storage Capacity (m3) and Supply Duration (H)')
@@ -998,14 +970,14 @@ def plot_distribution_network_data():
     df_pivot = data_storage_melted.pivot_table(index='RawWaterSource_name', columns='StorageMetric', values='Value', aggfunc='sum')
     
     # Plot the stacked bar chart
-    plt.figure(figsize=(12, 8))
-    df_pivot.plot(kind='bar', stacked=True)
-    plt.title('Storage Capacity (m3) and Supply Duration (Hours) by Network')
-    plt.xlabel('Distribution Network Code')
-    plt.ylabel('Value')
-    plt.xticks(rotation=90)
-    plt.tight_layout()
-    st.pyplot(plt)
+    def draw(fig, ax):
+        df_pivot.plot(kind='bar', stacked=True, ax=ax)
+        ax.set_title('Storage Capacity (m3) and Supply Duration (Hours) by Network')
+        ax.set_xlabel('Distribution Network Code')
+        ax.set_ylabel('Value')
+        ax.tick_params(axis='x', labelrotation=90)
+        fig.tight_layout()
+    render_figure(draw, chart_id='plot_distribution_network_data/4', figsize=(12, 8))
 # Introduction
 def introduction():
     st.title("Water Supplier Monitoring System (WSMS)")
@@ -1120,10 +1092,10 @@ def describe_tables():
       - `water_supplied_without_charge`: Water supplied without charge (in cubic meters).
       - `total_water_consumption`: Total water consumption (in cubic meters).
       - `water_losses`: Total water losses (in cubic meters).
-      - `non_revenue_water`: Non-revenue water (in percentage).
+      - `non_revenue_water`: Non-revenue water, water production minus water sold (in cubic meters).
       - `average_daily_consumption`: Average daily water consumption (in cubic meters).
-      - `average_consumption_per_connection`: Average water consumption per connection (in cubic meters).
-      - `average_consumption_per_capita`: Average water consumption per capita (in cubic meters).
+      - `average_consumption_per_connection`: Average water consumption per connection over the reporting period (in cubic meters).
+      - `average_consumption_per_capita`: Average water consumption per capita over the reporting period (in cubic meters).
       - `total_water_connections`: Total number of water connections.
       - `residential_connections`: Number of residential connections.
       - `commercial_connections`: Number of commercial connections.
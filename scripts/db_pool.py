@@ -0,0 +1,176 @@
+# scripts/db_pool.py
+"""
+Process-wide MySQL connection pool.
+
+Every Streamlit rerun of a form page used to open a new connection just to
+fill its dropdowns. DatabaseHelper now checks connections out of this pool
+and returns them on close_connection(), so all sessions of the Streamlit
+server share a handful of warm connections.
+"""
+import queue
+import threading
+import time
+
+from config import (
+    DB_POOL_MAX_OVERFLOW,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    get_connection,
+)
+from .sql_templates import discard_prepared
+
+
+class PoolTimeoutError(RuntimeError):
+    """Raised when no connection became free within the pool timeout."""
+
+
+class ConnectionPool:
+    def __init__(self, connect, size=5, max_overflow=10, recycle=3600, timeout=30.0):
+        """
+        :param connect: Callable opening a new DB-API connection.
+        :param size: Number of idle connections kept open for reuse.
+        :param max_overflow: Extra connections opened under load and closed once returned.
+        :param recycle: Connections older than this many seconds are reopened.
+        :param timeout: Seconds to wait for a free connection before raising PoolTimeoutError.
+        """
+        self._connect = connect
+        self.size = size
+        self.max_overflow = max_overflow
+        self.recycle = recycle
+        self.timeout = timeout
+
+        self._idle = queue.LifoQueue()  # Most recently used first, keeps few connections hot
+        self._created_at = {}  # id(connection) -> creation time
+        self._open = 0
+        self._lock = threading.Lock()
+
+        # Metrics
+        self._checkouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._timeouts = 0
+        self._discarded = 0
+
+    def acquire(self):
+        """Checks out a healthy connection, opening one if the pool has room."""
+        start = time.perf_counter()
+        try:
+            connection = self._checkout()
+        except PoolTimeoutError:
+            with self._lock:
+                self._timeouts += 1
+            raise
+        wait = time.perf_counter() - start
+        with self._lock:
+            self._checkouts += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+        return connection
+
+    def release(self, connection):
+        """Returns a connection to the pool, closing it if it is stale or surplus."""
+        try:
+            if connection.is_connected() and connection.in_transaction:
+                connection.rollback()  # Never hand uncommitted work to the next user
+        except Exception:
+            self._discard(connection)
+            return
+
+        if self._idle.qsize() >= self.size or self._expired(connection):
+            self._discard(connection)
+        else:
+            self._idle.put(connection)
+
+    def stats(self):
+        """Returns pool usage and checkout wait time metrics."""
+        with self._lock:
+            return {
+                "open": self._open,
+                "idle": self._idle.qsize(),
+                "in_use": self._open - self._idle.qsize(),
+                "checkouts": self._checkouts,
+                "avg_wait_ms": 1000 * self._total_wait / self._checkouts if self._checkouts else 0.0,
+                "max_wait_ms": 1000 * self._max_wait,
+                "timeouts": self._timeouts,
+                "discarded": self._discarded,
+            }
+
+    def _checkout(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    can_open = self._open < self.size + self.max_overflow
+                    if can_open:
+                        self._open += 1
+                if can_open:
+                    return self._create()
+
+                # Pool exhausted: wait for another session to release a connection
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeoutError(f"No database connection became free within {self.timeout}s")
+                try:
+                    connection = self._idle.get(timeout=remaining)
+                except queue.Empty:
+                    raise PoolTimeoutError(f"No database connection became free within {self.timeout}s")
+
+            if self._healthy(connection):
+                return connection
+            self._discard(connection)
+
+    def _create(self):
+        try:
+            connection = self._connect()
+        except Exception:
+            with self._lock:
+                self._open -= 1
+            raise
+        self._created_at[id(connection)] = time.monotonic()
+        return connection
+
+    def _expired(self, connection):
+        created_at = self._created_at.get(id(connection), 0)
+        return time.monotonic() - created_at > self.recycle
+
+    def _healthy(self, connection):
+        if self._expired(connection):
+            return False
+        try:
+            return connection.is_connected()  # Pings the server
+        except Exception:
+            return False
+
+    def _discard(self, connection):
+        self._created_at.pop(id(connection), None)
+        discard_prepared(connection)
+        with self._lock:
+            self._open -= 1
+            self._discarded += 1
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """Returns the connection pool shared by all Streamlit sessions of this process."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    get_connection,
+                    size=DB_POOL_SIZE,
+                    max_overflow=DB_POOL_MAX_OVERFLOW,
+                    recycle=DB_POOL_RECYCLE,
+                    timeout=DB_POOL_TIMEOUT,
+                )
+    return _pool
@@ -0,0 +1,79 @@
+# scripts/figures.py
+"""
+Figure lifecycle for the dashboard charts.
+
+Charts used to draw on pyplot's global figures and never close them, so
+every dashboard view left figures behind in the long-lived Streamlit
+server. render_figure draws each chart on its own matplotlib Figure, which
+is not registered with pyplot, rasterizes it and releases it right away.
+Charts with a chart_id are served from the chart cache while the WSMS
+snapshots are unchanged.
+"""
+import io
+import threading
+import time
+
+import streamlit as st
+from matplotlib.figure import Figure
+
+from .chart_cache import chart_cache
+from .wsms_frames import data_version
+
+# Same rasterization settings as st.pyplot
+SAVEFIG_KWARGS = {"format": "png", "bbox_inches": "tight", "dpi": 200}
+
+# Each Streamlit session reruns its script on its own thread
+_render_clock = threading.local()
+
+
+def start_render_clock():
+    """Starts timing a dashboard view on the current script thread."""
+    _render_clock.started = time.perf_counter()
+    _render_clock.first_chart = None
+
+
+def first_chart_seconds():
+    """Returns the seconds from start_render_clock() to the first chart shown, or None."""
+    return getattr(_render_clock, "first_chart", None)
+
+
+def draw_png(draw, figsize=None, nrows=1, ncols=1):
+    """Draws a chart on a fresh Figure and returns it as PNG bytes."""
+    fig = Figure(figsize=figsize)
+    try:
+        ax = fig.subplots(nrows, ncols)
+        draw(fig, ax)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, **SAVEFIG_KWARGS)
+        return buffer.getvalue()
+    finally:
+        fig.clear()  # Drop the artists now instead of waiting for garbage collection
+
+
+def render_figure(draw, chart_id=None, params=(), figsize=None, nrows=1, ncols=1):
+    """
+    Shows a chart in Streamlit, drawing it only on a chart cache miss.
+
+    :param draw: Callable draw(fig, ax) drawing the chart; ax is an array of Axes when nrows/ncols > 1.
+    :param chart_id: Stable name of the chart; None disables caching.
+    :param params: Hashable values, besides the snapshot data, that change the chart.
+    :param figsize: Figure size in inches.
+    :param nrows: Number of subplot rows.
+    :param ncols: Number of subplot columns.
+    """
+    key = None
+    image = None
+    if chart_id is not None:
+        key = (chart_id, data_version(), params, figsize, nrows, ncols)
+        image = chart_cache.get(key)
+
+    if image is None:
+        image = draw_png(draw, figsize=figsize, nrows=nrows, ncols=ncols)
+        if key is not None:
+            chart_cache.put(key, image)
+
+    st.image(image, use_column_width=True)
+
+    started = getattr(_render_clock, "started", None)
+    if started is not None and _render_clock.first_chart is None:
+        _render_clock.first_chart = time.perf_counter() - started
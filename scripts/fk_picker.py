@@ -0,0 +1,54 @@
+# scripts/fk_picker.py
+"""
+Searchable, paginated foreign-key pickers for large parent tables.
+
+Loading every row of `company` or `product` into a selectbox does not scale.
+search_fk_options is a drop-in replacement for the db_helper.fetch_data call
+that feeds a selectbox: it renders a search box with Previous/Next buttons
+and returns only one page of matching rows, in the same row shape.
+Call it before `st.form`, since widgets inside a form do not rerun the page.
+"""
+import streamlit as st
+
+PAGE_SIZE = 50
+
+
+def search_fk_options(db_helper, table_name, columns, label, key, page_size=PAGE_SIZE):
+    """
+    Renders a typeahead search for a parent table and returns one page of its rows.
+
+    :param db_helper: Open DatabaseHelper used for the query.
+    :param table_name: Parent table to search.
+    :param columns: [id_column, label_column] or [id_column], as passed to fetch_data.
+    :param label: Name of the parent shown in the search box.
+    :param key: Unique widget key prefix for this picker.
+    :param page_size: Number of rows per page.
+    :return: List of rows, like db_helper.fetch_data(table_name, columns).
+    """
+    search = st.text_input(f"Search {label}", key=f"{key}_search").strip()
+
+    # Keyset cursors of the pages already visited; reset when the search changes
+    state = st.session_state.setdefault(f"{key}_pages", {"search": search, "cursors": [None]})
+    if state["search"] != search:
+        state["search"], state["cursors"] = search, [None]
+
+    rows = db_helper.search_data(table_name, columns, search=search, limit=page_size + 1, after=state["cursors"][-1])
+    if isinstance(rows, tuple):
+        st.error(f"Could not search {label}: {rows[1]}")
+        return []
+    has_next = len(rows) > page_size
+    rows = rows[:page_size]
+
+    col1, col2, col3 = st.columns([1, 1, 4])
+    with col1:
+        if st.button("Previous", key=f"{key}_previous", disabled=len(state["cursors"]) == 1):
+            state["cursors"].pop()
+            st.rerun()
+    with col2:
+        if st.button("Next", key=f"{key}_next", disabled=not has_next):
+            state["cursors"].append(tuple(rows[-1]))
+            st.rerun()
+    with col3:
+        st.caption(f"Page {len(state['cursors'])}" + (" (no matches)" if not rows else ""))
+
+    return rows
@@ -0,0 +1,798 @@
+# scripts/form_registry.py
+"""
+Declarative registry of the data entry forms.
+
+Every form used to be a hand-written submit_* function building its widgets,
+dropdown queries and insert column list. Each form is now declared once
+here, keyed by its form id, and rendered by scripts/render_form.py.
+The column lists of the WSMS forms come from snapshot_schema.form_columns(),
+shared with the bulk importer, through wsms_form().
+"""
+from datetime import datetime
+
+from .form_schema import Form, checkbox, choice, date, lookup, number, text, text_area, upload
+from .snapshot_schema import form_columns
+
+
+def wsms_form(table, key, fields, **kwargs):
+    """
+    Declares the form of a WSMS table, whose insert columns are snapshot_schema.form_columns(table).
+
+    The fields only supply the widgets; they are put in form_columns() order, so
+    the form and the bulk importer insert the same column list.
+
+    :raise ValueError: If the fields do not cover exactly the form columns of the table.
+    """
+    columns = form_columns(table)
+    by_column = {field.column: field for field in fields}
+    if set(by_column) != set(columns) or len(by_column) != len(fields):
+        missing = [column for column in columns if column not in by_column]
+        extra = [field.column for field in fields if field.column not in columns]
+        raise ValueError(f"Fields of the {table} form do not match its columns: missing {missing}, unexpected {extra}")
+    return Form(table, key=key, fields=[by_column[column] for column in columns], **kwargs)
+
+# Form id -> Form
+FORMS = {
+    'type_of_application': Form('type_of_application', key='type_of_application_form', fields=[
+        text('Title', 'Title / ចំណងជើង', placeholder='Enter the application title / បញ្ចូលចំណងជើងនៃពាក្យសុំ'),
+        text_area('Description', 'Description / ការពិពណ៌នា', placeholder='Enter the description (optional) / បញ្ចូលការពិពណ៌នា (ស្រេចចិត្ត)'),
+    ]),
+    'raw_water_source': wsms_form('raw_watersource', key='raw_water_source_form', fields=[
+        number('code', 'Code / លេខកូដ', min_value=1),
+        text('RawWaterSource_name', 'Raw Water Source Name / ឈ្មោះប្រភពទឹកឆៅ'),
+        choice('availability_year_round', 'Availability Year Round / មានទឹកគ្រប់ឆ្នាំ', [0, 1], cast=int),
+        number('total_abstraction', 'Total Abstraction / បរិមាណទឹកសរុប', format='%.2f'),
+        upload('Drawing_RawWater_PumpingStation', 'Upload Drawing Raw Water Pumping Station / ផ្ទុករូបភាពស្ថានីយបូមទឹកឆៅ', type=['png', 'jpg', 'jpeg']),
+        upload('Drawing_Water_Transmission_Network', 'Upload Drawing Water Transmission Network / ផ្ទុករូបភាពបណ្តាញបញ្ជូនទឹក', type=['png', 'jpg', 'jpeg']),
+        upload('Drawing_Water_Treatment_Plant', 'Upload Drawing Water Treatment Plant / ផ្ទុករូបភាពរោងចក្រកែច្នៃទឹក', type=['png', 'jpg', 'jpeg']),
+    ]),
+    'for_of_oficial_user_only': Form('for_of_oficial_user_only', key='for_of_oficial_user_only_form', fields=[
+        text('SafetyMarkNumber', 'Safety Mark Number / លេខសម្គាល់សុវត្ថិភាព'),
+        text('OfficerNumber', 'Officer Number / លេខមន្រ្តី'),
+    ]),
+    'company': Form('company', key='company_form', fields=[
+        text('Name', 'Company Name / ឈ្មោះក្រុមហ៊ុន'),
+        text('Email', 'Email / អ៊ីមែល'),
+        text('Address', 'Address / អាសយដ្ឋាន'),
+        text('Phone', 'Phone / លេខទូរស័ព្ទ'),
+        upload('LocationPlan', 'Upload Location Plan / ផ្ទុកផែនទីទីតាំង', type=['png', 'jpg', 'jpeg', 'pdf']),
+        lookup('TypeOfApplicationID', 'Select Type of Application / ជ្រើសរើសប្រភេទនៃពាក្យសុំ', 'type_of_application', ('TypeOfApplicationID', 'Title')),
+    ]),
+    'company_signature': Form('company_signatur_and_stamp', key='company_signature_form', fields=[
+        text('Name', 'Name / ឈ្មោះ', placeholder='Enter the name / បញ្ចូលឈ្មោះ'),
+        date('Date', 'Date / កាលបរិច្ឆេទ'),
+        text('Position', 'Position / មុខតំណែង', placeholder='Enter the position / បញ្ចូលមុខតំណែង'),
+        upload('SignatureOrFingerprint', 'Upload Signature or Fingerprint / ផ្ទុកហត្ថលេខា ឬ ក្រយ៉ៅដៃ', type=['png', 'jpg', 'jpeg']),
+        upload('Stamp', 'Upload Stamp / ផ្ទុកត្រា', type=['png', 'jpg', 'jpeg']),
+        lookup('CompanyID', 'Select Company / ជ្រើសរើសក្រុមហ៊ុន', 'company', ('CompanyID', 'Name')),
+    ]),
+    'applicant': Form('applicant', key='applicant_form', fields=[
+        date('Applicationdate', 'Application Date / កាលបរិច្ឆេទនៃពាក្យសុំ'),
+        text('LocalRepresentativeName', 'Local Representative Name / ឈ្មោះតំណាងក្នុងស្រុក'),
+        text('LocalRepresentativePosition', 'Local Representative Position / មុខតំណែងតំណាងក្នុងស្រុក'),
+        text('LocalRepresentativeEmail', 'Local Representative Email / អ៊ីមែលតំណាងក្នុងស្រុក'),
+        text('LocalRepresentativePhone', 'Local Representative Phone / លេខទូរស័ព្ទតំណាងក្នុងស្រុក'),
+        text('LocalRepresentativeAddress', 'Local Representative Address / អាសយដ្ឋានតំណាងក្នុងស្រុក'),
+        text('LocalRepresentativeCompanyName', 'Local Representative Company Name / ឈ្មោះក្រុមហ៊ុនតំណាងក្នុងស្រុក'),
+        lookup('CompanyID', 'Select Company / ជ្រើសរើសក្រុមហ៊ុន', 'company', ('CompanyID', 'Name'), search='Company / ក្រុមហ៊ុន', key='applicant_company'),
+        lookup('TypeOfApplicationID', 'Select Type of Application / ជ្រើសរើសប្រភេទនៃពាក្យសុំ', 'type_of_application', ('TypeOfApplicationID', 'Title')),
+        lookup('ForOfficialUserOnlyID', 'Select Official User / ជ្រើសរើសអ្នកប្រើប្រាស់ផ្លូវការ', 'for_of_oficial_user_only', ('ForOfficialUserOnlyID', 'SafetyMarkNumber')),
+    ]),
+    'personal_info': Form('personal_infor_for_applicant', key='personal_info_form', fields=[
+        text('KhmerName', 'Khmer Name / ឈ្មោះជាភាសាខ្មែរ'),
+        text('LatinName', 'Latin Name / ឈ្មោះជាភាសាឡាតាំង'),
+        date('DateOfBirth', 'Date of Birth / ថ្ងៃខែឆ្នាំកំណើត', min_value=datetime(1900, 1, 1)),
+        text('Ethnicity', 'Ethnicity / ជនជាតិ'),
+        text('Nationality', 'Nationality / សញ្ជាតិ'),
+        text('CurrentOccupation', 'Current Occupation / មុខរបរបច្ចុប្បន្ន'),
+        choice('Gender', 'Gender / ភេទ', ['Male / ប្រុស', 'Female / ស្រី', 'Other / ផ្សេងៗ']),
+        lookup('ApplicantID', 'Select Applicant / ជ្រើសរើសអ្នកដាក់ពាក្យ', 'applicant', ('ApplicantID', 'LocalRepresentativeName')),
+    ]),
+    'id_card_or_passport': Form('idcardorpaassport', key='id_card_passport_form', fields=[
+        text('IDCardOrPassportNumber', 'ID Card or Passport Number / លេខអត្តសញ្ញាណប័ណ្ណ ឬ លិខិតឆ្លងដែន'),
+        date('IssuedDate', 'Issued Date / ថ្ងៃចេញ', min_value=datetime(1990, 1, 1)),
+        date('ExpirationDate', 'Expiration Date / ថ្ងៃផុតកំណត់', min_value=datetime(1990, 1, 1)),
+        lookup('PersonalInforForApplicantID', 'Select Personal Information / ជ្រើសរើសព័ត៌មានផ្ទាល់ខ្លួន', 'personal_infor_for_applicant', ('PersonalInforForApplicantID', 'KhmerName')),
+    ]),
+    'address': Form('address', key='address_form', fields=[
+        text('HouseNumber', 'House Number / លេខផ្ទះ'),
+        text('Street', 'Street / ផ្លូវ'),
+        text('Village', 'Village / ភូមិ'),
+        text('Commune', 'Commune / ឃុំ'),
+        text('District', 'District / ស្រុក'),
+        text('Province', 'Province / ខេត្ត'),
+        text('OfficeAddress', 'Office Address / អាសយដ្ឋានការិយាល័យ'),
+        text('Currently_location', 'Currently Location / ទីតាំងបច្ចុប្បន្ន'),
+        lookup('PersonalInforForApplicantID', 'Select Personal Information / ជ្រើសរើសព័ត៌មានផ្ទាល់ខ្លួន', 'personal_infor_for_applicant', ('PersonalInforForApplicantID', 'KhmerName')),
+    ]),
+    'human_resources': wsms_form('human_resources', key='human_resources_form', fields=[
+        number('code', 'Code / លេខកូដ', min_value=0, step=1),
+        number('total_staff', 'Total Staff / បុគ្គលិកសរុប', min_value=0, step=1),
+        number('staff_per_1000_subscribers', 'Staff per 1000 Subscribers / បុគ្គលិកក្នុងមួយពាន់អ្នកជាវ', format='%.2f'),
+        number('training_sessions', 'Training Sessions / វគ្គបណ្តុះបណ្តាល', min_value=0, step=1),
+        upload('organization_chart', 'Upload Organization Chart / ផ្ទុកតារាងអង្គភាព', type=['png', 'jpg', 'jpeg', 'pdf', 'docx', 'xlsx']),
+        lookup('idRawWaterSource', 'Select Raw Water Source / ជ្រើសរើសប្រភពទឹកឆៅ', 'raw_watersource', ('idRawWaterSource', 'idRawWaterSource')),
+    ]),
+    'treatment_plant': wsms_form('treatment_plant', key='treatment_plant_form', fields=[
+        number('code', 'Code / លេខកូដ', min_value=0, step=1),
+        number('treatment_losses', 'Treatment Losses / ការបាត់បង់ក្នុងការកែច្នៃ', format='%.2f'),
+        number('pac_consumption', 'PAC Consumption / ការប្រើប្រាស់ PAC', format='%.2f'),
+        number('pac_per_m3_produced', 'PAC per m³ Produced / PAC ក្នុងមួយម៉ែត្រគូបផលិត', format='%.2f'),
+        number('alum_consumption', 'Alum Consumption / ការប្រើប្រាស់ Alum', format='%.2f'),
+        number('alum_per_m3_produced', 'Alum per m³ Produced / Alum ក្នុងមួយម៉ែត្រគូបផលិត', format='%.2f'),
+        number('chlorine_consumption', 'Chlorine Consumption / ការប្រើប្រាស់ក្លរ', format='%.2f'),
+        number('chlorine_per_m3_produced', 'Chlorine per m³ Produced / ក្លរ ក្នុងមួយម៉ែត្រគូបផលិត', format='%.2f'),
+        number('electricity_consumption', 'Electricity Consumption / ការប្រើប្រាស់អគ្គិសនី', format='%.2f'),
+        number('electricity_per_m3_produced', 'Electricity per m³ Produced / អគ្គិសនី ក្នុងមួយម៉ែត្រគូបផលិត', format='%.2f'),
+        number('lime_consumption', 'Lime Consumption / ការប្រើប្រាស់ស៊ីម៉ង់', format='%.2f'),
+        number('lime_per_m3_produced', 'Lime per m³ Produced / ស៊ីម៉ង់ ក្នុងមួយម៉ែត្រគូបផលិត', format='%.2f'),
+        number('fuel_consumption', 'Fuel Consumption / ការប្រើប្រាស់ប្រេងឥន្ធនៈ', format='%.2f'),
+        number('fuel_per_m3_produced', 'Fuel per m³ Produced / ប្រេងឥន្ធនៈ ក្នុងមួយម៉ែត្រគូបផលិត', format='%.2f'),
+        number('production_capacity', 'Production Capacity / សមត្ថភាពផលិត', format='%.2f'),
+        lookup('idRawWaterSource', 'Select Raw Water Source / ជ្រើសរើសប្រភពទឹកឆៅ', 'raw_watersource', ('idRawWaterSource', 'idRawWaterSource')),
+    ]),
+    'water_quality': wsms_form('water_quality', key='water_quality_form', fields=[
+        number('code', 'Code / លេខកូដ', min_value=0, step=1),
+        number('color', 'Color / ពណ៌', format='%.2f'),
+        number('turbidity', 'Turbidity / ភាពអាប់អួរ', format='%.2f'),
+        number('ph_level', 'pH Level / កម្រិត pH', format='%.2f'),
+        number('arsenic_level', 'Arsenic Level / កម្រិតអាសេនិក', format='%.2f'),
+        number('total_dissolved_solids', 'Total Dissolved Solids / សារធាតុរលាយសរុប', format='%.2f'),
+        number('manganese_level', 'Manganese Level / កម្រិតម៉ង់ហ្គាណែ', format='%.2f'),
+        number('zinc_level', 'Zinc Level / កម្រិតស័ង្កសី', format='%.2f'),
+        number('sulfate_level', 'Sulfate Level / កម្រិតស៊ុលហ្វាត', format='%.2f'),
+        number('copper_level', 'Copper Level / កម្រិតស្ពាន់', format='%.2f'),
+        number('hydrogen_sulfide', 'Hydrogen Sulfide / កម្រិតអ៊ីដ្រូស៊ុលហ្វីត', format='%.2f'),
+        number('hardness', 'Hardness / ភាពរឹង', format='%.2f'),
+        number('aluminum_level', 'Aluminum Level / កម្រិតអាលុយមីញ៉ូម', format='%.2f'),
+        number('chloride_level', 'Chloride Level / កម្រិតក្លរួ', format='%.2f'),
+        number('iron_level', 'Iron Level / កម្រិតដែក', format='%.2f'),
+        number('ammonia_level', 'Ammonia Level / កម្រិតអាម៉ូនី', format='%.2f'),
+        number('barium_level', 'Barium Level / កម្រិតបារីញ៉ូម', format='%.2f'),
+        number('cadmium_level', 'Cadmium Level / កម្រិតកាដមីញ៉ូម', format='%.2f'),
+        number('chromium_level', 'Chromium Level / កម្រិតក្រូមីញ៉ូម', format='%.2f'),
+        number('fluoride_level', 'Fluoride Level / កម្រិតហ្វ្លូអរួ', format='%.2f'),
+        number('lead_level', 'Lead Level / កម្រិតសំណ', format='%.2f'),
+        number('mercury_level', 'Mercury Level / កម្រិតបារត', format='%.2f'),
+        number('nitrate_level', 'Nitrate Level / កម្រិតនីត្រាត', format='%.2f'),
+        number('nitrite_level', 'Nitrite Level / កម្រិតនីត្រាយ', format='%.2f'),
+        number('sodium_level', 'Sodium Level / កម្រិតសូដ្យូម', format='%.2f'),
+        number('residual_chlorine', 'Residual Chlorine / កម្រិតក្លរួសល់', format='%.2f'),
+        lookup('idTreatmentPlant', 'Select Treatment Plant / ជ្រើសរើសរោងចក្រកែច្នៃទឹក', 'treatment_plant', ('idTreatmentPlant', 'idTreatmentPlant')),
+    ]),
+    'commercial': wsms_form('commercial', key='commercial_form', submit_label='បញ្ជូន | Submit', fields=[
+        number('code', 'កូដ | Code', min_value=0, step=1),
+        number('population_served', 'ប្រជាជនដែលបានបម្រើ | Population Served', min_value=0),
+        number('service_coverage_license_area', 'ផ្ទៃដីអាជ្ញាប័ណ្ណសេវាកម្ម (គម²) | Service Coverage License Area (sq km)', format='%.2f'),
+        number('service_coverage_network_area', 'ផ្ទៃដីបណ្តាញសេវាកម្ម (គម²) | Service Coverage Network Area (sq km)', format='%.2f'),
+        number('Water_Production', 'ផលិតទឹក (ម³) | Water Production (m³)', format='%.2f'),
+        number('water_sold', 'ទឹកលក់ (ម³) | Water Sold (m³)', format='%.2f'),
+        number('water_supplied_without_charge', 'ទឹកផ្គត់ផ្គង់ដោយមិនគិតថ្លៃ (ម³) | Water Supplied Without Charge (m³)', format='%.2f'),
+        number('total_water_consumption', 'ការប្រើប្រាស់ទឹកសរុប (ម³) | Total Water Consumption (m³)', format='%.2f'),
+        number('water_losses', 'ការបាត់បង់ទឹក (ម³) | Water Losses (m³)', format='%.2f'),
+        number('non_revenue_water', 'ទឹកដែលមិនបានចំណូល (ម³) | Non-Revenue Water (m³)', format='%.2f'),
+        number('average_daily_consumption', 'ការកំណត់ទឹកប្រចាំថ្ងៃមធ្យម (ម³) | Average Daily Consumption (m³)', format='%.2f'),
+        number('average_consumption_per_connection', 'ការកំណត់ទឹកមធ្យមចំពោះនីតិវិធីមួយ (ម³) | Average Consumption Per Connection (m³)', format='%.2f'),
+        number('average_consumption_per_capita', 'ការកំណត់ទឹកមធ្យមចំពោះប្រជាជនម្នាក់ (ម³) | Average Consumption Per Capita (m³)', format='%.2f'),
+        number('total_water_connections', 'ការតភ្ជាប់ទឹកសរុប | Total Water Connections', min_value=0),
+        number('residential_connections', 'ការតភ្ជាប់លំនៅដ្ឋាន | Residential Connections', min_value=0),
+        number('commercial_connections', 'ការតភ្ជាប់ពាណិជ្ជកម្ម | Commercial Connections', min_value=0),
+        number('public_entity_connections', 'ការតភ្ជាប់អង្គភាពសាធារណៈ | Public Entity Connections', min_value=0),
+        number('factory_connections', 'ការតភ្ជាប់រោងចក្រ | Factory Connections', min_value=0),
+        number('sme_connections', 'ការតភ្ជាប់អាជីវកម្មតូច | SME Connections', min_value=0),
+        number('poor_connections', 'ការតភ្ជាប់អ្នកក្រីក្រ | Poor Connections', min_value=0),
+        number('poor_household_ratio', 'អត្រាផ្ទះក្រីក្រ (%) | Poor Household Ratio (%)', format='%.2f'),
+        number('customer_complaints', 'បណ្តឹងអតិថិជន | Customer Complaints', min_value=0),
+        number('complaints_per_1000_connections', 'បណ្តឹងក្នុងមួយ 1000 ការតភ្ជាប់ | Complaints Per 1000 Connections', format='%.2f'),
+        text('license_area_profile', 'កំណត់ហេតុផ្ទៃដីអាជ្ញាប័ណ្ណ | License Area Profile'),
+        number('network_area_population', 'ប្រជាជនបណ្តាញផ្ទៃដី | Network Area Population', min_value=0),
+        number('network_area_houses', 'ផ្ទះបណ្តាញផ្ទៃដី | Network Area Houses', min_value=0),
+        number('licensed_area_population', 'ប្រជាជនផ្ទៃដីអាជ្ញាប័ណ្ណ | Licensed Area Population', min_value=0),
+        number('licensed_area_houses', 'ផ្ទះផ្ទៃដីអាជ្ញាប័ណ្ណ | Licensed Area Houses', min_value=0),
+        lookup('idTreatmentPlant', 'ជ្រើសរើសរុក្ខជាតិបច្ចេកទេស | Select Treatment Plant', 'treatment_plant', ('idTreatmentPlant', 'idTreatmentPlant')),
+    ]),
+    'financial': wsms_form('financial', key='financial_form', submit_label='បញ្ជូន | Submit', fields=[
+        number('code', 'កូដ | Code', min_value=0, step=1),
+        number('cash_from_water_sales', 'ប្រាក់ពីការលក់ទឹក | Cash From Water Sales', format='%.2f'),
+        number('other_cash', 'ប្រាក់ផ្សេងទៀត | Other Cash', format='%.2f'),
+        number('amount_billed_for_water_sales', 'ចំនួនវិក័យប័ត្រសម្រាប់លក់ទឹក | Amount Billed for Water Sales', format='%.2f'),
+        number('amount_billed_for_other_services', 'ចំនួនវិក័យប័ត្រសម្រាប់សេវាផ្សេងទៀត | Amount Billed for Other Services', format='%.2f'),
+        number('accounts_receivable', 'គណនីទទួលបាន | Accounts Receivable', format='%.2f'),
+        number('average_tariff', 'តំលៃមធ្យម | Average Tariff', format='%.2f'),
+        number('bill_collection_ratio', 'អត្រាប្រមូលវិក័យប័ត្រ (%) | Bill Collection Ratio (%)', format='%.2f'),
+        number('total_operating_expenses', 'ចំណាយប្រតិបត្តិការសរុប | Total Operating Expenses', format='%.2f'),
+        number('operating_ratio', 'អត្រាប្រតិបត្តិការ (%) | Operating Ratio (%)', format='%.2f'),
+        number('production_expenses', 'ចំណាយផលិត | Production Expenses', format='%.2f'),
+        number('unit_production_cost', 'ថ្លៃដើមផលិតនីតិវិធី | Unit Production Cost', format='%.2f'),
+        number('net_income', 'ចំណូលសុទ្ធ | Net Income', format='%.2f'),
+        number('net_profit_margin', 'អត្រាប្រាក់ចំណេញសុទ្ធ (%) | Net Profit Margin (%)', format='%.2f'),
+        number('investment_expenditures', 'ចំណាយវិនិយោគ | Investment Expenditures', format='%.2f'),
+        number('loans', 'ឥណទាន | Loans', format='%.2f'),
+        number('accounts_payable', 'គណនីត្រូវបង់ | Accounts Payable', format='%.2f'),
+        number('total_assets', 'ទ្រព្យសកម្មសរុប | Total Assets', format='%.2f'),
+        number('owner_equity', 'មូលដ្ឋានម្ចាស់ | Owner Equity', format='%.2f'),
+        number('debt_to_equity_ratio', 'អត្រាបំណុលទៅមូលដ្ឋាន | Debt to Equity Ratio', format='%.2f'),
+        number('return_on_assets', 'ប្រយោជន៍លើទ្រព្យសកម្ម (%) | Return on Assets (%)', format='%.2f'),
+        number('return_on_equity', 'ប្រយោជន៍លើមូលដ្ឋាន (%) | Return on Equity (%)', format='%.2f'),
+        number('interest_expense', 'ចំណាយការប្រាក់ | Interest Expense', format='%.2f'),
+        number('depreciation_expense', 'ចំណាយអាប់បង់ | Depreciation Expense', format='%.2f'),
+        number('other_expense', 'ចំណាយផ្សេងៗ | Other Expense', format='%.2f'),
+        number('residential_tariff', 'តំលៃលំនៅដ្ឋាន | Residential Tariff', format='%.2f'),
+        number('commercial_tariff', 'តំលៃពាណិជ្ជកម្ម | Commercial Tariff', format='%.2f'),
+        number('government_tariff', 'តំលៃរដ្ឋាភិបាល | Government Tariff', format='%.2f'),
+        lookup('idCommercial', 'ជ្រើសរើសពាណិជ្ជកម្ម | Select Commercial', 'commercial', ('idCommercial', 'idCommercial')),
+    ]),
+    'distribution_network': wsms_form('distribution_network', key='distribution_network_form', fields=[
+        number('code', 'Code / លេខកូដ', min_value=0, step=1),
+        number('Supply_Pressure_end_connection', 'Supply Pressure at End Connection / សម្ពាធផ្គត់ផ្គង់នៅចំណុចបញ្ចប់', format='%.2f'),
+        number('Number_leak_repaired', 'Number of Leaks Repaired / ចំនួនការជួសជុលការជ្រាប', format='%.2f'),
+        number('total_length', 'Total Length (m) / ប្រវែងសរុប (ម៉ែត្រ)', format='%.2f'),
+        number('transmission_length', 'Transmission Length (m) / ប្រវែងបញ្ជូន (ម៉ែត្រ)', format='%.2f'),
+        number('distribution_length', 'Distribution Length (m) / ប្រវែងចែកចាយ (ម៉ែត្រ)', format='%.2f'),
+        number('Storagecapacity', 'Storage Capacity (m³) / សមត្ថភាពផ្ទុក (ម៉ែត្រគូប)', format='%.2f'),
+        number('Supply_duration', 'Supply Duration (hours) / រយៈពេលផ្គត់ផ្គង់ (ម៉ោង)', min_value=0, step=1),
+        lookup('idCommercial', 'Select Commercial / ជ្រើសរើសពាណិជ្ជកម្ម', 'commercial', ('idCommercial', 'idCommercial')),
+    ]),
+    'office_contact': Form('office_contact', key='office_contact_form', fields=[
+        text('OfficePhone', 'Office Phone / លេខទូរស័ព្ទការិយាល័យ'),
+        text('FaxNumber', 'Fax Number / លេខទូរសារ'),
+        text('MobilePhone', 'Mobile Phone / លេខទូរស័ព្ទចល័ត'),
+        text('Email', 'Email / អ៊ីមែល'),
+        lookup('ApplicantID', 'Select Applicant / ជ្រើសរើសអ្នកដាក់ពាក្យ', 'applicant', ('ApplicantID', 'LocalRepresentativeName')),
+        lookup('CompanyID', 'Select Company / ជ្រើសរើសក្រុមហ៊ុន', 'company', ('CompanyID', 'Name')),
+    ]),
+    'factory': Form('factory', key='factory_form', fields=[
+        text('Name', 'Factory Name / ឈ្មោះរោងចក្រ'),
+        text('Country', 'Country / ប្រទេស'),
+        text('Address', 'Address / អាសយដ្ឋាន'),
+        lookup('CompanyID', 'Select Company / ជ្រើសរើសក្រុមហ៊ុន', 'company', ('CompanyID', 'Name')),
+    ]),
+    'product': Form('product', key='product_form', fields=[
+        text('ProductName', 'Product Name / ឈ្មោះផលិតផល'),
+        text('TradeName', 'Trade Name / ឈ្មោះពាណិជ្ជកម្ម'),
+        text('ModelNumber', 'Model Number / លេខម៉ូដែល'),
+        upload('ReferredStandard', 'Referred Standard / ស្តង់ដារដែលបានយោង', type=['pdf', 'docx', 'jpg', 'png']),
+        lookup('ApplicantID', 'Select Applicant / ជ្រើសរើសអ្នកដាក់ពាក្យ', 'applicant', ('ApplicantID', 'LocalRepresentativeName')),
+        lookup('FactoryID', 'Select Factory / ជ្រើសរើសរោងចក្រ', 'factory', ('FactoryID', 'Name')),
+    ]),
+    'license': Form('license', key='license_form', fields=[
+        text('LicenseNumber', 'License Number / លេខអាជ្ញាប័ណ្ណ'),
+        date('LicenseIssuedDate', 'License Issued Date / កាលបរិច្ឆេទចេញអាជ្ញាប័ណ្ណ'),
+        date('LicenseExpiryDate', 'License Expiry Date / កាលបរិច្ឆេទផុតកំណត់អាជ្ញាប័ណ្ណ'),
+        text('LicenseType', 'License Type / ប្រភេទអាជ្ញាប័ណ្ណ'),
+        lookup('CompanyID', 'Select Company / ជ្រើសរើសក្រុមហ៊ុន', 'company', ('CompanyID', 'Name'), search='Company / ក្រុមហ៊ុន', key='license_company'),
+        lookup('ProductID', 'Select Product / ជ្រើសរើសផលិតផល', 'product', ('ProductID', 'ProductName'), search='Product / ផលិតផល', key='license_product'),
+    ]),
+    'factory_inspection_report': Form('factory_inspection_report', key='factory_inspection_report_form', fields=[
+        text('SystemCertificationNumber', 'System Certification Number / លេខវិញ្ញាបនបត្រប្រព័ន្ធ'),
+        date('IssuedDate', 'Issued Date / កាលបរិច្ឆេទចេញ'),
+        text('CertificationBodyName', 'Certification Body Name / ឈ្មោះអង្គភាពវិញ្ញាបនបត្រ'),
+        lookup('FactoryID', 'Select Factory / ជ្រើសរើសរោងចក្រ', 'factory', ('FactoryID', 'Name')),
+        lookup('ProductID', 'Select Product / ជ្រើសរើសផលិតផល', 'product', ('ProductID', 'ProductName')),
+    ]),
+    'certificate_of_conformity': Form('certificate_of_conformity', key='certificate_of_conformity_form', fields=[
+        text('CertificateNumber', 'Certificate Number / លេខវិញ្ញាបនបត្រ'),
+        date('IssuedDate', 'Issued Date / កាលបរិច្ឆេទចេញ'),
+        text('CertificationBodyName', 'Certification Body Name / ឈ្មោះអង្គភាពវិញ្ញាបនបត្រ'),
+        lookup('ProductID', 'Select Product / ជ្រើសរើសផលិតផល', 'product', ('ProductID', 'ProductName')),
+        lookup('FactoryInspectionReportID', 'Select Factory Inspection Report / ជ្រើសរើសរបាយការណ៍ត្រួតពិនិត្យរោងចក្រ', 'factory_inspection_report', ('FactoryInspectionReportID', 'SystemCertificationNumber')),
+    ]),
+    'test_report': Form('test_report', key='test_report_form', return_id=False, fields=[
+        text('ReportNumber', 'Report Number / លេខរបាយការណ៍'),
+        text('TestLaboratoryName', 'Test Laboratory Name / ឈ្មោះមន្ទីរសាកល្បង'),
+        date('IssuedDate', 'Issued Date / កាលបរិច្ឆេទចេញ', min_value=datetime(1900, 1, 1)),
+        lookup('ProductID', 'Select Product / ជ្រើសរើសផលិតផល', 'product', ('ProductID', 'ProductName')),
+        lookup('CertificateOfConformityID', 'Select Certificate of Conformity / ជ្រើសរើសវិញ្ញាបនបត្រនៃការអនុលោម', 'certificate_of_conformity', ('CertificateOfConformityID', 'CertificateNumber')),
+    ]),
+    'patent_card': Form('patent_card', key='patent_card_form', fields=[
+        text('Number', 'Patent Number / លេខប៉ាតង់'),
+        date('PatentIssuedDate', 'Patent Issued Date / កាលបរិច្ឆេទចេញប៉ាតង់', min_value=datetime(1900, 1, 1)),
+        text('TaxUnit', 'Tax Unit / ឯកតាពន្ធ'),
+        lookup('ProductID', 'Select Product / ជ្រើសរើសផលិតផល', 'product', ('ProductID', 'ProductName')),
+        lookup('CompanyID', 'Select Company / ជ្រើសរើសក្រុមហ៊ុន', 'company', ('CompanyID', 'Name')),
+    ]),
+    'doc_pro_or_spare_part_pro_registration': Form('doc_pro_or_spare_part_pro_registration', key='doc_pro_or_spare_part_pro_registration_form', fields=[
+        text('Description', 'Description / សេចក្ដីពិពណ៌នា'),
+        upload('CertificateConformityInEnglish', 'Upload Certificate Conformity in English / ផ្ទុកវិញ្ញាបនបត្រនៃការអនុលោមជាភាសាអង់គ្លេស', type=['pdf', 'jpg', 'png']),
+        upload('FactoryInspectionReport', 'Upload Factory Inspection Report / ផ្ទុករបាយការណ៍ត្រួតពិនិត្យរោងចក្រ', type=['pdf', 'jpg', 'png']),
+        upload('Label', 'Upload Label / ផ្ទុកស្លាក', type=['pdf', 'jpg', 'png']),
+        upload('UsersInstructionManual', 'Upload Users Instruction Manual / ផ្ទុកសៀវភៅណែនាំអ្នកប្រើប្រាស់', type=['pdf', 'jpg', 'png']),
+        upload('RecordOfModification', 'Upload Record of Modification / ផ្ទុកកំណត់ត្រានៃការកែប្រែ', type=['pdf', 'jpg', 'png']),
+        upload('ProductColorPhotographs', 'Upload Product Color Photographs / ផ្ទុករូបថតផលិតផលពណ៌', type=['pdf', 'jpg', 'png']),
+        upload('TestReportConformityInEnglish', 'Upload Test Report Conformity in English / ផ្ទុករបាយការណ៍សាកល្បងជាភាសាអង់គ្លេស', type=['pdf', 'jpg', 'png']),
+        lookup('CertificateOfConformityID', 'Select Certificate of Conformity / ជ្រើសរើសវិញ្ញាបនបត្រនៃការអនុលោម', 'certificate_of_conformity', ('CertificateOfConformityID', 'CertificateNumber')),
+        lookup('FactoryInspectionReportID', 'Select Factory Inspection Report / ជ្រើសរើសរបាយការណ៍ត្រួតពិនិត្យរោងចក្រ', 'factory_inspection_report', ('FactoryInspectionReportID', 'SystemCertificationNumber')),
+        lookup('ProductID', 'Select Product / ជ្រើសរើសផលិតផល', 'product', ('ProductID', 'ProductName')),
+    ]),
+    'doc_electri_and_electro_pro_registration': Form('doc_electri_and_electro_pro_registration', key='doc_electri_and_electro_pro_registration_form', fields=[
+        upload('FullElectricalWiringCircuitDiagrams', 'Upload Full Electrical Wiring Circuit Diagrams / ផ្ទុកគំនូសបញ្ជាក់បន្ទាត់ភ្លើងពេញលេញ', type=['pdf', 'jpg', 'png']),
+        lookup('DocumentsID', 'Select Document ID / ជ្រើសរើសលេខសម្គាល់ឯកសារ', 'doc_pro_or_spare_part_pro_registration', ('DocumentsID', 'Description')),
+    ]),
+    'infor_detail_of_modification': Form('infor_detail_of_modification_part_or_electri_and_electro_pro', key='infor_detail_of_modification_form', fields=[
+        text('ItemNumber', 'Item Number / លេខធាតុ'),
+        text('DescriptionItem', 'Description of Item / សេចក្ដីពិពណ៌នាធាតុ'),
+        lookup('CompanyID', 'Select Company / ជ្រើសរើសក្រុមហ៊ុន', 'company', ('CompanyID', 'Name')),
+        lookup('ApplicantID', 'Select Applicant / ជ្រើសរើសអ្នកដាក់ពាក្យ', 'applicant', ('ApplicantID', 'LocalRepresentativeName')),
+        lookup('ProductID', 'Select Product / ជ្រើសរើសផលិតផល', 'product', ('ProductID', 'ProductName')),
+    ]),
+    'doc_of_modification_part_pro': Form('doc_of_modification_part_pro', key='doc_of_modification_part_pro_form', submit_label='បញ្ជូន | Submit', fields=[
+        upload('IndustrialAnouncementLatter', 'ផ្ទុកឡើងលិខិតប្រកាសឧស្សាហកម្ម | Upload Industrial Announcement Letter', type=['pdf', 'jpg', 'png']),
+        upload('CertificateOfOpperationCompanyLocal', 'ផ្ទុកឡើងវិញ្ញាបនបត្ររបស់ក្រុមហ៊ុនដំណើរការក្នុងស្រុក | Upload Certificate of Operation Company Local', type=['pdf', 'jpg', 'png']),
+        upload('Companyestablishmentstatute', 'ផ្ទុកឡើងច្បាប់ស្ថាបនាក្រុមហ៊ុន | Upload Company Establishment Statute', type=['pdf', 'jpg', 'png']),
+        upload('commercialregistrationcertificate', 'ផ្ទុកឡើងវិញ្ញាបនបត្រចុះបញ្ជីពាណិជ្ជកម្ម | Upload Commercial Registration Certificate', type=['pdf', 'jpg', 'png']),
+        upload('patentCertificate', 'ផ្ទុកឡើងវិញ្ញាបនបត្រកម្មសិទ្ធិបញ្ញា | Upload Patent Certificate', type=['pdf', 'jpg', 'png']),
+        upload('equivalentlegaldocuments', 'ផ្ទុកឡើងឯកសារច្បាប់ស្មើ | Upload Equivalent Legal Documents', type=['pdf', 'jpg', 'png']),
+        upload('Letterofrecognition', 'ផ្ទុកឡើងលិខិតស្គាល់ | Upload Letter of Recognition', type=['pdf', 'jpg', 'png']),
+        upload('NationalIDCardorPassport', 'ផ្ទុកឡើងកាតសម្គាល់ខ្លួនជាតិ ឬ លិខិតឆ្លងដែន | Upload National ID Card or Passport', type=['pdf', 'jpg', 'png']),
+        upload('Analysiscertificate', 'ផ្ទុកឡើងវិញ្ញាបនបត្រវិភាគ | Upload Analysis Certificate', type=['pdf', 'jpg', 'png']),
+        upload('complianceevaluationcertificate', 'ផ្ទុកឡើងវិញ្ញាបនបត្រវាយតម្លៃភាពស្របច្បាប់ | Upload Compliance Evaluation Certificate', type=['pdf', 'jpg', 'png']),
+        upload('Licenseusingvehiclsafetymark', 'ផ្ទុកឡើងអាជ្ញាប័ណ្ណប្រើសញ្ញាសុវត្ថិភាពយានយន្ត | Upload License Using Vehicle Safety Mark', type=['pdf', 'jpg', 'png']),
+        upload('Otherrelateddocuments', 'ផ្ទុកឡើងឯកសារផ្សេងទៀតដែលពាក់ព័ន្ធ | Upload Other Related Documents', type=['pdf', 'jpg', 'png']),
+        lookup('ApplicantID', 'ជ្រើសរើសអ្នកដាក់ពាក្យ | Select Applicant', 'applicant', ('ApplicantID', 'LocalRepresentativeName')),
+        lookup('CompanyID', 'ជ្រើសរើសក្រុមហ៊ុន | Select Company', 'company', ('CompanyID', 'Name')),
+        lookup('ProductID', 'ជ្រើសរើសផលិតផល | Select Product', 'product', ('ProductID', 'ProductName')),
+        lookup('InforDetailOfModificationID', 'ជ្រើសរើសព័ត៌មានលម្អិតនៃការកែប្រែ | Select Information Detail of Modification', 'infor_detail_of_modification_part_or_electri_and_electro_pro', ('InforDetailOfModificationID', 'ItemNumber')),
+    ]),
+    'doc_of_modification_electri_electro_part_pro': Form('doc_of_modification_electri_electro_part_pro', key='doc_of_modification_electri_electro_part_pro_form', fields=[
+        upload('TestReportInEnglish', 'Upload Test Report in English / ផ្ទុករបាយការណ៍សាកល្បងជាភាសាអង់គ្លេស', type=['pdf', 'jpg', 'png']),
+        upload('CertificateOfConformityInEnglish', 'Upload Certificate of Conformity in English / ផ្ទុកវិញ្ញាបនបត្រនៃការអនុលោមជាភាសាអង់គ្លេស', type=['pdf', 'jpg', 'png']),
+        upload('ProductSafetyLicense', 'Upload Product Safety License / ផ្ទុកអាជ្ញាប័ណ្ណសុវត្ថិភាពផលិតផល', type=['pdf', 'jpg', 'png']),
+        upload('ConfirmedLetter', 'Upload Confirmed Letter / ផ្ទុកលិខិតបញ្ជាក់', type=['pdf', 'jpg', 'png']),
+        upload('DocumentRelatedRegulatedProducts', 'Upload Document Related to Regulated Products / ផ្ទុកឯកសារពាក់ព័ន្ធនឹងផលិតផលដែលត្រូវបានគ្រប់គ្រង', type=['pdf', 'jpg', 'png']),
+        lookup('ApplicantID', 'Select Applicant / ជ្រើសរើសអ្នកដាក់ពាក្យ', 'applicant', ('ApplicantID', 'LocalRepresentativeName')),
+        lookup('CompanyID', 'Select Company / ជ្រើសរើសក្រុមហ៊ុន', 'company', ('CompanyID', 'Name')),
+        lookup('ProductID', 'Select Product / ជ្រើសរើសផលិតផល', 'product', ('ProductID', 'ProductName')),
+        lookup('InforDetailOfModificationID', 'Select Information Detail of Modification / ជ្រើសរើសព័ត៌មានលម្អិតនៃការកែប្រែ', 'infor_detail_of_modification_part_or_electri_and_electro_pro', ('InforDetailOfModificationID', 'ItemNumber')),
+    ]),
+    'list_chemical_substance': Form('list_chemical_substance', key='list_chemical_substance_form', fields=[
+        text('ChemicalName', 'Chemical Name / ឈ្មោះសារធាតុគីមី'),
+        text('CommercialName', 'Commercial Name / ឈ្មោះពាណិជ្ជកម្ម'),
+        text('Recognition', 'Recognition / ការទទួលស្គាល់'),
+        text('Quantity', 'Quantity / បរិមាណ'),
+        text('StandardOfUsage', 'Standard of Usage / ស្តង់ដារនៃការប្រើប្រាស់'),
+        text('ReferenceChemical', 'Reference Chemical / សារធាតុគីមីយោង'),
+        text('SupportPurpose', 'Support Purpose / គោលបំណងគាំទ្រ'),
+        lookup('ApplicantID', 'Select Applicant / ជ្រើសរើសអ្នកដាក់ពាក្យ', 'applicant', ('ApplicantID', 'LocalRepresentativeName')),
+        lookup('CompanyID', 'Select Company / ជ្រើសរើសក្រុមហ៊ុន', 'company', ('CompanyID', 'Name')),
+        lookup('CompanySignatureID', 'Select Company Signature / ជ្រើសរើសហត្ថលេខាក្រុមហ៊ុន', 'company_signatur_and_stamp', ('CompanySignatureID', 'Name')),
+        lookup('ProductID', 'Select Product / ជ្រើសរើសផលិតផល', 'product', ('ProductID', 'ProductName')),
+    ]),
+    'previous_chemical_usage': Form('previous_chemical_usage', key='previous_chemical_usage_form', fields=[
+        text('ChemicalName', 'Chemical Name / ឈ្មោះសារធាតុគីមី'),
+        text('PreviousQuantity', 'Previous Quantity / បរិមាណមុន'),
+        text('PreviousImportLicenseNumber', 'Previous Import License Number / លេខអាជ្ញាប័ណ្ណនាំចូលមុន'),
+        date('PreviousImportDate', 'Previous Import Date / កាលបរិច្ឆេទនាំចូលមុន'),
+        lookup('ChemicalSubstanceID', 'Select Chemical Substance / ជ្រើសរើសសារធាតុគីមី', 'list_chemical_substance', ('ChemicalSubstanceID', 'ChemicalName')),
+    ]),
+    'appli_details_chemical': Form('appli_details_chemical', key='appli_details_chemical_form', fields=[
+        text('PortToPort', 'Port to Port / ព្រលានដល់ព្រលាន'),
+        text('PortToApplicantStoragePremise', 'Port to Applicant Storage Premise / ព្រលានដល់ទីតាំងផ្ទុករបស់អ្នកដាក់ពាក្យ'),
+        text('PortToJobSiteForImmediateUse', 'Port to Job Site for Immediate Use / ព្រលានដល់ទីតាំងការងារសម្រាប់ប្រើប្រាស់ភ្លាមៗ'),
+        text('PortToCustomerStoragePremise', 'Port to Customer Storage Premise / ព្រលានដល់ទីតាំងផ្ទុករបស់អតិថិជន'),
+        text('Other', 'Other Details / ព័ត៌មានលម្អិតផ្សេងទៀត'),
+        text('NameOfPremise', 'Name of Premise / ឈ្មោះទីតាំង'),
+        text('KindOfPremise', 'Kind of Premise / ប្រភេទទីតាំង'),
+        text('SizeCapacity', 'Size Capacity / សមត្ថភាពទំហំ'),
+        checkbox('EmergencyActionPlan', 'Emergency Action Plan / ផែនការសកម្មភាពបន្ទាន់', value=False, cast=int),
+        date('Date', 'Date / កាលបរិច្ឆេទ'),
+        lookup('CompanyID', 'Select Company / ជ្រើសរើសក្រុមហ៊ុន', 'company', ('CompanyID', 'Name')),
+        lookup('ChemicalSubstanceID', 'Select Chemical Substance / ជ្រើសរើសសារធាតុគីមី', 'list_chemical_substance', ('ChemicalSubstanceID', 'ChemicalName')),
+    ]),
+    'chemical_pro_plan_annual': Form('chemical_pro_plan_annual', key='chemical_pro_plan_annual_form', fields=[
+        text('ProductionQuantity', 'Production Quantity / បរិមាណផលិត'),
+        text('Recognition', 'Recognition / ការទទួលស្គាល់'),
+        date('StartDate', 'Start Date / កាលបរិច្ឆេទចាប់ផ្តើម'),
+        date('EndDate', 'End Date / កាលបរិច្ឆេទបញ្ចប់'),
+        lookup('CompanyID', 'Select Company / ជ្រើសរើសក្រុមហ៊ុន', 'company', ('CompanyID', 'Name')),
+    ]),
+    'declaration_buyer_importer': Form('declaration_buyer_importer', key='declaration_buyer_importer_form', fields=[
+        text('UsagePurpose', 'Usage Purpose / គោលបំណងប្រើប្រាស់'),
+        text('Name', 'Name / ឈ្មោះ'),
+        text('Position', 'Position / មុខតំណែង'),
+        text('StandForCompany', 'Stand For Company / តំណាងឱ្យក្រុមហ៊ុន'),
+        text_area('Address', 'Address / អាសយដ្ឋាន'),
+        text('Phone', 'Phone / លេខទូរស័ព្ទ'),
+        text('FaxNumber', 'Fax Number / លេខទូរសារ'),
+        text('Email', 'Email / អ៊ីមែល'),
+        date('Date', 'Date / កាលបរិច្ឆេទ'),
+        lookup('ChemicalSubstanceID', 'Select Chemical Substance / ជ្រើសរើសសារធាតុគីមី', 'list_chemical_substance', ('ChemicalSubstanceID', 'ChemicalName')),
+        lookup('CompanyID', 'Select Company / ជ្រើសរើសក្រុមហ៊ុន', 'company', ('CompanyID', 'Name')),
+    ]),
+    'doc_recog_standard_chemical_substance': Form('doc_recog_standard_chemical_substance', key='doc_recog_standard_chemical_substance_form', submit_label='បញ្ជូន | Submit', fields=[
+        upload('CompanyCharacteristics', 'ផ្ទុកឡើងលក្ខណៈពិសេសក្រុមហ៊ុន | Upload Company Characteristics', type=['pdf', 'jpg', 'png']),
+        upload('CompanyCertificationLetter', 'ផ្ទុកឡើងលិខិតវិញ្ញាបនបត្រក្រុមហ៊ុន | Upload Company Certification Letter', type=['pdf', 'jpg', 'png']),
+        upload('CompanyRegistrationCertificate', 'ផ្ទុកឡើងវិញ្ញាបនបត្រចុះបញ្ជីក្រុមហ៊ុន | Upload Company Registration Certificate', type=['pdf', 'jpg', 'png']),
+        upload('ValueAddedTaxRegistrationCertificate', 'ផ្ទុកឡើងវិញ្ញាបនបត្រចុះបញ្ជីអាករបន្ថែមតម្លៃ | Upload Value Added Tax Registration Certificate', type=['pdf', 'jpg', 'png']),
+        upload('ValidPatentsCopies', 'ផ្ទុកឡើងច្បាប់បង់ប្រាក់ដែលមានសុពលភាព | Upload Valid Patents Copies', type=['pdf', 'jpg', 'png']),
+        upload('FactoryPermitAndCertificate', 'ផ្ទុកឡើងអាជ្ញាប័ណ្ណនិងវិញ្ញាបនបត្ររោងចក្រ | Upload Factory Permit and Certificate', type=['pdf', 'jpg', 'png']),
+        upload('RightsTransferLetter', 'ផ្ទុកឡើងលិខិតផ្ទេរសិទ្ធិ | Upload Rights Transfer Letter', type=['pdf', 'jpg', 'png']),
+        upload('ChemicalSubstancesListAndValues', 'ផ្ទុកឡើងបញ្ជីនិងតម្លៃសារធាតុគីមី | Upload Chemical Substances List and Values', type=['pdf', 'jpg', 'png']),
+        upload('ApplicantIDOrPassportCopy', 'ផ្ទុកឡើងច្បាប់សម្គាល់អ្នកដាក់ពាក្យ ឬ លិខិតឆ្លងដែន | Upload Applicant ID or Passport Copy', type=['pdf', 'jpg', 'png']),
+        upload('MaterialSafetyDataSheet', 'ផ្ទុកឡើងទិន្នន័យសុវត្ថិភាពសម្ភារៈ | Upload Material Safety Data Sheet', type=['pdf', 'jpg', 'png']),
+        upload('AnalysisCertificateOrSample', 'ផ្ទុកឡើងវិញ្ញាបនបត្រវិភាគ ឬ សំណាក | Upload Analysis Certificate or Sample', type=['pdf', 'jpg', 'png']),
+        upload('PreviousImportationAndUsageReport', 'ផ្ទុកឡើងរបាយការណ៍នាំចូលនិងប្រើប្រាស់មុន | Upload Previous Importation and Usage Report', type=['pdf', 'jpg', 'png']),
+        upload('OtherDocumentsIfRequired', 'ផ្ទុកឡើងឯកសារផ្សេងៗ ប្រសិនបើត្រូវការ | Upload Other Documents if Required', type=['pdf', 'jpg', 'png']),
+        lookup('CompanyID', 'ជ្រើសរើសក្រុមហ៊ុន | Select Company', 'company', ('CompanyID', 'Name')),
+        lookup('ChemicalSubstanceID', 'ជ្រើសរើសសារធាតុគីមី | Select Chemical Substance', 'list_chemical_substance', ('ChemicalSubstanceID', 'ChemicalName')),
+    ]),
+    'pro_registration_license': Form('pro_registration_license', key='pro_registration_license_form', submit_label='បញ្ជូន (Submit)', fields=[
+        text('license_type', 'ប្រភេទអាជ្ញាប័ណ្ណ (License Type)'),
+        text('old_license_number_if_renewal', 'លេខអាជ្ញាប័ណ្ណចាស់ (ប្រសិនបើធ្វើឱ្យថ្មី) (Old License Number (if Renewal))'),
+        text('product_name', 'ឈ្មោះផលិតផល (Product Name)'),
+        text('capacity_weight', 'សមត្ថភាព/ទំងន់ (Capacity/Weight)'),
+        text('trademark', 'ឈ្មោះពាណិជ្ជសញ្ញា (Trademark)'),
+        text('standard_reference', 'យោងស្តង់ដារ (Standard Reference)'),
+        text_area('related_terms_conditions', 'លក្ខខណ្ឌនិងលក្ខខណ្ឌដែលពាក់ព័ន្ធ (Related Terms and Conditions)'),
+        lookup('CompanyID', 'ជ្រើសរើសក្រុមហ៊ុន (Select Company)', 'company', ('CompanyID', 'Name')),
+        lookup('CurrentAddressForApplicantID', 'ជ្រើសរើសអាសយដ្ឋាន (Select Address)', 'address', ('AddressID', 'officeAddress')),
+        lookup('ApplicantID', 'ជ្រើសរើសអ្នកដាក់ពាក្យ (Select Applicant)', 'applicant', ('ApplicantID', 'LocalRepresentativeName')),
+        lookup('ProductID', 'ជ្រើសរើសផលិតផល (Select Product)', 'product', ('ProductID', 'ProductName')),
+    ]),
+    'machinery_equipment_in_factory': Form('machinery_equipment_in_factory', key='machinery_equipment_in_factory_form', submit_label='បញ្ជូន (Submit)', fields=[
+        text('machinery_name', 'ឈ្មោះម៉ាស៊ីន (Machinery Name)'),
+        date('inspection_date', 'កាលបរិច្ឆេទត្រួតពិនិត្យ (Inspection Date)'),
+        text_area('additional_information', 'ព័ត៌មានបន្ថែម (Additional Information)'),
+        lookup('addressID', 'ជ្រើសរើសអាសយដ្ឋាន (Select Address)', 'address', ('AddressID', 'officeAddress')),
+        lookup('CompanyID', 'ជ្រើសរើសក្រុមហ៊ុន (Select Company)', 'company', ('CompanyID', 'Name')),
+        lookup('ProductRegistrationLicenseID', 'ជ្រើសរើសអាជ្ញាប័ណ្ណចុះបញ្ជីផលិតផល (Select Product Registration License)', 'pro_registration_license', ('ProductRegistrationLicenseID', 'product_name')),
+    ]),
+    'doc_pro_regis_license': Form('doc_pro_regis_license', key='doc_pro_regis_license_form', submit_label='បញ្ជូន (Submit)', fields=[
+        upload('declaration_of_factory', 'ផ្ទុកសេចក្តីប្រកាសរោងចក្រ (Upload Declaration of Factory)', type=['pdf', 'jpg', 'png']),
+        upload('product_label_compliance_cs001_2000', 'ផ្ទុកការអនុលោមស្លាកផលិតផល (CS001:2000) (Upload Product Label Compliance (CS001:2000))', type=['pdf', 'jpg', 'png']),
+        upload('product_analysis_certificate', 'ផ្ទុកវិញ្ញាបនបត្រវិភាគផលិតផល (Upload Product Analysis Certificate)', type=['pdf', 'jpg', 'png']),
+        upload('rights_transfer_letter', 'ផ្ទុកលិខិតផ្ទេរសិទ្ធិ (Upload Rights Transfer Letter)', type=['pdf', 'jpg', 'png']),
+        upload('other_documents', 'ផ្ទុកឯកសារផ្សេងទៀត (Upload Other Documents)', type=['pdf', 'jpg', 'png']),
+        lookup('CompanyID', 'ជ្រើសរើសក្រុមហ៊ុន (Select Company)', 'company', ('CompanyID', 'Name')),
+        lookup('ProductRegistrationLicenseID', 'ជ្រើសរើសអាជ្ញាប័ណ្ណចុះបញ្ជីផលិតផល (Select Product Registration License)', 'pro_registration_license', ('ProductRegistrationLicenseID', 'product_name')),
+        lookup('CompanySignatureID', 'ជ្រើសរើសហត្ថលេខាក្រុមហ៊ុន (Select Company Signature)', 'company_signatur_and_stamp', ('CompanySignatureID', 'Name')),
+    ]),
+    'production_chain': Form('production_chain', key='production_chain_form', submit_label='បញ្ជូន (Submit)', fields=[
+        upload('production_chain_diagram', 'ផ្ទុកគំនូសតាងខ្សែសង្វាក់ផលិតកម្ម (Upload Production Chain Diagram)', type=['pdf', 'jpg', 'png']),
+        date('date_of_diagram', 'កាលបរិច្ឆេទនៃគំនូសតាង (Date of Diagram)'),
+        text('ProducPorpuse', 'គោលបំណងផលិតកម្ម (Production Purpose)'),
+        date('IssuedDate', 'កាលបរិច្ឆេទចេញផ្សាយ (Issued Date)'),
+        lookup('ApplicantID', 'ជ្រើសរើសអ្នកដាក់ពាក្យ (Select Applicant)', 'applicant', ('ApplicantID', 'LocalRepresentativeName')),
+        lookup('CompanyID', 'ជ្រើសរើសក្រុមហ៊ុន (Select Company)', 'company', ('CompanyID', 'Name')),
+        lookup('addressID', 'ជ្រើសរើសអាសយដ្ឋាន (Select Address)', 'address', ('addressID', 'officeAddress')),
+        lookup('ProductRegistrationLicenseID', 'ជ្រើសរើសអាជ្ញាប័ណ្ណចុះបញ្ជីផលិតផល (Select Product Registration License)', 'pro_registration_license', ('ProductRegistrationLicenseID', 'product_name')),
+    ]),
+    'raw_materials': Form('raw_materials', key='raw_materials_form', submit_label='បញ្ជូន (Submit)', fields=[
+        text('material_name', 'ឈ្មោះសម្ភារៈ (Material Name)'),
+        text('trademark_used', 'ឈ្មោះពាណិជ្ជសញ្ញាដែលប្រើ (Trademark Used)'),
+        text('percentage_used_in_final_product', 'ភាគរយដែលប្រើក្នុងផលិតផលចុងក្រោយ (Percentage Used in Final Product)'),
+        text('additional_information', 'ព័ត៌មានបន្ថែម (Additional Information)'),
+        lookup('addressID', 'ជ្រើសរើសអាសយដ្ឋាន (Select Address)', 'address', ('addressID', 'officeAddress')),
+        lookup('CompanyID', 'ជ្រើសរើសក្រុមហ៊ុន (Select Company)', 'company', ('CompanyID', 'Name')),
+        lookup('ProductRegistrationLicenseID', 'ជ្រើសរើសអាជ្ញាប័ណ្ណចុះបញ្ជីផលិតផល (Select Product Registration License)', 'pro_registration_license', ('ProductRegistrationLicenseID', 'product_name')),
+    ]),
+    'doc_restricted_chemicals': Form('doc_restricted_chemicals', key='doc_restricted_chemicals_form', submit_label='បញ្ជូន | Submit', fields=[
+        upload('company_statute', 'ផ្ទុកឡើងច្បាប់ក្រុមហ៊ុន | Upload Company Statute', type=['pdf', 'jpg', 'png']),
+        upload('company_verification_letter', 'ផ្ទុកឡើងលិខិតផ្ទៀងផ្ទាត់ក្រុមហ៊ុន | Upload Company Verification Letter', type=['pdf', 'jpg', 'png']),
+        upload('company_registration_certificate', 'ផ្ទុកឡើងវិញ្ញាបនបត្រចុះបញ្ជីក្រុមហ៊ុន | Upload Company Registration Certificate', type=['pdf', 'jpg', 'png']),
+        upload('vat_registration_certificate', 'ផ្ទុកឡើងវិញ្ញាបនបត្រចុះបញ្ជីអាករបន្ថែមតម្លៃ | Upload VAT Registration Certificate', type=['pdf', 'jpg', 'png']),
+        upload('patent_card', 'ផ្ទុកឡើងកាតប៉ាតង់ | Upload Patent Card', type=['pdf', 'jpg', 'png']),
+        upload('previous_compliance_status', 'ផ្ទុកឡើងស្ថានភាពការស្របច្បាប់មុន | Upload Previous Compliance Status', type=['pdf', 'jpg', 'png']),
+        upload('OtherDocuments', 'ផ្ទុកឡើងឯកសារផ្សេងៗ | Upload Other Documents', type=['pdf', 'jpg', 'png']),
+        upload('rights_transfer_letter', 'ផ្ទុកឡើងលិខិតផ្ទេរសិទ្ធិ | Upload Rights Transfer Letter', type=['pdf', 'jpg', 'png']),
+        upload('factory_establishment_permission', 'ផ្ទុកឡើងការអនុញ្ញាតបង្កើតរោងចក្រ | Upload Factory Establishment Permission', type=['pdf', 'jpg', 'png']),
+        upload('craft_establishment_permission', 'ផ្ទុកឡើងការអនុញ្ញាតបង្កើតសិប្បកម្ម | Upload Craft Establishment Permission', type=['pdf', 'jpg', 'png']),
+        lookup('ApplicantID', 'ជ្រើសរើសអ្នកដាក់ពាក្យ | Select Applicant', 'applicant', ('ApplicantID', 'LocalRepresentativeName')),
+        lookup('CompanyID', 'ជ្រើសរើសក្រុមហ៊ុន | Select Company', 'company', ('CompanyID', 'Name')),
+        lookup('CompanySignatureID', 'ជ្រើសរើសហត្ថលេខាក្រុមហ៊ុន | Select Company Signature', 'company_signatur_and_stamp', ('CompanySignatureID', 'Name')),
+    ]),
+    'doc_represent_company': Form('doc_represent_company_electri_electro_or_spare_part_pro', key='doc_represent_company_form', submit_label='បញ្ជូន (Submit)', fields=[
+        upload('IndustrialAnouncementLatter', 'ផ្ទុកលិខិតប្រកាសឧស្សាហកម្ម (Upload Industrial Announcement Letter)', type=['pdf', 'jpg', 'png']),
+        upload('CertiComercialRegisOrequivalentlegaldoc', 'ផ្ទុកការចុះបញ្ជីពាណិជ្ជកម្ម ឬឯកសារច្បាប់ស្មើគ្នា (Upload Commercial Registration or Equivalent Legal Document)', type=['pdf', 'jpg', 'png']),
+        upload('NationalIDCardorPassport', 'ផ្ទុកអត្តសញ្ញាណប័ណ្ណជាតិ ឬលិខិតឆ្លងដែន (Upload National ID Card or Passport)', type=['pdf', 'jpg', 'png']),
+        upload('Otherrelateddocuments', 'ផ្ទុកឯកសារដែលពាក់ព័ន្ធផ្សេងទៀត (Upload Other Related Documents)', type=['pdf', 'jpg', 'png']),
+        lookup('ApplicantID', 'ជ្រើសរើសអ្នកដាក់ពាក្យ (Select Applicant)', 'applicant', ('ApplicantID', 'LocalRepresentativeName')),
+        lookup('CompanyID', 'ជ្រើសរើសក្រុមហ៊ុន (Select Company)', 'company', ('CompanyID', 'Name')),
+        lookup('ProductID', 'ជ្រើសរើសផលិតផល (Select Product)', 'product', ('ProductID', 'ProductName')),
+        lookup('CompanySignatureID', 'ជ្រើសរើសហត្ថលេខាក្រុមហ៊ុន (Select Company Signature)', 'company_signatur_and_stamp', ('CompanySignatureID', 'Name')),
+    ]),
+    'doc_establishment_factory': Form('doc_establishment_factory', key='doc_establishment_factory_form', submit_label='បញ្ជូន (Submit)', fields=[
+        upload('3photoOfFactoryOwner4x6', 'ផ្ទុករូបថត 4x6 របស់ម្ចាស់រោងចក្រ (Upload 4x6 Photo of Factory Owner)', type=['jpg', 'png']),
+        upload('NationalIDCardorPassport', 'ផ្ទុកអត្តសញ្ញាណប័ណ្ណជាតិ ឬលិខិតឆ្លងដែន (Upload National ID Card or Passport)', type=['pdf', 'jpg', 'png']),
+        upload('Copyofcorporatestatute', 'ផ្ទុកច្បាប់ចម្លងនៃច្បាប់សហគ្រាស (Upload Copy of Corporate Statute)', type=['pdf', 'jpg', 'png']),
+        upload('CopyLatterOfcomercialRigisteration', 'ផ្ទុកច្បាប់ចម្លងនៃលិខិតចុះបញ្ជីពាណិជ្ជកម្ម (Upload Copy Letter of Commercial Registration)', type=['pdf', 'jpg', 'png']),
+        upload('ConstructionPermitFromAuthority', 'ផ្ទុកការអនុញ្ញាតសាងសង់ពីអាជ្ញាធរ (Upload Construction Permit from Authority)', type=['pdf', 'jpg', 'png']),
+        lookup('ApplicantID', 'ជ្រើសរើសអ្នកដាក់ពាក្យ (Select Applicant)', 'applicant', ('ApplicantID', 'LocalRepresentativeName')),
+        lookup('CompanyID', 'ជ្រើសរើសក្រុមហ៊ុន (Select Company)', 'company', ('CompanyID', 'Name')),
+        lookup('FactoryID', 'ជ្រើសរើសរោងចក្រ (Select Factory)', 'factory', ('FactoryID', 'Name')),
+    ]),
+    'infor_raw_material': Form('infor_raw_material', key='infor_raw_material_form', submit_label='បញ្ជូន (Submit)', fields=[
+        text('Description_RawMaterialcol', 'ការពិពណ៌នាសម្ភារៈដើម (Description of Raw Material)'),
+        text('Unit', 'ឯកតា (Unit)'),
+        text('Domstic_Quantity', 'បរិមាណក្នុងស្រុក (Domestic Quantity)'),
+        text('Domstic_Amount', 'ចំនួនទឹកប្រាក់ក្នុងស្រុក (Domestic Amount)'),
+        text('Import_Quantity', 'បរិមាណនាំចូល (Import Quantity)'),
+        text('Import_Amount', 'ចំនួនទឹកប្រាក់នាំចូល (Import Amount)'),
+        lookup('FactoryID', 'ជ្រើសរើសរោងចក្រ (Select Factory)', 'factory', ('FactoryID', 'Name')),
+        lookup('ChemicalSubstanceID', 'ជ្រើសរើសសារធាតុគីមី (Select Chemical Substance)', 'list_chemical_substance', ('ChemicalSubstanceID', 'ChemicalName')),
+    ]),
+    'infor_invest_pro_safety_and_sanitary_system': Form('infor_invest_pro_safety_and_sanitary_system', key='infor_invest_pro_safety_and_sanitary_system_form', submit_label='បញ្ជូន (Submit)', fields=[
+        text('Totalsurfacearea', 'ផ្ទៃសរុប (Total Surface Area)'),
+        text('Descriptionsurroundingenvironment', 'ការពិពណ៌នាពីបរិយាកាសជុំវិញ (Description of Surrounding Environment)'),
+        lookup('FactoryID', 'ជ្រើសរើសរោងចក្រ (Select Factory)', 'factory', ('FactoryID', 'Name')),
+    ]),
+    'doc_for_inves_project_pro_safety': Form('doc_for_inves_project_pro_safety', key='doc_for_inves_project_pro_safety_form', submit_label='បញ្ជូន (Submit)', fields=[
+        upload('ApplicationForm', 'ផ្ទុកបែបបទដាក់ពាក្យ (Upload Application Form)', type=['pdf', 'jpg', 'png']),
+        upload('Factory_permit_Authority', 'ផ្ទុកការអនុញ្ញាតរោងចក្រពីអាជ្ញាធរ (Upload Factory Permit from Authority)', type=['pdf', 'jpg', 'png']),
+        upload('LeaseAgreement', 'ផ្ទុកកិច្ចសន្យាធ្វើច្បាប់ (Upload Lease Agreement)', type=['pdf', 'jpg', 'png']),
+        upload('LandTitle', 'ផ្ទុកប្លង់ដី (Upload Land Title)', type=['pdf', 'jpg', 'png']),
+        upload('Comercial_RegisterationMoc', 'ផ្ទុកការចុះបញ្ជីពាណិជ្ជកម្ម (Upload Commercial Registration)', type=['pdf', 'jpg', 'png']),
+        upload('Statute', 'ផ្ទុកច្បាប់សហគ្រាស (Upload Statute)', type=['pdf', 'jpg', 'png']),
+        upload('FeasibilityStudy', 'ផ្ទុកការសិក្សាអនុវត្ត (Upload Feasibility Study)', type=['pdf', 'jpg', 'png']),
+        upload('Factory_Signed_Board', 'ផ្ទុកផ្ទាំងហត្ថលេខារបស់រោងចក្រ (Upload Factory Signed Board)', type=['pdf', 'jpg', 'png']),
+        upload('IDOrPassport', 'ផ្ទុកអត្តសញ្ញាណប័ណ្ណ ឬលិខិតឆ្លងដែន (Upload ID or Passport)', type=['pdf', 'jpg', 'png']),
+        upload('Owner_Factory_photo3_4x6', 'ផ្ទុករូបថតម្ចាស់រោងចក្រ (3x4) (Upload Owner Factory Photo (3x4))', type=['pdf', 'jpg', 'png']),
+        upload('Lab_Test', 'ផ្ទុកលទ្ធផលតេស្តមន្ទីរពិសោធន៍ (Upload Lab Test)', type=['pdf', 'jpg', 'png']),
+        upload('Criminal_Police_Record', 'ផ្ទុកប្រវត្តិឧក្រិដ្ឋកម្មនៃប៉ូលិស (Upload Criminal Police Record)', type=['pdf', 'jpg', 'png']),
+        lookup('FactoryID', 'ជ្រើសរើសរោងចក្រ (Select Factory)', 'factory', ('FactoryID', 'Name')),
+        lookup('CompanyID', 'ជ្រើសរើសក្រុមហ៊ុន (Select Company)', 'company', ('CompanyID', 'Name')),
+    ]),
+    'doc_permit_small_medium_enterprises_handicraft': Form('doc_permit_smallmediumenterprices_handicraft', key='doc_permit_small_medium_enterprises_handicraft_form', submit_label='បញ្ជូន (Submit)', fields=[
+        upload('ID_Or_passport', 'ផ្ទុកអត្តសញ្ញាណប័ណ្ណ ឬលិខិតឆ្លងដែន (Upload ID or Passport)', type=['pdf', 'jpg', 'png']),
+        upload('LocationMap_Architecture_layouts_process_flow', 'ផ្ទុកផែនទីទីតាំង/ប្លង់ស្ថាបត្យកម្ម/លំហូរដំណើរការ (Upload Location Map/Architecture Layouts/Process Flow)', type=['pdf', 'jpg', 'png']),
+        upload('Latter_local_Authority', 'ផ្ទុកលិខិតពីអាជ្ញាធរមូលដ្ឋាន (Upload Letter from Local Authority)', type=['pdf', 'jpg', 'png']),
+        lookup('ApplicantID', 'ជ្រើសរើសអ្នកដាក់ពាក្យ (Select Applicant)', 'applicant', ('ApplicantID', 'LocalRepresentativeName')),
+        lookup('CompanyID', 'ជ្រើសរើសក្រុមហ៊ុន (Select Company)', 'company', ('CompanyID', 'Name')),
+        lookup('FactoryID', 'ជ្រើសរើសរោងចក្រ (Select Factory)', 'factory', ('FactoryID', 'Name')),
+    ]),
+    'infor_factory_manager': Form('infor_factory_manager', key='infor_factory_manager_form', submit_label='បញ្ជូន (Submit)', fields=[
+        text('name', 'ឈ្មោះ (Name)'),
+        text('Nationality', 'សញ្ជាតិ (Nationality)'),
+        choice('gender', 'ភេទ (Gender)', ['ប្រុស (Male)', 'ស្រី (Female)', 'ផ្សេងទៀត (Other)']),
+        text('age', 'អាយុ (Age)'),
+        text('phone', 'លេខទូរស័ព្ទ (Phone)'),
+        text('professional', 'វិជ្ជាជីវៈ (Professional)'),
+        text_area('expertiseworkingexperience_related_proposed_works', 'ជំនាញ/បទពិសោធន៍ការងារពាក់ព័ន្ធនឹងការងារដែលបានស្នើសុំ (Expertise/Working Experience Related to Proposed Works)'),
+        text('Number_employee_production_section', 'ចំនួននិយោជិតក្នុងផ្នែកផលិតកម្ម (Number of Employees in Production Section)'),
+        text('Number_employee_service_section', 'ចំនួននិយោជិតក្នុងផ្នែកសេវាកម្ម (Number of Employees in Service Section)'),
+        text('Number_employee_other_section', 'ចំនួននិយោជិតក្នុងផ្នែកផ្សេងទៀត (Number of Employees in Other Section)'),
+        text('Total_employees', 'ចំនួននិយោជិតសរុប (Total Employees)'),
+        lookup('FactoryID', 'ជ្រើសរើសរោងចក្រ (Select Factory)', 'factory', ('FactoryID', 'Name')),
+    ]),
+    'infor_quality_controlprogram': Form('infor_quality_controlprogram', key='infor_quality_controlprogram_form', submit_label='បញ្ជូន (Submit)', fields=[
+        text_area('DescribeprocessingFlow', 'ពិពណ៌នាអំពីលំហូរដំណើរការ (Describe Processing Flow)'),
+        lookup('FactoryID', 'ជ្រើសរើសរោងចក្រ (Select Factory)', 'factory', ('FactoryID', 'Name')),
+    ]),
+    'infor_investment_asset': Form('infor_investment_asset', key='infor_investment_asset_form', submit_label='បញ្ជូន (Submit)', fields=[
+        text('Total_Estimated_values_machinery_facilities', 'តម្លៃសរុបប៉ាន់ស្មាននៃគ្រឿងម៉ាស៊ីននិងសម្ភារៈ (Total Estimated Values of Machinery & Facilities)'),
+        text('Total_Estimated_values_vehicle_transpotation', 'តម្លៃសរុបប៉ាន់ស្មាននៃយានជំនិះនិងការដឹកជញ្ជូន (Total Estimated Values of Vehicle & Transportation)'),
+        text('Total_estimated_values_building', 'តម្លៃសរុបប៉ាន់ស្មាននៃអគារ (Total Estimated Values of Building)'),
+        text('Total_estimate_values_other_fixed_assets', 'តម្លៃសរុបប៉ាន់ស្មាននៃទ្រព្យសកម្មថេរផ្សេងទៀត (Total Estimated Values of Other Fixed Assets)'),
+        text('Total_estimated_values_working_capital', 'តម្លៃសរុបប៉ាន់ស្មាននៃដើមទុនប្រតិបត្តិការ (Total Estimated Values of Working Capital)'),
+        text('Total_estimated_values_investment', 'តម្លៃសរុបប៉ាន់ស្មាននៃការវិនិយោគ (Total Estimated Values of Investment)'),
+        text('Souce_Investment', 'ប្រភពនៃការវិនិយោគ (Source of Investment)'),
+        text('Estimated_percentage', 'ភាគរយប៉ាន់ស្មាន (Estimated Percentage)'),
+        lookup('FactoryID', 'ជ្រើសរើសរោងចក្រ (Select Factory)', 'factory', ('FactoryID', 'Name')),
+    ]),
+    'infor_machinery_facilities': Form('infor_machinery_facilities', key='infor_machinery_facilities_form', submit_label='បញ្ជូន (Submit)', fields=[
+        text('List_Machinery_facilities', 'បញ្ជីគ្រឿងម៉ាស៊ីននិងសម្ភារៈ (List of Machinery Facilities)'),
+        text('Unit', 'ឯកតា (Unit)'),
+        text('Quatity', 'បរិមាណ (Quantity)'),
+        text('Amount', 'ចំនួនទឹកប្រាក់ (Amount)'),
+        text('Domestic', 'ក្នុងស្រុក (Domestic)'),
+        text('ImportFrom', 'នាំចូលពី (Import From)'),
+        lookup('FactoryID', 'ជ្រើសរើសរោងចក្រ (Select Factory)', 'factory', ('FactoryID', 'Name')),
+    ]),
+    'infor_planed_product_output': Form('infor_planed_product_output', key='infor_planed_product_output_form', submit_label='បញ្ជូន (Submit)', fields=[
+        text('Description_Products', 'ការពិពណ៌នាផលិតផល (Description of Products)'),
+        text('Unit', 'ឯកតា (Unit)'),
+        text('Quantity_firs_year', 'បរិមាណសម្រាប់ឆ្នាំដំបូង (Quantity for First Year)'),
+        text('Amount_first_year', 'ចំនួនទឹកប្រាក់សម្រាប់ឆ្នាំដំបូង (Amount for First Year)'),
+        text('Domestic_percentage_market', 'ភាគរយទីផ្សារក្នុងស្រុក (Domestic Market Percentage)'),
+        text('Export_percentage_market', 'ភាគរយទីផ្សារនាំចេញ (Export Market Percentage)'),
+        text('Quantity_full_capacity', 'បរិមាណនៅសមត្ថភាពពេញលេញ (Quantity at Full Capacity)'),
+        text('Amount_full_capacity', 'ចំនួនទឹកប្រាក់នៅសមត្ថភាពពេញលេញ (Amount at Full Capacity)'),
+        lookup('FactoryID', 'ជ្រើសរើសរោងចក្រ (Select Factory)', 'factory', ('FactoryID', 'Name')),
+    ]),
+    'infor_product_waste': Form('infor_product_waste', key='infor_product_waste_form', submit_label='បញ្ជូន (Submit)', fields=[
+        text('Solid_waste', 'កាកសំណល់រឹង (Solid Waste)'),
+        text('Liquid_waste', 'កាកសំណល់រាវ (Liquid Waste)'),
+        text('Emission_waste', 'កាកសំណល់បញ្ចេញ (Emission Waste)'),
+        lookup('FactoryID', 'ជ្រើសរើសរោងចក្រ (Select Factory)', 'factory', ('FactoryID', 'Name')),
+    ]),
+    'applic_calibration_metrology': Form('applic_calibration_metrology', key='applic_calibration_metrology_form', submit_label='បញ្ជូន (Submit)', fields=[
+        text_area('RequestDetails', 'សេចក្តីលម្អិតនៃសំណើ (Request Details)'),
+        lookup('addresstID', 'ជ្រើសរើសអាសយដ្ឋាន (Select Address)', 'address', ('AddressID', 'officeAddress')),
+        lookup('FactoryID', 'ជ្រើសរើសរោងចក្រ (Select Factory)', 'factory', ('FactoryID', 'Name')),
+        lookup('CompanyID', 'ជ្រើសរើសក្រុមហ៊ុន (Select Company)', 'company', ('CompanyID', 'Name')),
+        lookup('PersonalInforForApplicantID', "ជ្រើសរើសព័ត៌មានផ្ទាល់ខ្លួនរបស់អ្នកដាក់ពាក្យ (Select Applicant's Personal Information)", 'personal_infor_for_applicant', ('PersonalInforForApplicantID', 'KhmerName')),
+        lookup('ProductID', 'ជ្រើសរើសផលិតផល (Select Product)', 'product', ('ProductID', 'ProductName')),
+    ]),
+    'doc_applic_metrology_calibration': Form('doc_applic_metrology_calibration', key='doc_applic_metrology_calibration_form', submit_label='Submit (បញ្ជូន)', fields=[
+        upload('Statute_technical', 'Statute Technical (ច្បាប់បច្ចេកទេស)', type=['pdf', 'jpg', 'png']),
+        upload('Transfer_latter', 'Transfer Letter (លិខិតផ្ទេរ)', type=['pdf', 'jpg', 'png']),
+        upload('ID_passport_card', 'ID Passport Card (អត្តសញ្ញាណប័ណ្ណ ឬ លិខិតឆ្លងដែន)', type=['pdf', 'jpg', 'png']),
+        lookup('ApplicationMetrologyID', 'Select Application Metrology (ជ្រើសពាក្យស្នើសុំមាត្រដ្ឋាន)', 'applic_calibration_metrology', ('ApplicationMetrologyID',), display='Application ID: {0} (លេខសម្គាល់ពាក្យស្នើសុំ: {0})'),
+    ]),
+    'applic_license_repair_metrology': Form('applic_license_repair_metrology', key='applic_license_repair_metrology_form', submit_label='បញ្ជូន (Submit)', fields=[
+        text_area('RequestDetails', 'សេចក្តីលម្អិតនៃសំណើ (Request Details)'),
+        lookup('addresstID', 'ជ្រើសរើសអាសយដ្ឋាន (Select Address)', 'address', ('AddressID', 'OfficeAddress')),
+        lookup('FactoryID', 'ជ្រើសរើសរោងចក្រ (Select Factory)', 'factory', ('FactoryID', 'Name')),
+        lookup('CompanyID', 'ជ្រើសរើសក្រុមហ៊ុន (Select Company)', 'company', ('CompanyID', 'Name')),
+        lookup('PersonalInforForApplicantID', 'ជ្រើសរើសព័ត៌មានផ្ទាល់ខ្លួនរបស់អ្នកដាក់ពាក្យ (Select Applicant)', 'personal_infor_for_applicant', ('PersonalInforForApplicantID',), display='Applicant ID: {0}'),
+        lookup('ProductID', 'ជ្រើសរើសផលិតផល (Select Product)', 'product', ('ProductID', 'ProductName')),
+    ]),
+    'applic_metro_verify': Form('applic_metro_verify', key='applic_metro_verify_form', submit_label='បញ្ជូន (Submit)', fields=[
+        text_area('RequestDetails', 'សេចក្តីលម្អិតនៃសំណើ (Request Details)'),
+        lookup('addressID', 'ជ្រើសរើសអាសយដ្ឋាន (Select Address)', 'address', ('AddressID', 'OfficeAddress')),
+        lookup('FactoryID', 'ជ្រើសរើសរោងចក្រ (Select Factory)', 'factory', ('FactoryID', 'Name')),
+        lookup('CompanyID', 'ជ្រើសរើសក្រុមហ៊ុន (Select Company)', 'company', ('CompanyID', 'Name')),
+        lookup('PersonalInforForApplicantID', 'ជ្រើសរើសព័ត៌មានផ្ទាល់ខ្លួនរបស់អ្នកដាក់ពាក្យ (Select Applicant)', 'personal_infor_for_applicant', ('PersonalInforForApplicantID',), display='Applicant ID: {0}'),
+    ]),
+    'applic_certific_recog_metro_expertise': Form('applic_certific_recog_metro_expertise', key='applic_certific_recog_metro_expertise_form', submit_label='បញ្ជូន (Submit)', fields=[
+        upload('Photo_application', 'ផ្ទុករូបថតសម្រាប់ពាក្យ (Upload Photo Application)', type=['jpg', 'png', 'jpeg']),
+        text_area('RequestDetails', 'សេចក្តីលម្អិតនៃសំណើ (Request Details)'),
+        text('ForeignLanguages', 'ភាសាបរទេស (Foreign Languages)'),
+        text('GeneralEducationLevel', 'កម្រិតការអប់រំទូទៅ (General Education Level)'),
+        text_area('WorkHistory', 'ប្រវត្តិការងារ (Work History)'),
+        lookup('FactoryID', 'ជ្រើសរើសរោងចក្រ (Select Factory)', 'factory', ('FactoryID', 'Name')),
+        lookup('CompanyID', 'ជ្រើសរើសក្រុមហ៊ុន (Select Company)', 'company', ('CompanyID', 'Name')),
+        lookup('addressID', 'ជ្រើសរើសអាសយដ្ឋាន (Select Address)', 'address', ('AddressID', 'OfficeAddress')),
+        lookup('PersonalInforForApplicantID', 'ជ្រើសរើសព័ត៌មានផ្ទាល់ខ្លួនរបស់អ្នកដាក់ពាក្យ (Select Applicant)', 'personal_infor_for_applicant', ('PersonalInforForApplicantID',), display='Applicant ID: {0}'),
+    ]),
+    'applic_checking_importpermmetro_equipment': Form('applic_checking_importpermmetro_equipment', key='applic_checking_importpermmetro_equipment_form', submit_label='បញ្ជូន (Submit)', fields=[
+        text_area('RequestDetails', 'សេចក្តីលម្អិតនៃសំណើ (Request Details)'),
+        lookup('FactoryID', 'ជ្រើសរើសរោងចក្រ (Select Factory)', 'factory', ('FactoryID', 'Name')),
+        lookup('CompanyID', 'ជ្រើសរើសក្រុមហ៊ុន (Select Company)', 'company', ('CompanyID', 'Name')),
+        lookup('addressID', 'ជ្រើសរើសអាសយដ្ឋាន (Select Address)', 'address', ('addressID', 'officeAddress')),
+        lookup('PersonalInforForApplicantID', 'ជ្រើសរើសព័ត៌មានផ្ទាល់ខ្លួនរបស់អ្នកដាក់ពាក្យ (Select Applicant)', 'personal_infor_for_applicant', ('PersonalInforForApplicantID',), display='Applicant ID: {0}'),
+    ]),
+    'applic_prototype_approval_certificate': Form('applic_prototype_approval_certificate', key='applic_prototype_approval_certificate_form', submit_label='បញ្ជូន (Submit)', fields=[
+        text_area('RequestDetails', 'សេចក្តីលម្អិតនៃសំណើ (Request Details)'),
+        lookup('FactoryID', 'ជ្រើសរើសរោងចក្រ (Select Factory)', 'factory', ('FactoryID', 'Name')),
+        lookup('CompanyID', 'ជ្រើសរើសក្រុមហ៊ុន (Select Company)', 'company', ('CompanyID', 'Name')),
+        lookup('addressID', 'ជ្រើសរើសអាសយដ្ឋាន (Select Address)', 'address', ('addressID', 'officeAddress')),
+        lookup('PersonalInforForApplicantID', 'ជ្រើសរើសព័ត៌មានផ្ទាល់ខ្លួនរបស់អ្នកដាក់ពាក្យ (Select Applicant)', 'personal_infor_for_applicant', ('PersonalInforForApplicantID',), display='Applicant ID: {0}'),
+    ]),
+    'applic_certific_recognition_internal_indu': Form('applic_certific_recognition_internal_indu', key='applic_certific_recognition_internal_indu_form', submit_label='បញ្ជូន (Submit)', fields=[
+        text_area('RequestDetails', 'សេចក្តីលម្អិតនៃសំណើ (Request Details)'),
+        lookup('FactoryID', 'ជ្រើសរើសរោងចក្រ (Select Factory)', 'factory', ('FactoryID', 'Name')),
+        lookup('CompanyID', 'ជ្រើសរើសក្រុមហ៊ុន (Select Company)', 'company', ('CompanyID', 'Name')),
+        lookup('addressID', 'ជ្រើសរើសអាសយដ្ឋាន (Select Address)', 'address', ('addressID', 'officeAddress')),
+        lookup('PersonalInforForApplicantID', 'ជ្រើសរើសព័ត៌មានផ្ទាល់ខ្លួនរបស់អ្នកដាក់ពាក្យ (Select Applicant)', 'personal_infor_for_applicant', ('PersonalInforForApplicantID',), display='Applicant ID: {0}'),
+    ]),
+    'doc_applic_licese_cam_metrotrand': Form('doc_applic_licese_cam_metrotrand', key='doc_applic_licese_cam_metrotrand_form', submit_label='បញ្ជូន (Submit)', fields=[
+        upload('Metrology_Registration_certificate', 'វិញ្ញាបនបត្រចុះឈ្មោះវាស់វែង (Metrology Registration Certificate)', type=['pdf', 'jpg', 'png']),
+        upload('Statute_campany', 'ច្បាប់ក្រុមហ៊ុន (Statute Company)', type=['pdf', 'jpg', 'png']),
+        upload('Expired_License_use_Cambodia_metrology', 'អាជ្ញាប័ណ្ណផុតកំណត់ប្រើប្រាស់វាស់វែងកម្ពុជា (Expired License Use Cambodia Metrology)', type=['pdf', 'jpg', 'png']),
+        upload('Inspection_Verification_Certificate', 'វិញ្ញាបនបត្រត្រួតពិនិត្យ (Inspection Verification Certificate)', type=['pdf', 'jpg', 'png']),
+        lookup('ApplicationMetrologyID', 'ជ្រើសរើសលេខសម្គាល់កម្មវិធីវាស់វែង (Select Application Metrology)', 'applic_calibration_metrology', ('ApplicationMetrologyID',), display='Application ID: {0}'),
+    ]),
+    'metrology_instrument': Form('metrology_intrument', key='metrology_instrument_form', submit_label='បញ្ជូន | Submit', fields=[
+        text('Intrument_name', 'ឈ្មោះឧបករណ៍ | Instrument Name'),
+        text('Serial_number', 'លេខសេរី | Serial Number'),
+        text('Calibratio_level', 'កម្រិតកាលីប្រេស្យិន | Calibration Level'),
+        text('Calibration_Number', 'លេខកាលីប្រេស្យិន | Calibration Number'),
+        text_area('Other', 'ព័ត៌មានផ្សេងទៀត | Other Information'),
+        text('Calibration_certificate_number', 'លេខវិញ្ញាបនបត្រកាលីប្រេស្យិន | Calibration Certificate Number'),
+        lookup('ProductID', 'ជ្រើសរើសផលិតផល | Select Product', 'product', ('ProductID', 'ProductName'), search='Product / ផលិតផល', key='metrology_instrument_product'),
+        lookup('ApplicationMetrologyID', 'ជ្រើសរើសកម្មវិធីវាស់វែង | Select Application Metrology', 'applic_calibration_metrology', ('ApplicationMetrologyID',), display='Application ID: {0}', search='Application Metrology ID / លេខកម្មវិធីវាស់វែង', key='metrology_instrument_application'),
+        lookup('licenserepair_metrologyId', 'ជ្រើសរើសអាជ្ញាប័ណ្ណជួសជុល | Select License Repair Metrology', 'applic_license_repair_metrology', ('licenserepair_metrologyId',), display='Application License Repair Metrology ID: {0}'),
+        lookup('Applicatio_Prototype_Approval_CertificateID', 'ជ្រើសរើសការអនុម័តគំរូ | Select Prototype Approval', 'applic_prototype_approval_certificate', ('Applicatio_Prototype_Approval_CertificateID',), display='Application Prototype Approval Certificate ID: {0}'),
+        lookup('idApplicationCertificateRecognitionInternal', 'ជ្រើសរើសការស្គាល់ផ្ទៃក្នុង | Select Recognition Internal', 'applic_certific_recognition_internal_indu', ('idApplicationCertificateRecognitionInternal',), display='Application Certificate Recognition Internal Industry ID: {0}'),
+        lookup('DocAppliLiceUseCamMetroTrandID', 'ជ្រើសរើសអាជ្ញាប័ណ្ណប្រើប្រាស់ | Select License Metrology Using in Cambodia', 'doc_applic_licese_cam_metrotrand', ('DocAppliLiceUseCamMetroTrandID',), display='Document Application License Metrology Using in Cambodia ID: {0}'),
+        lookup('ApplicationImportPermissionMetrologyEquipmentID', 'ជ្រើសរើសអនុញ្ញាតនាំចូល | Select License', 'applic_checking_importpermmetro_equipment', ('ApplicationImportPermissionMetrologyEquipmentID',), display='Application Checking Import Permission Metrology Equipment ID: {0}'),
+    ]),
+    'certificate_calibration': Form('certificate_calibration', key='certificate_calibration_form', submit_label='បញ្ជូន (Submit)', fields=[
+        number('Result_Calibration_No', 'លេខលទ្ធផលការវាស់វែងត្រឹមត្រូវ (Result Calibration Number)', min_value=0, step=1),
+        lookup('ApplicationMetrologyID', 'ជ្រើសរើសលេខសម្គាល់កម្មវិធីវាស់វែង (Select Application Metrology)', 'applic_calibration_metrology', ('ApplicationMetrologyID',), display='Application Metrology ID: {0}'),
+        lookup('licenserepair_metrologyId', 'ជ្រើសរើសអាជ្ញាប័ណ្ណជួសជុល (Select Repair License)', 'applic_license_repair_metrology', ('licenserepair_metrologyId',), display='Repair License ID: {0}'),
+    ]),
+    'instrument_infor': Form('intrument_infor', key='instrument_infor_form', submit_label='បញ្ជូន (Submit)', fields=[
+        text('Product_capability', 'សមត្ថភាពផលិតផល (Product Capability)'),
+        text('Produce_Country', 'ប្រទេសផលិត (Country of Production)'),
+        text('Location_using', 'ទីតាំងប្រើប្រាស់ (Location of Use)'),
+        lookup('idMetrologyIntrument', 'ជ្រើសរើសឧបករណ៍វាស់វែង (Select Metrology Instrument)', 'metrology_intrument', ('idMetrologyIntrument',), display='Instrument ID: {0}'),
+    ]),
+    'instrument_detail_repair': Form('intrument_detail_repair', key='instrument_detail_repair_form', submit_label='បញ្ជូន (Submit)', fields=[
+        text('NameMetrologylist', 'ឈ្មោះបញ្ជីឧបករណ៍វាស់វែង (Name of Metrology List)'),
+        text('Quantity', 'បរិមាណ (Quantity)'),
+        text('Code_number', 'លេខកូដ (Code Number)'),
+        text('Condition_Company', 'លក្ខខណ្ឌ (Condition)'),
+        text_area('Description_Technical', 'ការពិពណ៌នាលក្ខណៈបច្ចេកទេស (Technical Specifications Description)'),
+        lookup('licenserepair_metrologyId', 'ជ្រើសរើសអាជ្ញាប័ណ្ណជួសជុល (Select Repair License)', 'applic_license_repair_metrology', ('licenserepair_metrologyId',), display='Repair License ID: {0}'),
+        lookup('idMetrologyIntrument', 'ជ្រើសរើសឧបករណ៍វាស់វែង (Select Metrology Instrument)', 'metrology_intrument', ('idMetrologyIntrument',), display='Instrument ID: {0}'),
+    ]),
+    'result_of_calibration': Form('result_of_calibration', key='result_of_calibration_form', submit_label='បញ្ជូន (Submit)', fields=[
+        text('Model', 'ម៉ូដែល (Model)'),
+        text('Method_calibration', 'វិធីសាស្រ្តវាស់វែងត្រឹមត្រូវ (Method of Calibration)'),
+        date('accept_date', 'កាលបរិច្ឆេទទទួលយក (Accept Date)'),
+        date('date_calibration', 'កាលបរិច្ឆេទវាស់វែងត្រឹមត្រូវ (Date of Calibration)', min_value=datetime(1990, 1, 1)),
+        date('date_recalibration', 'កាលបរិច្ឆេទវាស់វែងត្រឹមត្រូវម្តងទៀត (Date of Recalibration)', min_value=datetime(1990, 1, 1)),
+        lookup('ProductID', 'ជ្រើសរើសផលិតផល (Select Product)', 'product', ('ProductID', 'ProductName')),
+        lookup('idMetrologyIntrument', 'ជ្រើសរើសឧបករណ៍វាស់វែង (Select Metrology Instrument)', 'metrology_intrument', ('idMetrologyIntrument',), display='Instrument ID: {0}'),
+        lookup('idIntrumentDetailforRepair', 'ជ្រើសរើសព័ត៌មានលម្អិតអំពីការជួសជុលឧបករណ៍ (Select Instrument Detail for Repair)', 'intrument_detail_repair', ('idIntrumentDetailforRepair',), display='Repair Detail ID: {0}'),
+    ]),
+    'business_infor': Form('business_infor', key='business_infor_form', submit_label='Submit (បញ្ជូន)', fields=[
+        text('Type_Business', 'Type of Business (ប្រភេទអាជីវកម្ម)'),
+        text_area('Business_Characteristics', 'Business Characteristics (លក្ខណៈពិសេសអាជីវកម្ម)'),
+        text('Initial_Capital', 'Initial Capital (ដើមទុនដំបូង)'),
+        text('Business_Location_size', 'Business Location Size (ទំហំទីតាំងអាជីវកម្ម)'),
+        lookup('idIntrumentInfor', 'Select Instrument Information (ជ្រើសព័ត៌មានឧបករណ៍)', 'intrument_infor', ('idIntrumentInfor',), display='Instrument Information ID: {0} (លេខសម្គាល់ព័ត៌មានឧបករណ៍: {0})'),
+        lookup('licenserepair_metrologyId', 'Select License Repair (ជ្រើសការជួសជុលអាជ្ញាប័ណ្ណ)', 'applic_license_repair_metrology', ('licenserepair_metrologyId',), display='License Repair ID: {0} (លេខសម្គាល់ការជួសជុលអាជ្ញាប័ណ្ណ: {0})'),
+    ]),
+    'workforce': Form('workforce', key='workforce_form', submit_label='Submit (បញ្ជូន)', fields=[
+        text('Technicians', 'Technicians (ជាងបច្ចេកទេស)'),
+        text('Total_workforce', 'Total Workforce (កម្លាំងពលកម្មសរុប)'),
+        lookup('idBusinessInfor', 'Select Business Information (ជ្រើសព័ត៌មានអាជីវកម្ម)', 'business_infor', ('idBusinessInfor',), display='Business Information ID: {0} (លេខសម្គាល់ព័ត៌មានអាជីវកម្ម: {0})'),
+    ]),
+    'family_infor': Form('family_infor', key='family_infor_form', submit_label='Submit (បញ្ជូន)', fields=[
+        text('name_of_husband_or_wife', 'Name of Husband or Wife (ឈ្មោះប្តីឬប្រពន្ធ)'),
+        date('bod', 'Date of Birth (ថ្ងៃខែឆ្នាំកំណើត)', min_value=datetime(1990, 1, 1)),
+        number('number_of_daughter_and_son', 'Number of Daughters and Sons (ចំនួនកូនស្រីនិងកូនប្រុស)', min_value=0, step=1),
+        text('occupation', 'Occupation (មុខរបរ)'),
+        lookup('addressID', 'Select Address (ជ្រើសអាសយដ្ឋាន)', 'address', ('addressID', 'OfficeAddress'), display='Address ID: {0} - {1} (លេខសម្គាល់អាសយដ្ឋាន: {0} - {1})'),
+        lookup('idApplicationCertificateRecognitionInternal', 'Select Application Certificate Recognition Internal (ជ្រើសការទទួលស្គាល់វិញ្ញាបនបត្រក្នុងស្រុក)', 'applic_certific_recognition_internal_indu', ('idApplicationCertificateRecognitionInternal',), display='Certificate Recognition Internal ID: {0} (លេខសម្គាល់ការទទួលស្គាល់វិញ្ញាបនបត្រក្នុងស្រុក: {0})'),
+    ]),
+    'background_application': Form('background_application', key='background_application_form', submit_label='Submit (បញ្ជូន)', fields=[
+        text('language', 'Language (ភាសា)'),
+        text('education_level', 'Education Level (កម្រិតការអប់រំ)'),
+        text('any_training', 'Any Training (ការបណ្តុះបណ្តាលណាមួយ)'),
+        text_area('work_experience', 'Work Experience (បទពិសោធន៍ការងារ)'),
+        text_area('background_applicationcol', 'Additional Background Information (ព័ត៌មានផ្ទៃខាងក្រោយបន្ថែម)'),
+        lookup('idfamilyInfor', 'Select Family Information (ជ្រើសព័ត៌មានគ្រួសារ)', 'family_infor', ('idfamilyInfor', 'name_of_husband_or_wife'), display='Family Info ID: {0} - {1} (លេខសម្គាល់ព័ត៌មានគ្រួសារ: {0} - {1})'),
+    ]),
+    'doc_applic_metro_calibra_second': Form('doc_applic_metro_calibra_second', key='doc_applic_metro_calibra_second_form', submit_label='Submit (បញ្ជូន)', fields=[
+        upload('Expired_metrology_certificate', 'Expired Metrology Certificate (វិញ្ញាបនបត្រមាត្រដ្ឋានផុតកំណត់)', type=['pdf', 'jpg', 'png']),
+        upload('Photograph4x6cm', '4x6 cm Photograph (រូបថត 4x6 សង់ទីម៉ែត្រ)', type=['jpg', 'png']),
+        upload('ID_passport_card', 'ID Passport Card (អត្តសញ្ញាណប័ណ្ណ ឬ លិខិតឆ្លងដែន)', type=['pdf', 'jpg', 'png']),
+        lookup('ApplicationMetrologyID', 'Select Application Metrology (ជ្រើសពាក្យស្នើសុំមាត្រដ្ឋាន)', 'applic_calibration_metrology', ('ApplicationMetrologyID',), display='Application ID: {0} (លេខសម្គាល់ពាក្យស្នើសុំ: {0})'),
+    ]),
+    'doc_applic_license_repair_metrology': Form('doc_applic_license_repair_metrology', key='doc_applic_license_repair_metrology_form', submit_label='Submit (បញ្ជូន)', fields=[
+        upload('ExpiredLicenseRepairMetrologyEquipment', 'Expired License Repair Metrology Equipment (ឧបករណ៍ជួសជុលអាជ្ញាប័ណ្ណមាត្រដ្ឋានផុតកំណត់)', type=['pdf', 'jpg', 'png']),
+        upload('MetrologyRegistrationCertificate', 'Metrology Registration Certificate (វិញ្ញាបនបត្រចុះបញ្ជីមាត្រដ្ឋាន)', type=['pdf', 'jpg', 'png']),
+        upload('CertificateOrProofSpecializationofApplicant', 'Certificate or Proof of Specialization of Applicant (វិញ្ញាបនបត្រឬភស្តុតាងនៃការបច្ចេកទេសរបស់អ្នកដាក់ពាក្យ)', type=['pdf', 'jpg', 'png']),
+        upload('TechnicalDrawingsfRequestedMetrologyEquipment', 'Technical Drawings of Requested Metrology Equipment (គំនូរបច្ចេកទេសនៃឧបករណ៍មាត្រដ្ឋានដែលបានស្នើសុំ)', type=['pdf', 'jpg', 'png']),
+        upload('IdentificationCard', 'Identification Card (អត្តសញ្ញាណប័ណ្ណ)', type=['pdf', 'jpg', 'png']),
+        upload('TransferRightsLetter', 'Transfer Rights Letter (លិខិតផ្ទេរសិទ្ធិ)', type=['pdf', 'jpg', 'png']),
+        upload('Statute_company', 'Statute Company (ច្បាប់ក្រុមហ៊ុន)', type=['pdf', 'jpg', 'png']),
+        upload('Photograph4x6', '4x6 Photograph (រូបថត 4x6)', type=['jpg', 'png']),
+        lookup('licenserepair_metrologyId', 'Select License Repair (ជ្រើសការជួសជុលអាជ្ញាប័ណ្ណ)', 'applic_license_repair_metrology', ('licenserepair_metrologyId',), display='License Repair ID: {0} (លេខសម្គាល់ការជួសជុលអាជ្ញាប័ណ្ណ: {0})'),
+    ]),
+    'doc_applic_metrology_verify': Form('doc_applic_metrology_verify', key='doc_applic_metrology_verify_form', submit_label='Submit (បញ្ជូន)', fields=[
+        upload('Transfer_latter', 'Transfer Letter (លិខិតផ្ទេរ)', type=['pdf', 'jpg', 'png']),
+        upload('ID_passport_card', 'ID Passport Card (អត្តសញ្ញាណប័ណ្ណ ឬ លិខិតឆ្លងដែន)', type=['pdf', 'jpg', 'png']),
+        lookup('ApplicationMetrologyVerifyID', 'Select Application Metrology Verify (ជ្រើសពាក្យស្នើសុំត្រួតពិនិត្យមាត្រដ្ឋាន)', 'applic_metro_verify', ('ApplicationMetrologyVerifyID',), display='Verification Application ID: {0} (លេខសម្គាល់ពាក្យស្នើសុំត្រួតពិនិត្យ: {0})'),
+    ]),
+    'doc_applic_metro_verify_second': Form('doc_applic_metro_verify_second', key='doc_applic_metro_verify_second_form', submit_label='Submit (បញ្ជូន)', fields=[
+        upload('Initial_verification_previous_usage', 'Initial Verification Previous Usage (ការត្រួតពិនិត្យដំបូងនៃការប្រើប្រាស់មុន)', type=['pdf', 'jpg', 'png']),
+        lookup('ApplicationMetrologyVerifyID', 'Select Application Metrology Verify (ជ្រើសពាក្យស្នើសុំត្រួតពិនិត្យមាត្រដ្ឋាន)', 'applic_metro_verify', ('ApplicationMetrologyVerifyID',), display='Verification Application ID: {0} (លេខសម្គាល់ពាក្យស្នើសុំត្រួតពិនិត្យ: {0})'),
+    ]),
+    'doc_applic_metro_verify_third': Form('doc_applic_metro_verifythird', key='doc_applic_metro_verify_third_form', submit_label='Submit (បញ្ជូន)', fields=[
+        upload('Infor_image_imported_packaged', 'Information Image of Imported Package (រូបភាពព័ត៌មាននៃកញ្ចប់នាំចូល)', type=['pdf', 'jpg', 'png']),
+        upload('Doc_technical_imported_packaged', 'Technical Document of Imported Package (ឯកសារបច្ចេកទេសនៃកញ្ចប់នាំចូល)', type=['pdf', 'jpg', 'png']),
+        lookup('ApplicationMetrologyVerifyID', 'Select Application Metrology Verify (ជ្រើសពាក្យស្នើសុំត្រួតពិនិត្យមាត្រដ្ឋាន)', 'applic_metro_verify', ('ApplicationMetrologyVerifyID',), display='Verification Application ID: {0} (លេខសម្គាល់ពាក្យស្នើសុំត្រួតពិនិត្យ: {0})'),
+    ]),
+    'doc_appli_metro_verify_import_forth': Form('doc_appli_metro_verify_importforth', key='doc_appli_metro_verify_import_forth_form', submit_label='Submit (បញ្ជូន)', fields=[
+        upload('Doc_technical_imported_packaged', 'Technical Document of Imported Package (ឯកសារបច្ចេកទេសនៃកញ្ចប់នាំចូល)', type=['pdf', 'jpg', 'png']),
+        lookup('ApplicationMetrologyVerifyID', 'Select Application Metrology Verify (ជ្រើសពាក្យស្នើសុំត្រួតពិនិត្យមាត្រដ្ឋាន)', 'applic_metro_verify', ('ApplicationMetrologyVerifyID',), display='Verification Application ID: {0} (លេខសម្គាល់ពាក្យស្នើសុំត្រួតពិនិត្យ: {0})'),
+    ]),
+    'doc_applc_certific_recogin': Form('doc_applc_certific_recogin', key='doc_applc_certific_recogin_form', submit_label='Submit (បញ្ជូន)', fields=[
+        upload('Transfer_latter', 'Transfer Letter (លិខិតផ្ទេរ)', type=['pdf', 'jpg', 'png']),
+        upload('ID_passport_card', 'ID Passport Card (អត្តសញ្ញាណប័ណ្ណ ឬ លិខិតឆ្លងដែន)', type=['pdf', 'jpg', 'png']),
+        upload('Certificate_metrology_expertise_recognition', 'Certificate of Metrology Expertise Recognition (វិញ្ញាបនបត្រទទួលស្គាល់ជំនាញមាត្រដ្ឋាន)', type=['pdf', 'jpg', 'png']),
+        lookup('idApplicationCertificateRecognitionInternal', 'Select Application Certificate Recognition Internal (ជ្រើសពាក្យស្នើសុំទទួលស្គាល់វិញ្ញាបនបត្រ)', 'applic_certific_recognition_internal_indu', ('idApplicationCertificateRecognitionInternal',), display='Recognition Application ID: {0} (លេខសម្គាល់ពាក្យស្នើសុំទទួលស្គាល់: {0})'),
+    ]),
+    'doc_applic_certif_recog_expertise': Form('doc_applic_certif_recog_expertise', key='doc_applic_certif_recog_expertise_form', submit_label='Submit (បញ្ជូន)', fields=[
+        upload('TrainingCertificate', 'Training Certificate (វិញ្ញាបនបត្របណ្តុះបណ្តាល)', type=['pdf', 'jpg', 'png']),
+        upload('IdentificationCard', 'Identification Card (អត្តសញ្ញាណប័ណ្ណ)', type=['pdf', 'jpg', 'png']),
+        upload('Photo4x6', '4x6 Photo (រូបថត 4x6)', type=['jpg', 'png']),
+        lookup('idApplicationCertificateRecognitionInternal', 'Select Recognition Application (ជ្រើសពាក្យស្នើសុំទទួលស្គាល់)', 'applic_certific_recognition_internal_indu', ('idApplicationCertificateRecognitionInternal',), display='Recognition ID: {0} (លេខសម្គាល់ការទទួលស្គាល់: {0})'),
+    ]),
+    'doc_applic_protoapprove_certificate': Form('doc_applic_protoapprove_certificate', key='doc_applic_protoapprove_certificate_form', submit_label='Submit (បញ្ជូន)', fields=[
+        upload('Statute_technical', 'Statute Technical (ច្បាប់បច្ចេកទេស)', type=['pdf', 'jpg', 'png']),
+        upload('Transfer_latter', 'Transfer Letter (លិខិតផ្ទេរ)', type=['pdf', 'jpg', 'png']),
+        upload('ID_passport_card', 'ID Passport Card (អត្តសញ្ញាណប័ណ្ណ ឬ លិខិតឆ្លងដែន)', type=['pdf', 'jpg', 'png']),
+        lookup('Applicatio_Prototype_Approval_CertificateID', 'Select Prototype Approval (ជ្រើសការអនុម័តគំរូ)', 'applic_prototype_approval_certificate', ('Applicatio_Prototype_Approval_CertificateID',), display='Prototype Approval ID: {0} (លេខសម្គាល់ការអនុម័តគំរូ: {0})'),
+    ]),
+    'doc_applic_importper_metroequi': Form('doc_applic_importper_metroequi', key='doc_applic_importper_metroequi_form', submit_label='Submit (បញ្ជូន)', fields=[
+        upload('Extract_of_Information_Picture', 'Extract of Information Picture (រូបភាពព័ត៌មាន)', type=['pdf', 'jpg', 'png']),
+        upload('Identification_Card', 'Identification Card (អត្តសញ្ញាណប័ណ្ណ)', type=['pdf', 'jpg', 'png']),
+        upload('Transfer_latter', 'Transfer Letter (លិខិតផ្ទេរ)', type=['pdf', 'jpg', 'png']),
+        lookup('ApplicationImportPermissionMetrologyEquipmentID', 'Select Import Permission (ជ្រើសការអនុញ្ញាតនាំចូល)', 'applic_checking_importpermmetro_equipment', ('ApplicationImportPermissionMetrologyEquipmentID',), display='Import Permission ID: {0} (លេខសម្គាល់ការអនុញ្ញាតនាំចូល: {0})'),
+    ]),
+}
@@ -0,0 +1,95 @@
+# scripts/form_schema.py
+"""
+Building blocks of the declarative form registry.
+
+A Form lists its fields in display order; each field names the column it
+is inserted into, its label and the keyword arguments of its Streamlit
+widget. Lookup fields select a foreign key from a parent table, upload
+fields store the file in the blob store. scripts/form_registry.py declares
+every form with these helpers and scripts/render_form.py renders them.
+"""
+
+DEFAULT_SUBMIT_LABEL = "Submit / ដាក់ស្នើ"
+
+
+class Lookup:
+    """Parent table rows offered by a foreign key dropdown."""
+
+    def __init__(self, table, columns, display=None, search=None, key=None):
+        """
+        :param table: Parent table.
+        :param columns: Columns fetched per row, the id first.
+        :param display: Format string applied to the row ("ID: {0}"), defaults to the last column.
+        :param search: Label of a search box; the rows are then fetched page by page (see scripts/fk_picker.py).
+        :param key: Widget key of the search box.
+        """
+        self.table = table
+        self.columns = tuple(columns)
+        self.display = display
+        self.search = search
+        self.key = key
+
+    def label(self, row):
+        return self.display.format(*row) if self.display else row[-1]
+
+
+class Field:
+    """One input of a form and the column it is inserted into."""
+
+    def __init__(self, kind, column, label, widget_kwargs=None, cast=None, choices=None, lookup=None):
+        self.kind = kind
+        self.column = column
+        self.label = label
+        self.widget_kwargs = widget_kwargs or {}
+        self.cast = cast
+        self.choices = choices
+        self.lookup = lookup
+
+
+class Form:
+    def __init__(self, table, key, fields, submit_label=DEFAULT_SUBMIT_LABEL, return_id=True):
+        self.table = table
+        self.key = key
+        self.fields = fields
+        self.submit_label = submit_label
+        self.return_id = return_id
+
+    @property
+    def columns(self):
+        return [field.column for field in self.fields]
+
+    @property
+    def lookups(self):
+        return [field for field in self.fields if field.lookup is not None]
+
+
+def text(column, label, **kwargs):
+    return Field("text", column, label, kwargs)
+
+
+def text_area(column, label, **kwargs):
+    return Field("text_area", column, label, kwargs)
+
+
+def number(column, label, **kwargs):
+    return Field("number", column, label, kwargs)
+
+
+def date(column, label, **kwargs):
+    return Field("date", column, label, kwargs)
+
+
+def checkbox(column, label, cast=None, **kwargs):
+    return Field("checkbox", column, label, kwargs, cast=cast)
+
+
+def choice(column, label, choices, cast=None, **kwargs):
+    return Field("choice", column, label, kwargs, cast=cast, choices=choices)
+
+
+def upload(column, label, **kwargs):
+    return Field("upload", column, label, kwargs)
+
+
+def lookup(column, label, table, columns, display=None, search=None, key=None):
+    return Field("lookup", column, label, lookup=Lookup(table, columns, display=display, search=search, key=key))
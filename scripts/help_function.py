@@ -1,25 +1,260 @@
 # scripts/help_functions.py
+import contextlib
+import functools
+import importlib
+import logging
+import time
+
 import mysql.connector
-from config import get_connection
 from mysql.connector import Error
+from .db_pool import get_pool
+from .lookup_cache import lookup_cache
+from .sql_templates import check_columns, check_table, insert_statement, prepared_cursor, select_statement
+
+# Table -> "module:function" callbacks run after a commit inserted rows into the table,
+# as callback(table_name, columns, rows, first_id); modules are imported on first use
+INSERT_LISTENERS = {
+    "raw_watersource": ["scripts.quantile_sketch:on_insert"],
+    "human_resources": ["scripts.quantile_sketch:on_insert"],
+    "treatment_plant": ["scripts.quantile_sketch:on_insert"],
+    "water_quality": ["scripts.moments:on_insert", "scripts.quantile_sketch:on_insert"],
+    "commercial": ["scripts.quantile_sketch:on_insert"],
+    "financial": ["scripts.quantile_sketch:on_insert"],
+    "distribution_network": ["scripts.quantile_sketch:on_insert"],
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_listener(target):
+    module_name, function_name = target.split(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
 
 class DatabaseHelper:
+    MAX_ROWS_PER_INSERT = 1000  # Rows per multi-row INSERT, keeps statements under max_allowed_packet
+
     def __init__(self):
-        self.connection = get_connection()
+        self._connection = None
+        self._transaction = None
+        self._transaction_tables = set()
+        self._transaction_inserts = []
+        self.last_transaction = None
+
+    @property
+    def connection(self):
+        # Checked out of the process-wide pool on first use, returned on close_connection()
+        if self._connection is None:
+            self._connection = get_pool().acquire()
+        return self._connection
+
+    def fetch_data(self, table_name, columns, use_cache=True):
+        """Fetches specified columns from a given table, served from the lookup cache when fresh."""
+        query_key = tuple(columns)
+        if use_cache:
+            cached = lookup_cache.get(table_name, query_key)
+            if cached is not None:
+                return cached
+        version = lookup_cache.version(table_name)
 
-    def fetch_data(self, table_name, columns):
-        """Fetches specified columns from a given table."""
+        cursor, reusable = None, False
         try:
-            cursor = self.connection.cursor()
-            query = f"SELECT {', '.join(columns)} FROM {table_name}"
-            cursor.execute(query)
+            # Inside the try: a lost connection is reported like any other query error
+            cursor, reusable = prepared_cursor(self.connection, select_statement(table_name, query_key))
+            cursor.execute(select_statement(table_name, query_key))
             result = cursor.fetchall()
+            if use_cache:
+                lookup_cache.put(table_name, query_key, result, version)
             return result
         except mysql.connector.Error as err:
             return [], f"Error: {err}"
         finally:
-            cursor.close()
+            if cursor is not None and not reusable:
+                cursor.close()
+
+    def fetch_many(self, requests, use_cache=True):
+        """
+        Fetches several (table, columns) lookups in one round trip.
+
+        Cache hits are served locally; the misses are sent as a single
+        multi-statement query and cached like fetch_data results.
+
+        :param requests: Iterable of (table_name, columns) pairs.
+        :return: Dict (table_name, tuple(columns)) -> rows.
+        """
+        results = {}
+        misses = []
+        for table_name, columns in requests:
+            key = (table_name, tuple(columns))
+            if key in results or key in misses:
+                continue
+            cached = lookup_cache.get(table_name, key[1]) if use_cache else None
+            if cached is not None:
+                results[key] = cached
+            else:
+                misses.append(key)
+        if not misses:
+            return results
+        if len(misses) == 1:
+            table_name, columns = misses[0]
+            results[misses[0]] = self.fetch_data(table_name, columns, use_cache=use_cache)
+            return results
+
+        versions = [lookup_cache.version(table_name) for table_name, _ in misses]
+        statement = "; ".join(select_statement(table_name, columns) for table_name, columns in misses)
+        cursor = None
+        try:
+            cursor = self.connection.cursor()
+            for key, result in zip(misses, cursor.execute(statement, multi=True)):
+                results[key] = result.fetchall()
+        except mysql.connector.Error:
+            # Fall back to one query per lookup, which reports its own errors
+            for table_name, columns in misses:
+                results[(table_name, columns)] = self.fetch_data(table_name, columns, use_cache=use_cache)
+            return results
+        finally:
+            if cursor is not None:
+                cursor.close()
+
+        if use_cache:
+            for (table_name, columns), version in zip(misses, versions):
+                lookup_cache.put(table_name, columns, results[(table_name, columns)], version)
+        return results
+
+    def search_data(self, table_name, columns, search="", limit=50, after=None):
+        """
+        Fetches one page of (id, label) rows matching a search prefix, for large parent tables.
+
+        :param columns: [id_column] or [id_column, label_column].
+        :param search: Prefix matched against the label column (or the id when there is no label).
+        :param limit: Maximum number of rows returned.
+        :param after: Keyset cursor, the last row of the previous page.
+        :return: List of rows ordered by label (NULL labels first) then id, in the same shape
+                 as fetch_data, or ([], "Error: ...") when the query fails.
+        """
+        query_key = (tuple(columns), search, limit, after)
+        cached = lookup_cache.get(table_name, query_key)
+        if cached is not None:
+            return cached
+        version = lookup_cache.version(table_name)
+
+        check_table(table_name)
+        id_column, label_column = check_columns(columns)[0], columns[-1]
+        conditions, params = [], []
+        if len(columns) > 1:
+            if search:
+                # Prefix match, so an index on the label column can be used
+                escaped = search.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+                conditions.append(f"`{label_column}` LIKE %s")
+                params.append(escaped + '%')
+            # MySQL sorts NULL labels first; they never compare with > or =, so they are paged explicitly
+            if after is not None and after[-1] is None:
+                conditions.append(f"(`{label_column}` IS NOT NULL OR `{id_column}` > %s)")
+                params.append(after[0])
+            elif after is not None:
+                conditions.append(f"(`{label_column}` > %s OR (`{label_column}` = %s AND `{id_column}` > %s))")
+                params.extend([after[-1], after[-1], after[0]])
+            order_by = f"`{label_column}`, `{id_column}`"
+        else:
+            if search.isdigit():
+                conditions.append(f"`{id_column}` >= %s")
+                params.append(int(search))
+            if after is not None:
+                conditions.append(f"`{id_column}` > %s")
+                params.append(after[0])
+            order_by = f"`{id_column}`"
+
+        query = f"SELECT {', '.join(f'`{column}`' for column in columns)} FROM `{table_name}`"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY {order_by} LIMIT %s"
+        params.append(int(limit))
+
+        cursor = None
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(query, params)
+            result = cursor.fetchall()
+        except mysql.connector.Error as err:
+            return [], f"Error: {err}"
+        finally:
+            if cursor is not None:
+                cursor.close()
+        lookup_cache.put(table_name, query_key, result, version)
+        return result
     
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        Runs the enclosed inserts in one transaction, committed once on exit.
+
+        Inside the block insert_record and insert_many raise mysql.connector.Error
+        instead of returning an error, so a parent row and its children are
+        written together or not at all. Nested blocks join the outer transaction.
+
+        :return: Dict with the statements, rows and seconds of the transaction, also kept as last_transaction.
+        """
+        if self._transaction is not None:
+            yield self._transaction
+            return
+
+        info = {"statements": 0, "rows": 0, "seconds": 0.0, "committed": False}
+        tables = set()
+        inserts = []
+        self._transaction = info
+        self._transaction_tables = tables
+        self._transaction_inserts = inserts
+        started = time.perf_counter()
+        try:
+            yield info
+            if self._connection is not None:  # Nothing to commit when no statement ran
+                self._connection.commit()
+            info["committed"] = True
+        except BaseException:
+            # Without a checked-out connection (e.g. the pool timed out) there is nothing to roll back
+            if self._connection is not None:
+                try:
+                    self._connection.rollback()
+                except mysql.connector.Error:
+                    pass  # Connection lost, the server discards the transaction
+            raise
+        finally:
+            info["seconds"] = time.perf_counter() - started
+            self._transaction = None
+            self.last_transaction = info
+        for table_name in tables:
+            lookup_cache.invalidate(table_name)  # New parent rows must show up in child form dropdowns
+        for table_name, columns, rows, first_id in inserts:
+            for target in INSERT_LISTENERS[table_name]:
+                try:
+                    _resolve_listener(target)(table_name, columns, rows, first_id)
+                except Exception:  # The rows are committed, a listener must not report the insert as failed
+                    logging.getLogger(__name__).exception("Insert listener %s failed", target)
+
+    def _insert_rows(self, table_name, columns, rows):
+        """Inserts rows with multi-row INSERT statements inside the current transaction; returns the first new id."""
+        columns = tuple(columns)
+        # Prepared statements take at most 65535 placeholders
+        rows_per_insert = max(1, min(self.MAX_ROWS_PER_INSERT, 65535 // len(columns)))
+        first_id = None
+        for start in range(0, len(rows), rows_per_insert):
+            chunk = rows[start:start + rows_per_insert]
+            query = insert_statement(table_name, columns, len(chunk))
+            cursor, reusable = prepared_cursor(self.connection, query)
+            try:
+                cursor.execute(query, [value for row in chunk for value in row])
+                if first_id is None:
+                    first_id = cursor.lastrowid
+                if table_name in INSERT_LISTENERS:
+                    # A multi-row INSERT gets consecutive ids starting at lastrowid
+                    self._transaction_inserts.append((table_name, columns, chunk, cursor.lastrowid))
+            finally:
+                if not reusable:
+                    cursor.close()
+            self._transaction["statements"] += 1
+            self._transaction["rows"] += len(chunk)
+        self._transaction_tables.add(table_name)
+        return first_id
+
     def insert_record(self, table_name, columns, values, return_id=True):
         """
         Inserts data into a specified table and returns the result.
@@ -30,33 +265,42 @@ class DatabaseHelper:
         :return: Tuple (success, message, inserted_id) where inserted_id is the last inserted row ID if applicable.
         """
         try:
-            cursor = self.connection.cursor()
-
-            # Create a dynamic SQL query
-            columns_str = ', '.join(columns)
-            placeholders = ', '.join(['%s'] * len(values))
+            with self.transaction():
+                inserted_id = self._insert_rows(table_name, columns, [values])
+        except mysql.connector.Error as err:
+            if self._transaction is not None:
+                raise  # Let the enclosing transaction roll back
+            return False, f"Error: {err}", None
 
-            query = f"INSERT INTO `{table_name}` ({columns_str}) VALUES ({placeholders})"
-            
-            # Execute the query
-            cursor.execute(query, values)
-            self.connection.commit()
+        if return_id:
+            return True, f"Data added successfully to {table_name} Table in Database and  it's ID!: {inserted_id}", inserted_id
+        else:
+            return True, f"Data added successfully to {table_name} Table In Database!", None
 
-            if return_id:
-        
-                # Get the last inserted row ID (useful for auto-increment fields)
-                inserted_id = cursor.lastrowid
-                return True, f"Data added successfully to {table_name} Table in Database and  it's ID!: {inserted_id}", inserted_id
-            else:
-
-                return True, f"Data added successfully to {table_name} Table In Database!", None
+    def insert_many(self, table_name, columns, rows):
+        """
+        Inserts a batch of rows in a single transaction, using multi-row INSERT statements.
 
+        :param table_name: The name of the table to insert data into.
+        :param columns: List of column names, shared by every row.
+        :param rows: List of value sequences, one per row.
+        :return: Tuple (success, message, inserted_count); on failure nothing is inserted.
+        """
+        rows = list(rows)
+        if not rows:
+            return True, f"No rows to add to {table_name}", 0
+        try:
+            with self.transaction():
+                self._insert_rows(table_name, columns, rows)
         except mysql.connector.Error as err:
-            return False, f"Error: {err}", None
-
-        finally:
-            cursor.close()
+            if self._transaction is not None:
+                raise
+            return False, f"Error: {err}", 0
+        return True, f"{len(rows)} rows added to {table_name}", len(rows)
 
     def close_connection(self):
-        if self.connection.is_connected():
-            self.connection.close()
+        """Returns the connection to the pool."""
+        if self._connection is not None:
+            get_pool().release(self._connection)
+            self._connection = None
+
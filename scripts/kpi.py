@@ -0,0 +1,219 @@
+# scripts/kpi.py
+"""
+Derived utility KPIs of the commercial and financial tables.
+
+The commercial and financial forms ask operators to type ratios such as
+non-revenue water or the operating ratio by hand, and nothing checked them.
+This module recomputes every derived indicator from the raw inputs,
+column-wise over the whole commercial x financial frame, once per data
+version. Each KPI is computed in the unit its form field takes (see
+KPI_UNITS): percentages for the (%) fields, m³ per connection or per
+capita over the reporting period for the consumption averages.
+
+The dashboards chart the computed values, read from get_kpi_frame().
+kpi_comparison() puts entered and computed values side by side, and
+kpi_mismatches() lists the rows whose entered value disagrees. A ratio
+with a zero or missing denominator is NaN.
+
+Usage:
+    python -m scripts.kpi --output data/kpis.csv        # export the computed KPIs
+    python -m scripts.kpi --mismatches data/kpi_mismatches.csv
+"""
+import argparse
+import functools
+
+import numpy as np
+import pandas as pd
+from .wsms_frames import data_version, get_frame
+
+# Reporting periods are monthly; volumes are entered in m³ per period
+PERIOD_DAYS = 30
+
+# Columns identifying a utility-period in the KPI frames
+KEY_COLUMNS = ["idCommercial", "idFinancial"]
+
+
+def _ratio(numerator, denominator):
+    out = np.full(np.shape(numerator), np.nan)
+    np.divide(numerator, denominator, out=out, where=(denominator != 0) & ~np.isnan(denominator))
+    return out
+
+
+def _percent(numerator, denominator):
+    return 100 * _ratio(numerator, denominator)
+
+
+def _operating_revenue(c):
+    return c["amount_billed_for_water_sales"] + c["amount_billed_for_other_services"]
+
+
+# KPI column -> formula over a dict of float64 input columns, in evaluation order
+KPI_FORMULAS = {
+    # Commercial
+    "total_water_consumption": lambda c: c["water_sold"] + c["water_supplied_without_charge"],
+    "water_losses": lambda c: c["Water_Production"] - c["total_water_consumption"],
+    "non_revenue_water": lambda c: c["Water_Production"] - c["water_sold"],
+    "average_daily_consumption": lambda c: c["water_sold"] / PERIOD_DAYS,
+    "average_consumption_per_connection": lambda c: _ratio(c["water_sold"], c["total_water_connections"]),
+    "average_consumption_per_capita": lambda c: _ratio(c["water_sold"], c["population_served"]),
+    "poor_household_ratio": lambda c: _percent(c["poor_connections"], c["residential_connections"]),
+    "complaints_per_1000_connections": lambda c: 1000 * _ratio(c["customer_complaints"], c["total_water_connections"]),
+    # Financial
+    "average_tariff": lambda c: _ratio(c["amount_billed_for_water_sales"], c["water_sold"]),
+    "bill_collection_ratio": lambda c: _percent(c["cash_from_water_sales"], c["amount_billed_for_water_sales"]),
+    "operating_ratio": lambda c: _percent(c["total_operating_expenses"], _operating_revenue(c)),
+    "unit_production_cost": lambda c: _ratio(c["production_expenses"], c["Water_Production"]),
+    "net_profit_margin": lambda c: _percent(c["net_income"], _operating_revenue(c)),
+    "debt_to_equity_ratio": lambda c: _ratio(c["loans"], c["owner_equity"]),
+    "return_on_assets": lambda c: _percent(c["net_income"], c["total_assets"]),
+    "return_on_equity": lambda c: _percent(c["net_income"], c["owner_equity"]),
+}
+
+# KPI column -> unit of the computed value, the one its form field takes
+KPI_UNITS = {
+    "total_water_consumption": "m³",
+    "water_losses": "m³",
+    "non_revenue_water": "m³",
+    "average_daily_consumption": "m³/day",
+    "average_consumption_per_connection": "m³/connection",
+    "average_consumption_per_capita": "m³/capita",
+    "poor_household_ratio": "%",
+    "complaints_per_1000_connections": "per 1000 connections",
+    "average_tariff": "currency/m³",
+    "bill_collection_ratio": "%",
+    "operating_ratio": "%",
+    "unit_production_cost": "currency/m³",
+    "net_profit_margin": "%",
+    "debt_to_equity_ratio": "ratio",
+    "return_on_assets": "%",
+    "return_on_equity": "%",
+}
+
+# Raw columns read by the formulas
+INPUT_COLUMNS = [
+    "Water_Production", "water_sold", "water_supplied_without_charge", "population_served",
+    "total_water_connections", "residential_connections", "poor_connections", "customer_complaints",
+    "cash_from_water_sales", "amount_billed_for_water_sales", "amount_billed_for_other_services",
+    "total_operating_expenses", "production_expenses", "net_income", "loans", "owner_equity", "total_assets",
+]
+
+
+def compute_kpis(frame):
+    """
+    Computes every KPI of KPI_FORMULAS over a commercial x financial frame.
+
+    Each formula is one NumPy expression over whole columns, so the cost is a
+    handful of passes over memory regardless of the number of rows.
+
+    :param frame: DataFrame with the INPUT_COLUMNS (and KEY_COLUMNS if present).
+    :return: DataFrame with the key columns and one column per KPI, aligned with frame.
+    """
+    columns = {column: frame[column].to_numpy(dtype="float64", na_value=np.nan) for column in INPUT_COLUMNS}
+    kpis = {}
+    for name, formula in KPI_FORMULAS.items():
+        kpis[name] = columns[name] = formula(columns)  # Later formulas may reuse earlier KPIs
+    result = pd.DataFrame(kpis, index=frame.index)
+    keys = [column for column in KEY_COLUMNS if column in frame]
+    return pd.concat([frame[keys], result], axis=1) if keys else result
+
+
+@functools.lru_cache(maxsize=2)
+def _build_kpis(version):
+    return compute_kpis(get_frame("commercial_financial"))
+
+
+def get_kpis():
+    """Returns the computed KPIs of the current data version, one row per commercial x financial pair."""
+    return _build_kpis(data_version())
+
+
+@functools.lru_cache(maxsize=2)
+def _build_kpi_frame(version):
+    frame = get_frame("commercial_financial").copy()
+    names = list(KPI_FORMULAS)
+    frame[names] = _build_kpis(version)[names]
+    return frame
+
+
+def get_kpi_frame():
+    """Returns the commercial x financial frame with the KPI columns holding the computed values; treat it as read-only."""
+    return _build_kpi_frame(data_version())
+
+
+def kpi_comparison(names, rel_tol=0.01):
+    """
+    Puts the entered and computed values of some KPIs side by side.
+
+    :param names: KPI columns compared.
+    :param rel_tol: Relative difference tolerated, for values rounded by operators.
+    :return: DataFrame with the key columns, RawWaterSource_name and, per KPI,
+             <kpi>_entered, <kpi>_computed and <kpi>_mismatch columns.
+    """
+    entered = get_frame("commercial_financial")
+    computed = get_kpis()
+    comparison = entered[KEY_COLUMNS + ["RawWaterSource_name"]].copy()
+    for name in names:
+        entered_values = entered[name].to_numpy(dtype="float64", na_value=np.nan)
+        computed_values = computed[name].to_numpy()
+        comparison[f"{name}_entered"] = entered_values
+        comparison[f"{name}_computed"] = computed_values
+        comparison[f"{name}_mismatch"] = ~np.isclose(entered_values, computed_values, rtol=rel_tol, equal_nan=True)
+    return comparison
+
+
+def kpi_mismatch_summary(names=None, rel_tol=0.01):
+    """
+    Counts, per KPI, the rows whose entered value differs from the computed one.
+
+    :return: DataFrame indexed by KPI with the unit, rows and mismatches.
+    """
+    names = list(names or KPI_FORMULAS)
+    comparison = kpi_comparison(names, rel_tol)
+    return pd.DataFrame({
+        "unit": [KPI_UNITS[name] for name in names],
+        "rows": len(comparison),
+        "mismatches": [int(comparison[f"{name}_mismatch"].sum()) for name in names],
+    }, index=pd.Index(names, name="kpi"))
+
+
+def kpi_mismatches(rel_tol=0.01):
+    """
+    Lists the hand-entered KPI values that differ from the computed ones.
+
+    :param rel_tol: Relative difference tolerated, for values rounded by operators.
+    :return: DataFrame with the key columns, kpi, entered and computed value.
+    """
+    comparison = kpi_comparison(KPI_FORMULAS, rel_tol)
+    mismatches = []
+    for name in KPI_FORMULAS:
+        differs = comparison[f"{name}_mismatch"].to_numpy()
+        if differs.any():
+            rows = comparison.loc[differs, KEY_COLUMNS].copy()
+            rows["kpi"] = name
+            rows["entered"] = comparison.loc[differs, f"{name}_entered"]
+            rows["computed"] = comparison.loc[differs, f"{name}_computed"]
+            mismatches.append(rows)
+    if not mismatches:
+        return pd.DataFrame(columns=KEY_COLUMNS + ["kpi", "entered", "computed"])
+    return pd.concat(mismatches, ignore_index=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compute the derived commercial and financial KPIs.")
+    parser.add_argument("--output", help="CSV file receiving the computed KPIs")
+    parser.add_argument("--mismatches", help="CSV file receiving the hand-entered values that disagree")
+    parser.add_argument("--rel-tol", type=float, default=0.01)
+    args = parser.parse_args(argv)
+
+    kpis = get_kpis()
+    print(f"{len(kpis)} utility-periods, {len(KPI_FORMULAS)} KPIs")
+    if args.output:
+        kpis.to_csv(args.output, index=False)
+    mismatches = kpi_mismatches(args.rel_tol)
+    print(f"{len(mismatches)} hand-entered values differ from the computed KPIs")
+    if args.mismatches:
+        mismatches.to_csv(args.mismatches, index=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# scripts/lookup_cache.py
+"""
+Process-wide cache for the foreign-key dropdown lookups of the forms.
+
+Results of DatabaseHelper.fetch_data are kept per (table, columns), and
+those of search_data per (table, columns, search, page), for a TTL, so
+widget interactions stop querying MySQL. insert_record invalidates the
+table it writes to, so a newly inserted parent row shows up in child
+forms immediately; the TTL bounds staleness for writes made elsewhere.
+"""
+import threading
+import time
+
+from config import LOOKUP_CACHE_TTL
+
+
+class LookupCache:
+    def __init__(self, ttl=300.0, max_entries=1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = {}  # (table, columns) -> (expires_at, version, rows)
+        self._versions = {}  # table -> invalidation counter
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def version(self, table_name):
+        """Returns the invalidation counter of a table; pass it back to put()."""
+        with self._lock:
+            return self._versions.get(table_name, 0)
+
+    def get(self, table_name, query_key):
+        """
+        Returns the cached rows, or None if missing, expired or invalidated.
+
+        :param query_key: Hashable description of the lookup, e.g. the tuple of selected columns.
+        """
+        key = (table_name, query_key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, version, rows = entry
+                if expires_at > time.monotonic() and version == self._versions.get(table_name, 0):
+                    self.hits += 1
+                    return list(rows)
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, table_name, query_key, rows, version):
+        """
+        Stores fetched rows unless the table was invalidated since `version` was read,
+        so a lookup racing with an insert cannot cache the pre-insert rows.
+        """
+        with self._lock:
+            if version != self._versions.get(table_name, 0):
+                return
+            self._entries[(table_name, query_key)] = (time.monotonic() + self.ttl, version, tuple(rows))
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]  # Oldest entry first
+
+    def invalidate(self, table_name):
+        """Drops every cached lookup of a table."""
+        with self._lock:
+            self._versions[table_name] = self._versions.get(table_name, 0) + 1
+            for key in [key for key in self._entries if key[0] == table_name]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            for table_name in {key[0] for key in self._entries}:
+                self._versions[table_name] = self._versions.get(table_name, 0) + 1
+            self._entries.clear()
+
+
+lookup_cache = LookupCache(ttl=LOOKUP_CACHE_TTL)
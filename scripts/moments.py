@@ -0,0 +1,133 @@
+# scripts/moments.py
+"""
+Mergeable moments of the numeric WSMS columns, for correlation heatmaps.
+
+The water quality heatmap used to run DataFrame.corr() over the whole
+table on every render, O(n * p^2) for ~28 numeric columns, although the
+result only changes when samples are added. A Moments object keeps, for
+every column pair, the count, means, sums of squared deviations and the
+co-moment of the rows where both columns are present. Two Moments merge
+exactly (Chan et al.'s pairwise update), so:
+
+- a snapshot sync only folds in the rows above the last synced id;
+- a committed insert is folded in as a one-row batch, O(p^2);
+- the correlation matrix is read off the accumulators in O(p^2).
+
+Stores are SyncedStores (see scripts/synced_store.py) saved to
+data/moments/<table>.npz. Results match DataFrame.corr()
+(pairwise-complete Pearson).
+"""
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+from .snapshot import DATA_DIR, TABLE_PRIMARY_KEYS
+from .snapshot_schema import numeric_columns
+from .synced_store import SyncedStore
+
+MOMENTS_DIR = os.path.join(DATA_DIR, "moments")
+
+
+class Moments:
+    """Pairwise-complete count, means, squared deviations and co-moments of p columns."""
+
+    def __init__(self, columns):
+        p = len(columns)
+        self.columns = list(columns)
+        self.count = np.zeros((p, p))  # count[i, j]: rows where columns i and j are both present
+        self.mean = np.zeros((p, p))  # mean[i, j]: mean of column i over those rows
+        self.m2 = np.zeros((p, p))  # m2[i, j]: sum of squared deviations of column i over those rows
+        self.comoment = np.zeros((p, p))  # comoment[i, j]: sum of products of the deviations of i and j
+
+    @classmethod
+    def from_rows(cls, columns, rows):
+        """Computes the moments of a batch of rows (NaN for missing values) with a few matrix products."""
+        moments = cls(columns)
+        rows = np.asarray(rows, dtype="float64").reshape(-1, len(columns))
+        if not len(rows):
+            return moments
+
+        present = ~np.isnan(rows)
+        weights = present.astype("float64")
+        # Centre on the column means first, so the sums of products do not lose precision
+        column_counts = weights.sum(axis=0)
+        shift = np.divide(np.where(present, rows, 0.0).sum(axis=0), column_counts,
+                          out=np.zeros(len(columns)), where=column_counts > 0)
+        centred = np.where(present, rows - shift, 0.0)
+
+        count = weights.T @ weights
+        mean = np.divide(centred.T @ weights, count, out=np.zeros_like(count), where=count > 0)
+        moments.count = count
+        moments.mean = mean + shift[:, None]
+        moments.m2 = (centred * centred).T @ weights - count * mean ** 2
+        moments.comoment = centred.T @ centred - count * mean * mean.T
+        return moments
+
+    def merge(self, other):
+        """Returns the moments of the union of both row sets."""
+        merged = Moments(self.columns)
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        share = np.divide(other.count, count, out=np.zeros_like(count), where=count > 0)
+        weight = self.count * share  # n_a * n_b / n
+        merged.count = count
+        merged.mean = self.mean + delta * share
+        merged.m2 = self.m2 + other.m2 + delta ** 2 * weight
+        merged.comoment = self.comoment + other.comoment + delta * delta.T * weight
+        return merged
+
+    @property
+    def rows(self):
+        """Number of rows with a value in the first column (the primary key)."""
+        return int(self.count[0, 0]) if self.columns else 0
+
+    def covariance(self):
+        covariance = np.divide(self.comoment, self.count - 1, out=np.full_like(self.count, np.nan), where=self.count > 1)
+        return pd.DataFrame(covariance, index=self.columns, columns=self.columns)
+
+    def correlation(self):
+        """Returns the Pearson correlation matrix, like DataFrame.corr()."""
+        scale = np.sqrt(np.clip(self.m2 * self.m2.T, 0.0, None))
+        correlation = np.divide(self.comoment, scale, out=np.full_like(scale, np.nan), where=scale > 0)
+        return pd.DataFrame(np.clip(correlation, -1.0, 1.0), index=self.columns, columns=self.columns)
+
+    def save(self, path, **extra):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, columns=np.array(self.columns), count=self.count, mean=self.mean,
+                     m2=self.m2, comoment=self.comoment, **extra)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Returns (moments, extra arrays) saved by save()."""
+        with np.load(path) as data:
+            moments = cls([str(column) for column in data["columns"]])
+            moments.count, moments.mean = data["count"], data["mean"]
+            moments.m2, moments.comoment = data["m2"], data["comoment"]
+            extra = {name: data[name] for name in data.files
+                     if name not in ("columns", "count", "mean", "m2", "comoment")}
+        return moments, extra
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_moments_store(table_name):
+    """Returns the process-wide moments store of a WSMS table."""
+    if table_name not in TABLE_PRIMARY_KEYS:
+        raise ValueError(f"Unknown table: {table_name}")
+    with _stores_lock:
+        if table_name not in _stores:
+            _stores[table_name] = SyncedStore(table_name, Moments, numeric_columns(table_name), MOMENTS_DIR)
+        return _stores[table_name]
+
+
+def on_insert(table_name, columns, rows, first_id):
+    """Insert listener (see DatabaseHelper.INSERT_LISTENERS): folds committed rows into the table's store."""
+    if first_id is None:
+        return
+    store = get_moments_store(table_name)
+    store.record_inserts(first_id, columns, rows)
@@ -0,0 +1,219 @@
+# scripts/quantile_sketch.py
+"""
+Streaming quantile sketches of the numeric WSMS columns, for outlier bounds.
+
+The abstraction outlier chart computed exact quartiles of one column from
+the full table on every view. A KLL sketch keeps about QUANTILE_SKETCH_K
+values per level of a stack of compactors instead of the column: when a
+level is full it is sorted and every other value moves up a level with
+twice the weight. The rank error is about 1 / QUANTILE_SKETCH_K of the
+row count, whatever the number of rows, and sketches of two row sets merge
+into a sketch of their union.
+
+Every measurement column (see snapshot_schema.measure_columns) of the
+seven WSMS tables has a sketch. The sketches of a table live in a
+SyncedStore (see scripts/synced_store.py) saved to data/sketches/<table>.npz,
+so a snapshot sync only reads the rows added since the last one (the
+whole table only after the snapshot was rewritten) and committed inserts
+are added as they happen. Quantiles and IQR bounds are computed from a sketch's sorted
+values, cached until the sketch changes.
+"""
+import math
+import os
+import random
+import threading
+
+import numpy as np
+from config import QUANTILE_SKETCH_K
+from .snapshot import DATA_DIR, TABLE_PRIMARY_KEYS
+from .snapshot_schema import measure_columns
+from .synced_store import SyncedStore
+
+SKETCH_DIR = os.path.join(DATA_DIR, "sketches")
+
+# Capacity of a level relative to the one above it
+LEVEL_DECAY = 2 / 3
+
+
+class KLLSketch:
+    """KLL quantile sketch of one column; missing values are ignored."""
+
+    def __init__(self, k=200):
+        self.k = k
+        self.levels = [np.empty(0)]  # Level h holds values of weight 2**h
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._cdf = None  # (sorted values, cumulative weights), built on the first query
+
+    def _capacity(self, level):
+        return max(2, int(math.ceil(self.k * LEVEL_DECAY ** (len(self.levels) - level - 1))))
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) <= self._capacity(level):
+                level += 1
+                continue
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+            items = np.sort(items)
+            keep = items[-1:] if len(items) % 2 else items[:0]  # An odd value out stays on this level
+            pairs = items[:len(items) - len(keep)]
+            promoted = pairs[random.getrandbits(1)::2]
+            self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            self.levels[level] = keep
+            level = 0  # A new top level shrinks the capacities below it
+
+    def update(self, values):
+        """Adds a batch of values in place."""
+        values = np.asarray(values, dtype="float64").ravel()
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        self.count += len(values)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        self._cdf = None
+
+    def merge(self, other):
+        """Returns a sketch of the union of both value sets."""
+        merged = KLLSketch(max(self.k, other.k))
+        height = max(len(self.levels), len(other.levels))
+        merged.levels = [
+            np.concatenate([
+                self.levels[level] if level < len(self.levels) else np.empty(0),
+                other.levels[level] if level < len(other.levels) else np.empty(0),
+            ])
+            for level in range(height)
+        ]
+        merged.count = self.count + other.count
+        merged.min, merged.max = min(self.min, other.min), max(self.max, other.max)
+        merged._compress()
+        return merged
+
+    def _distribution(self):
+        if self._cdf is None:
+            values = np.concatenate(self.levels)
+            weights = np.concatenate([np.full(len(items), 2.0 ** level) for level, items in enumerate(self.levels)])
+            order = np.argsort(values, kind="stable")
+            self._cdf = values[order], np.cumsum(weights[order])
+        return self._cdf
+
+    def quantile(self, q):
+        """Returns the approximate q-quantile (0 <= q <= 1), NaN when the sketch is empty."""
+        if not self.count:
+            return math.nan
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        values, cumulative = self._distribution()
+        index = int(np.searchsorted(cumulative, q * cumulative[-1], side="left"))
+        return float(values[min(index, len(values) - 1)])
+
+    def rank(self, value):
+        """Returns the approximate fraction of values <= value."""
+        if not self.count:
+            return math.nan
+        values, cumulative = self._distribution()
+        index = int(np.searchsorted(values, value, side="right"))
+        return float(cumulative[index - 1] / cumulative[-1]) if index else 0.0
+
+    def outlier_bounds(self, whisker=1.5):
+        """
+        Returns the Tukey fences (q1 - whisker * IQR, q3 + whisker * IQR).
+
+        :return: Tuple (lower, upper, q1, q3).
+        """
+        q1, q3 = self.quantile(0.25), self.quantile(0.75)
+        iqr = q3 - q1
+        return q1 - whisker * iqr, q3 + whisker * iqr, q1, q3
+
+    def to_arrays(self, prefix):
+        arrays = {f"{prefix}_meta": np.array([self.k, self.count, self.min, self.max, len(self.levels)])}
+        for level, items in enumerate(self.levels):
+            arrays[f"{prefix}_level{level}"] = items
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays, prefix):
+        k, count, minimum, maximum, height = arrays[f"{prefix}_meta"]
+        sketch = cls(int(k))
+        sketch.count, sketch.min, sketch.max = int(count), float(minimum), float(maximum)
+        sketch.levels = [arrays[f"{prefix}_level{level}"] for level in range(int(height))]
+        return sketch
+
+
+class ColumnSketches:
+    """One KLL sketch per column, with the summary interface of a SyncedStore."""
+
+    def __init__(self, columns, k=QUANTILE_SKETCH_K):
+        self.columns = list(columns)
+        self.sketches = {column: KLLSketch(k) for column in self.columns}
+
+    def __getitem__(self, column):
+        return self.sketches[column]
+
+    @classmethod
+    def from_rows(cls, columns, rows):
+        sketches = cls(columns)
+        rows = np.asarray(rows, dtype="float64").reshape(-1, len(columns))
+        for i, column in enumerate(sketches.columns):
+            sketches.sketches[column].update(rows[:, i])
+        return sketches
+
+    def merge(self, other):
+        merged = ColumnSketches(self.columns)
+        merged.sketches = {column: self.sketches[column].merge(other.sketches[column]) for column in self.columns}
+        return merged
+
+    def save(self, path, **extra):
+        arrays = {"columns": np.array(self.columns)}
+        for i, column in enumerate(self.columns):
+            arrays.update(self.sketches[column].to_arrays(f"sketch{i}"))
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays, **extra)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Returns (sketches, extra arrays) saved by save()."""
+        with np.load(path) as data:
+            arrays = {name: data[name] for name in data.files}
+        sketches = cls([str(column) for column in arrays.pop("columns")])
+        for i, column in enumerate(sketches.columns):
+            sketches.sketches[column] = KLLSketch.from_arrays(arrays, f"sketch{i}")
+        extra = {name: value for name, value in arrays.items() if not name.startswith("sketch")}
+        return sketches, extra
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_sketch_store(table_name):
+    """Returns the process-wide quantile sketch store of a WSMS table."""
+    if table_name not in TABLE_PRIMARY_KEYS:
+        raise ValueError(f"Unknown table: {table_name}")
+    with _stores_lock:
+        if table_name not in _stores:
+            _stores[table_name] = SyncedStore(table_name, ColumnSketches, measure_columns(table_name), SKETCH_DIR)
+        return _stores[table_name]
+
+
+def get_sketch(table_name, column):
+    """Returns the current sketch of a measurement column."""
+    return get_sketch_store(table_name).summary()[column]
+
+
+def on_insert(table_name, columns, rows, first_id):
+    """Insert listener (see DatabaseHelper.INSERT_LISTENERS): adds committed rows to the table's sketches."""
+    if first_id is None:
+        return
+    store = get_sketch_store(table_name)
+    store.record_inserts(first_id, columns, rows)
@@ -0,0 +1,152 @@
+# scripts/rollups.py
+"""
+Materialized per-group aggregates for the dashboard groupings.
+
+Several charts merged whole tables and then ran groupby('RawWaterSource_name')
+with sum or mean. A rollup keeps, per value of a grouping column of one
+table, the row count and the count and sum of every measurement column.
+Sums and counts add up, so each rollup is a SyncedStore (see
+scripts/synced_store.py) that only folds in the rows of each snapshot sync
+above the last folded-in id; it is saved to data/rollups/<rollup>.npz.
+
+Rollups keyed by treatment plant are regrouped per raw water source
+through the treatment_plant table, so charts read frames with one row per
+group, whatever the number of rows behind them.
+"""
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+from .snapshot import DATA_DIR
+from .snapshot_schema import measure_columns
+from .synced_store import SyncedStore
+from .wsms_frames import get_frame
+
+ROLLUP_DIR = os.path.join(DATA_DIR, "rollups")
+
+# Rollup name -> (table, grouping column)
+ROLLUPS = {
+    "raw_watersource_by_availability": ("raw_watersource", "availability_year_round"),
+    "human_resources_by_source": ("human_resources", "idRawWaterSource"),
+    "treatment_plant_by_source": ("treatment_plant", "idRawWaterSource"),
+    "water_quality_by_plant": ("water_quality", "idTreatmentPlant"),
+    "commercial_by_plant": ("commercial", "idTreatmentPlant"),
+    "commercial_by_profile": ("commercial", "license_area_profile"),
+}
+
+
+class Rollup:
+    """Row count and per-column value counts and sums per group; the first column is the grouping column."""
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.key, self.measures = self.columns[0], self.columns[1:]
+        self.table = pd.DataFrame(
+            columns=["rows"] + [f"{column}_count" for column in self.measures] + [f"{column}_sum" for column in self.measures],
+            dtype="float64",
+        )
+        self.table.index.name = self.key
+
+    @classmethod
+    def from_rows(cls, columns, rows):
+        rollup = cls(columns)
+        frame = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame(list(rows), columns=columns)
+        frame = frame[frame[rollup.key].notna()]
+        if not len(frame):
+            return rollup
+        values = frame[rollup.measures].astype("float64")
+        grouped = values.groupby(frame[rollup.key])
+        table = pd.concat([
+            grouped.size().rename("rows"),
+            grouped.count().add_suffix("_count"),
+            grouped.sum().add_suffix("_sum"),
+        ], axis=1).astype("float64")
+        rollup.table = table[rollup.table.columns]
+        rollup.table.index.name = rollup.key
+        return rollup
+
+    def merge(self, other):
+        merged = Rollup(self.columns)
+        if not len(other.table):
+            merged.table = self.table
+        elif not len(self.table):
+            merged.table = other.table
+        else:
+            merged.table = self.table.add(other.table, fill_value=0.0)
+        return merged
+
+    def frame(self):
+        """Returns one row per group with the row count and the sum and mean of every measurement column."""
+        result = pd.DataFrame({"rows": self.table["rows"].astype("int64")}, index=self.table.index)
+        for column in self.measures:
+            counts = self.table[f"{column}_count"]
+            result[f"{column}_sum"] = self.table[f"{column}_sum"]
+            result[f"{column}_mean"] = self.table[f"{column}_sum"] / counts.where(counts > 0)
+        return result.sort_index()
+
+    def save(self, path, **extra):
+        keys = self.table.index.to_numpy()
+        keys = keys.astype("str") if keys.dtype == object else keys.astype("float64")  # No pickled arrays
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, columns=np.array(self.columns), keys=keys, values=self.table.to_numpy(dtype="float64"), **extra)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Returns (rollup, extra arrays) saved by save()."""
+        with np.load(path) as data:
+            arrays = {name: data[name] for name in data.files}
+        rollup = cls([str(column) for column in arrays.pop("columns")])
+        keys = arrays.pop("keys")
+        rollup.table = pd.DataFrame(arrays.pop("values"), index=pd.Index(keys.tolist(), name=rollup.key),
+                                    columns=rollup.table.columns)
+        return rollup, arrays
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_rollup_store(name):
+    """Returns the process-wide store of a rollup of ROLLUPS."""
+    table_name, key = ROLLUPS[name]
+    with _stores_lock:
+        if name not in _stores:
+            columns = [key] + [column for column in measure_columns(table_name) if column != key]
+            _stores[name] = SyncedStore(table_name, Rollup, columns, ROLLUP_DIR, name=name)
+        return _stores[name]
+
+
+def get_rollup(name):
+    """
+    Returns a rollup of the current snapshot.
+
+    :return: DataFrame indexed by the grouping column, with rows and <column>_sum / <column>_mean columns.
+    """
+    return get_rollup_store(name).summary().frame()
+
+
+def rollup_by_source(name):
+    """
+    Returns a rollup per raw water source, indexed by RawWaterSource_name.
+
+    Rollups keyed by idTreatmentPlant are regrouped through the treatment_plant table.
+    """
+    rollup = get_rollup_store(name).summary()
+    source_ids = rollup.table.index.to_series()
+    if rollup.key == "idTreatmentPlant":
+        plant_sources = get_frame("treatment_plant").set_index("idTreatmentPlant")["idRawWaterSource"]
+        source_ids = source_ids.map(plant_sources)
+    elif rollup.key != "idRawWaterSource":
+        raise ValueError(f"Rollup {name} is not keyed by raw water source or treatment plant")
+
+    source_names = get_frame("raw_watersource").set_index("idRawWaterSource")["RawWaterSource_name"]
+    names = source_ids.map(source_names)
+    known = names.notna().to_numpy()  # Like the inner joins of the merged frames
+    # Sums and counts of the groups of one source add up
+    regrouped = Rollup(rollup.columns)
+    regrouped.table = rollup.table[known].groupby(names[known].to_numpy()).sum()
+    regrouped.table.index.name = "RawWaterSource_name"
+    return regrouped.frame()
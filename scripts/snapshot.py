@@ -0,0 +1,472 @@
+# scripts/snapshot.py
+"""
+Snapshot refresher for the WSMS dashboard tables.
+
+The dashboard reads local copies of the seven WSMS tables from the data/
+folder. This module refreshes those copies on demand, outside of the
+Streamlit process. Refreshes are incremental: the last synced primary key
+(the high-water mark) is kept per table and only rows above it are pulled,
+in chunks, and appended to the snapshot as new part files. A periodic
+verify pass compares a row checksum of the synced id range with the one
+recorded while syncing; updated or deleted rows trigger a full refresh.
+
+Snapshots are Parquet datasets (data/parquet/<table>/part-*.parquet) typed
+by scripts/snapshot_schema.py, without the BLOB columns. Readers can load
+only the columns they need; tables that were never refreshed fall back to
+the CSV snapshots shipped in data/.
+
+Usage:
+    python -m scripts.snapshot                  # append new rows once
+    python -m scripts.snapshot --verify         # also check synced rows for updates and deletes
+    python -m scripts.snapshot --force          # rewrite every table
+    python -m scripts.snapshot commercial       # only the listed tables
+    python -m scripts.snapshot --interval 600   # keep refreshing every 10 minutes
+"""
+import argparse
+import json
+import os
+import shutil
+import time
+import uuid
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from config import SNAPSHOT_CHUNK_SIZE, SNAPSHOT_MAX_PARTS, SNAPSHOT_VERIFY_INTERVAL, get_connection
+from .snapshot_schema import TABLE_SCHEMAS, snapshot_columns
+
+DATA_DIR = "data"
+PARQUET_DIR = os.path.join(DATA_DIR, "parquet")
+STATE_FILE = os.path.join(DATA_DIR, ".snapshot_state.json")
+# File of a Parquet dataset naming its generation; readers skip files starting with "_"
+GENERATION_FILE = "_generation"
+
+ARROW_TYPES = {"int": pa.int64(), "float": pa.float64(), "str": pa.string()}
+
+# WSMS table name -> primary key column
+TABLE_PRIMARY_KEYS = {
+    "raw_watersource": "idRawWaterSource",
+    "human_resources": "idHumanresources",
+    "treatment_plant": "idTreatmentPlant",
+    "water_quality": "idWaterQuality",
+    "commercial": "idCommercial",
+    "financial": "idFinancial",
+    "distribution_network": "idDistributionNetwork",
+}
+
+# WSMS table name -> legacy CSV snapshot
+TABLE_FILES = {
+    table_name: os.path.join(DATA_DIR, f"{table_name}.csv")
+    for table_name in TABLE_PRIMARY_KEYS
+}
+
+
+def arrow_schema(table_name):
+    """Returns the Parquet schema of a table's snapshot (BLOB columns excluded)."""
+    return pa.schema([
+        (column, ARROW_TYPES[kind])
+        for column, kind in TABLE_SCHEMAS[table_name].items()
+        if kind != "blob"
+    ])
+
+
+def parquet_path(table_name):
+    """Returns the Parquet dataset directory of a WSMS table."""
+    if table_name not in TABLE_PRIMARY_KEYS:
+        raise ValueError(f"Unknown table: {table_name}")
+    return os.path.join(PARQUET_DIR, table_name)
+
+
+def dataset_path(table_name):
+    """
+    Returns the live Parquet dataset directory of a table, or None if it was never refreshed.
+
+    During a swap, or after a crash in the middle of one, only the previous
+    dataset (<table>.old) may be left; it is then the live snapshot.
+    """
+    path = parquet_path(table_name)
+    for candidate in (path, path + ".old"):
+        if os.path.isdir(candidate):
+            return candidate
+    return None
+
+
+def _recover_dataset(table_name):
+    """Completes a swap interrupted by a crash, before a dataset is written."""
+    path = parquet_path(table_name)
+    old_path = path + ".old"
+    if not os.path.isdir(old_path):
+        return
+    if os.path.isdir(path):
+        shutil.rmtree(old_path, ignore_errors=True)
+    else:
+        os.replace(old_path, path)
+
+
+def snapshot_path(table_name):
+    """Returns the Parquet dataset of a WSMS table, or its CSV snapshot if it was never refreshed."""
+    return dataset_path(table_name) or TABLE_FILES[table_name]
+
+
+def snapshot_signature(table_name):
+    """Returns (mtime_ns, size) of a table's snapshot files, to detect rewrites."""
+    path = snapshot_path(table_name)
+    if not os.path.isdir(path):
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+    stats = [entry.stat() for entry in os.scandir(path) if entry.name.endswith(".parquet")]
+    return max((stat.st_mtime_ns for stat in stats), default=0), sum(stat.st_size for stat in stats)
+
+
+def snapshot_generation(table_name):
+    """
+    Identifies the rows below a table's high-water mark.
+
+    A full rewrite starts a new generation; appended part files and compaction
+    keep it, so while it is unchanged only rows above the last seen id are new.
+    The CSV fallback is identified by its mtime and size.
+    """
+    path = snapshot_path(table_name)
+    if not os.path.isdir(path):
+        stat = os.stat(path)
+        return f"csv:{stat.st_mtime_ns}:{stat.st_size}"
+    try:
+        with open(os.path.join(path, GENERATION_FILE), encoding="utf-8") as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return ""  # Written before generations were recorded
+
+
+def read_snapshot(table_name, columns=None, after_id=None):
+    """
+    Loads the local snapshot of a WSMS table.
+
+    :param columns: Columns to load, defaults to every non-BLOB column.
+    :param after_id: Only load the rows whose primary key is above it; part files
+                     and row groups below it are skipped from their statistics.
+    :return: DataFrame with the columns in the requested order.
+    """
+    columns = list(columns or snapshot_columns(table_name))
+    path = snapshot_path(table_name)
+    primary_key = TABLE_PRIMARY_KEYS[table_name]
+    if os.path.isdir(path):
+        filters = [(primary_key, ">", after_id)] if after_id is not None else None
+        return pq.read_table(path, columns=columns, filters=filters, memory_map=True).to_pandas()
+    df = pd.read_csv(path, usecols=list(dict.fromkeys(columns + [primary_key])))
+    if after_id is not None:
+        df = df[df[primary_key] > after_id].reset_index(drop=True)
+    return df[columns]
+
+
+def to_arrow(table_name, df):
+    """Converts rows of a table to its typed snapshot schema."""
+    df = df[snapshot_columns(table_name)]
+    # DECIMAL columns arrive as Decimal objects
+    df = df.astype({column: "float64" for column, kind in TABLE_SCHEMAS[table_name].items() if kind == "float"})
+    return pa.Table.from_pandas(df, schema=arrow_schema(table_name), preserve_index=False)
+
+
+def stream_snapshot(table_name, chunks, generation=None):
+    """
+    Writes a table's snapshot chunk by chunk, replacing the previous one once complete.
+
+    Each chunk becomes one row group, so memory use is bounded by the chunk size.
+
+    :param chunks: Iterable of Arrow tables in the snapshot schema.
+    :param generation: Generation of the new dataset, a new one by default (see snapshot_generation).
+    :return: Number of rows written.
+    """
+    _recover_dataset(table_name)
+    path = parquet_path(table_name)
+    tmp_path, old_path = path + ".tmp", path + ".old"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+    rows = 0
+    with pq.ParquetWriter(os.path.join(tmp_path, "part-00000.parquet"), arrow_schema(table_name)) as writer:
+        for chunk in chunks:
+            writer.write_table(chunk)
+            rows += chunk.num_rows
+    with open(os.path.join(tmp_path, GENERATION_FILE), "w", encoding="utf-8") as f:
+        f.write(uuid.uuid4().hex if generation is None else generation)
+
+    if os.path.isdir(path):
+        os.replace(path, old_path)
+    os.replace(tmp_path, path)
+    shutil.rmtree(old_path, ignore_errors=True)
+    return rows
+
+
+def write_snapshot(table_name, df):
+    """Writes a table's snapshot as a typed Parquet dataset, replacing the previous one."""
+    return stream_snapshot(table_name, [to_arrow(table_name, df)])
+
+
+def snapshot_parts(table_name):
+    """Returns the sorted part files of a table's Parquet dataset."""
+    path = dataset_path(table_name)
+    if path is None:
+        return []
+    return sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith(".parquet"))
+
+
+def append_snapshot(table_name, df):
+    """Adds rows to a table's Parquet dataset as a new part file."""
+    _recover_dataset(table_name)
+    path = parquet_path(table_name)
+    parts = snapshot_parts(table_name)
+    last_number = int(os.path.basename(parts[-1])[len("part-"):-len(".parquet")]) if parts else -1
+    part_path = os.path.join(path, f"part-{last_number + 1:05d}.parquet")
+    tmp_path = os.path.join(path, "." + os.path.basename(part_path) + ".tmp")  # Hidden files are skipped by readers
+    pq.write_table(to_arrow(table_name, df), tmp_path)
+    os.replace(tmp_path, part_path)
+
+
+def compact_snapshot(table_name):
+    """Rewrites a table's Parquet dataset as a single part file, without querying MySQL."""
+    schema = arrow_schema(table_name)
+    # Same rows, so the same generation
+    generation = snapshot_generation(table_name)
+    stream_snapshot(table_name, (
+        pa.Table.from_batches([batch], schema=schema)
+        for part in snapshot_parts(table_name)
+        for batch in pq.ParquetFile(part).iter_batches(batch_size=SNAPSHOT_CHUNK_SIZE)
+    ), generation=generation)
+
+
+def load_state():
+    """Loads the sync state (high-water marks and checksums) recorded by the last refresh."""
+    if not os.path.exists(STATE_FILE):
+        return {}
+    with open(STATE_FILE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_state(state):
+    tmp_path = STATE_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, STATE_FILE)
+
+
+def _row_checksum_sql(table_name):
+    # Computed by MySQL on both the sync and the verify pass, so value formatting always matches
+    values = ", ".join(f"IFNULL(`{column}`, '\\N')" for column in snapshot_columns(table_name))
+    return f"BIT_XOR(CRC32(CONCAT_WS('#', {values})))"
+
+
+def range_checksum(conn, table_name, low=None, high=None):
+    """
+    Counts and checksums the rows of a table with low < primary key <= high.
+
+    Checksums of adjacent ranges combine with XOR.
+
+    :return: Tuple (row_count, checksum).
+    """
+    primary_key = TABLE_PRIMARY_KEYS[table_name]
+    conditions, params = [], []
+    if low is not None:
+        conditions.append(f"`{primary_key}` > %s")
+        params.append(low)
+    if high is not None:
+        conditions.append(f"`{primary_key}` <= %s")
+        params.append(high)
+    query = f"SELECT COUNT(*), {_row_checksum_sql(table_name)} FROM `{table_name}`"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+
+    cursor = conn.cursor()
+    try:
+        cursor.execute(query, params)
+        row_count, checksum = cursor.fetchone()
+    finally:
+        cursor.close()
+    return row_count, int(checksum or 0)
+
+
+def max_primary_key(conn, table_name):
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"SELECT MAX(`{TABLE_PRIMARY_KEYS[table_name]}`) FROM `{table_name}`")
+        return cursor.fetchone()[0]
+    finally:
+        cursor.close()
+
+
+def fetch_and_save_data(table_name, conn=None, chunk_size=SNAPSHOT_CHUNK_SIZE, log=None):
+    """
+    Streams a full table, without its BLOB columns, from MySQL into its snapshot.
+
+    Rows are read from an unbuffered cursor, chunk_size at a time, and each
+    chunk is written before the next one is read, so memory use does not
+    grow with the table.
+
+    :param log: Callable receiving a progress line after every chunk.
+    :return: Dict with the rows, seconds, rows_per_second and high_water_mark (max primary key) of the export.
+    """
+    primary_key = TABLE_PRIMARY_KEYS[table_name]
+    columns = snapshot_columns(table_name)
+    query = f"SELECT {', '.join(f'`{column}`' for column in columns)} FROM `{table_name}`"
+    stats = {"rows": 0, "seconds": 0.0, "rows_per_second": 0.0, "high_water_mark": 0}
+
+    def chunks(cursor):
+        started = time.perf_counter()
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            df = pd.DataFrame(rows, columns=columns)
+            stats["high_water_mark"] = max(stats["high_water_mark"], int(df[primary_key].max()))
+            stats["rows"] += len(df)
+            stats["seconds"] = time.perf_counter() - started
+            stats["rows_per_second"] = stats["rows"] / stats["seconds"] if stats["seconds"] else 0.0
+            if log is not None:
+                log(f"{table_name}: {stats['rows']} rows exported ({stats['rows_per_second']:.0f} rows/s)")
+            yield to_arrow(table_name, df)
+
+    own_connection = conn is None
+    if own_connection:
+        conn = get_connection()
+    try:
+        # Unbuffered: rows stay on the socket until fetched instead of being read all at once
+        cursor = conn.cursor(buffered=False)
+        try:
+            cursor.execute(query)
+            stream_snapshot(table_name, chunks(cursor))
+        finally:
+            cursor.close()
+    finally:
+        if own_connection:
+            conn.close()
+    return stats
+
+
+def full_sync(conn, table_name, log=None):
+    """Rewrites a table's snapshot and returns its new sync state."""
+    export = fetch_and_save_data(table_name, conn=conn, log=log)
+    high_water_mark = export["high_water_mark"]
+    row_count, checksum = range_checksum(conn, table_name, high=high_water_mark)
+    return {
+        "high_water_mark": high_water_mark,
+        "row_count": row_count,
+        "checksum": checksum,
+        "verified_at": time.time(),
+    }
+
+
+def incremental_sync(conn, table_name, entry, chunk_size=SNAPSHOT_CHUNK_SIZE):
+    """
+    Appends the rows above the table's high-water mark to its snapshot, chunk by chunk.
+
+    :param entry: Sync state of the table, updated in place.
+    :return: Number of rows appended.
+    """
+    primary_key = TABLE_PRIMARY_KEYS[table_name]
+    columns = snapshot_columns(table_name)
+    query = (f"SELECT {', '.join(f'`{column}`' for column in columns)} FROM `{table_name}` "
+             f"WHERE `{primary_key}` > %s ORDER BY `{primary_key}` LIMIT %s")
+
+    appended = 0
+    while True:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(query, (entry["high_water_mark"], chunk_size))
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+        if not rows:
+            break
+
+        df = pd.DataFrame(rows, columns=columns)
+        low, high = entry["high_water_mark"], int(df[primary_key].max())
+        row_count, checksum = range_checksum(conn, table_name, low=low, high=high)
+        append_snapshot(table_name, df)
+        entry["high_water_mark"] = high
+        entry["row_count"] += row_count
+        entry["checksum"] ^= checksum
+        appended += len(df)
+        if len(rows) < chunk_size:
+            break
+    return appended
+
+
+def verify_sync(conn, table_name, entry):
+    """Checks that the synced id range is unchanged in MySQL (no updates or deletes)."""
+    row_count, checksum = range_checksum(conn, table_name, high=entry["high_water_mark"])
+    return row_count == entry["row_count"] and checksum == entry["checksum"]
+
+
+def refresh_snapshots(tables=None, force=False, verify=None, chunk_size=SNAPSHOT_CHUNK_SIZE, log=print):
+    """
+    Brings the snapshots of the WSMS tables up to date.
+
+    :param tables: Table names to refresh, defaults to all seven WSMS tables.
+    :param force: Rewrite the snapshots instead of appending new rows.
+    :param verify: Run the checksum pass; None runs it every SNAPSHOT_VERIFY_INTERVAL seconds.
+    :param chunk_size: Rows pulled per query by the incremental sync.
+    :param log: Callable receiving one progress line per table.
+    :return: Dict table name -> "full", "appended", "unchanged".
+    """
+    tables = list(tables or TABLE_PRIMARY_KEYS)
+    for table_name in tables:
+        parquet_path(table_name)  # Fail early on unknown tables
+
+    state = load_state()
+    results = {}
+    conn = get_connection()
+    try:
+        for table_name in tables:
+            entry = state.get(table_name)
+            reason = None
+            if force:
+                reason = "forced"
+            elif entry is None or "high_water_mark" not in entry or not snapshot_parts(table_name):
+                reason = "no synced snapshot"
+            else:
+                due = verify if verify is not None else time.time() - entry["verified_at"] > SNAPSHOT_VERIFY_INTERVAL
+                if due:
+                    if verify_sync(conn, table_name, entry):
+                        entry["verified_at"] = time.time()
+                    else:
+                        reason = "synced rows were updated or deleted"
+
+            if reason is not None:
+                log(f"{table_name}: full refresh, {reason}")
+                entry = state[table_name] = full_sync(conn, table_name, log=log)
+                save_state(state)
+                results[table_name] = "full"
+                continue
+
+            max_id = max_primary_key(conn, table_name)
+            appended = 0
+            if max_id is not None and max_id > entry["high_water_mark"]:
+                appended = incremental_sync(conn, table_name, entry, chunk_size=chunk_size)
+                if len(snapshot_parts(table_name)) > SNAPSHOT_MAX_PARTS:
+                    compact_snapshot(table_name)
+            save_state(state)
+            results[table_name] = "appended" if appended else "unchanged"
+            log(f"{table_name}: {appended} rows appended ({entry['row_count']} rows, up to id {entry['high_water_mark']})")
+    finally:
+        conn.close()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Refresh the local WSMS table snapshots.")
+    parser.add_argument("tables", nargs="*", help="Tables to refresh (default: all WSMS tables)")
+    parser.add_argument("--force", action="store_true", help="Rewrite snapshots instead of appending new rows")
+    parser.add_argument("--verify", action="store_true", default=None,
+                        help="Check synced rows for updates and deletes now (default: every SNAPSHOT_VERIFY_INTERVAL)")
+    parser.add_argument("--chunk-size", type=int, default=SNAPSHOT_CHUNK_SIZE, help="Rows pulled per query")
+    parser.add_argument("--interval", type=float, default=0,
+                        help="Keep running and refresh every INTERVAL seconds")
+    args = parser.parse_args(argv)
+
+    while True:
+        refresh_snapshots(args.tables, force=args.force, verify=args.verify, chunk_size=args.chunk_size)
+        if args.interval <= 0:
+            break
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
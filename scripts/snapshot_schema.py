@@ -0,0 +1,182 @@
+# scripts/snapshot_schema.py
+"""
+Columns and column types of the WSMS tables.
+
+The Parquet snapshots are written with these explicit types instead of
+re-inferring them from CSV on every read. "blob" columns hold uploaded
+files and are never written to the snapshots. The data entry forms and the
+bulk import insert the columns returned by form_columns().
+"""
+
+# Table name -> {column: type}, in table column order; type is "int", "float", "str" or "blob"
+TABLE_SCHEMAS = {
+    "raw_watersource": {
+        "idRawWaterSource": "int",
+        "code": "int",
+        "RawWaterSource_name": "str",
+        "availability_year_round": "int",
+        "total_abstraction": "float",
+        "Drawing_RawWater_PumpingStation": "blob",
+        "Drawing_Water_Transmission_Network": "blob",
+        "Drawing_Water_Treatment_Plant": "blob",
+    },
+    "human_resources": {
+        "idHumanresources": "int",
+        "code": "int",
+        "total_staff": "int",
+        "staff_per_1000_subscribers": "float",
+        "training_sessions": "int",
+        "organization_chart": "blob",
+        "idRawWaterSource": "int",
+    },
+    "treatment_plant": {
+        "idTreatmentPlant": "int",
+        "code": "int",
+        "treatment_losses": "float",
+        "pac_consumption": "float",
+        "pac_per_m3_produced": "float",
+        "alum_consumption": "float",
+        "alum_per_m3_produced": "float",
+        "chlorine_consumption": "float",
+        "chlorine_per_m3_produced": "float",
+        "electricity_consumption": "float",
+        "electricity_per_m3_produced": "float",
+        "lime_consumption": "float",
+        "lime_per_m3_produced": "float",
+        "fuel_consumption": "float",
+        "fuel_per_m3_produced": "float",
+        "production_capacity": "float",
+        "idRawWaterSource": "int",
+    },
+    "water_quality": {
+        "idWaterQuality": "int",
+        "code": "int",
+        "color": "float",
+        "turbidity": "float",
+        "ph_level": "float",
+        "arsenic_level": "float",
+        "total_dissolved_solids": "float",
+        "manganese_level": "float",
+        "zinc_level": "float",
+        "sulfate_level": "float",
+        "copper_level": "float",
+        "hydrogen_sulfide": "float",
+        "hardness": "float",
+        "aluminum_level": "float",
+        "chloride_level": "float",
+        "iron_level": "float",
+        "ammonia_level": "float",
+        "barium_level": "float",
+        "cadmium_level": "float",
+        "chromium_level": "float",
+        "fluoride_level": "float",
+        "lead_level": "float",
+        "mercury_level": "float",
+        "nitrate_level": "float",
+        "nitrite_level": "float",
+        "sodium_level": "float",
+        "residual_chlorine": "float",
+        "idTreatmentPlant": "int",
+    },
+    "commercial": {
+        "idCommercial": "int",
+        "code": "int",
+        "population_served": "int",
+        "service_coverage_license_area": "float",
+        "service_coverage_network_area": "float",
+        "Water_Production": "float",
+        "water_sold": "float",
+        "water_supplied_without_charge": "float",
+        "total_water_consumption": "float",
+        "water_losses": "float",
+        "non_revenue_water": "float",
+        "average_daily_consumption": "float",
+        "average_consumption_per_connection": "float",
+        "average_consumption_per_capita": "float",
+        "total_water_connections": "int",
+        "residential_connections": "int",
+        "commercial_connections": "int",
+        "public_entity_connections": "int",
+        "factory_connections": "int",
+        "sme_connections": "int",
+        "poor_connections": "int",
+        "poor_household_ratio": "float",
+        "customer_complaints": "int",
+        "complaints_per_1000_connections": "float",
+        "license_area_profile": "str",
+        "network_area_population": "int",
+        "network_area_houses": "int",
+        "licensed_area_population": "int",
+        "licensed_area_houses": "int",
+        "idTreatmentPlant": "int",
+    },
+    "financial": {
+        "idFinancial": "int",
+        "code": "int",
+        "cash_from_water_sales": "float",
+        "other_cash": "float",
+        "amount_billed_for_water_sales": "float",
+        "amount_billed_for_other_services": "float",
+        "accounts_receivable": "float",
+        "average_tariff": "float",
+        "bill_collection_ratio": "float",
+        "total_operating_expenses": "float",
+        "operating_ratio": "float",
+        "production_expenses": "float",
+        "unit_production_cost": "float",
+        "net_income": "float",
+        "net_profit_margin": "float",
+        "investment_expenditures": "float",
+        "loans": "float",
+        "accounts_payable": "float",
+        "total_assets": "float",
+        "owner_equity": "float",
+        "debt_to_equity_ratio": "float",
+        "return_on_assets": "float",
+        "return_on_equity": "float",
+        "interest_expense": "float",
+        "depreciation_expense": "float",
+        "other_expense": "float",
+        "residential_tariff": "float",
+        "commercial_tariff": "float",
+        "government_tariff": "float",
+        "idCommercial": "int",
+    },
+    "distribution_network": {
+        "idDistributionNetwork": "int",
+        "code": "int",
+        "Supply_Pressure_end_connection": "float",
+        "Number_leak_repaired": "float",
+        "total_length": "float",
+        "transmission_length": "float",
+        "distribution_length": "float",
+        "Storagecapacity": "float",
+        "Supply_duration": "int",
+        "idCommercial": "int",
+    },
+}
+
+
+def blob_columns(table_name):
+    """Returns the BLOB columns of a table."""
+    return [column for column, kind in TABLE_SCHEMAS[table_name].items() if kind == "blob"]
+
+
+def snapshot_columns(table_name):
+    """Returns the columns of a table that are kept in its snapshot."""
+    return [column for column, kind in TABLE_SCHEMAS[table_name].items() if kind != "blob"]
+
+
+def form_columns(table_name):
+    """Returns the columns a new row of a table is inserted with: all but the auto-increment primary key."""
+    return list(TABLE_SCHEMAS[table_name])[1:]
+
+
+def numeric_columns(table_name):
+    """Returns the int and float columns of a table, as selected by select_dtypes(np.number)."""
+    return [column for column, kind in TABLE_SCHEMAS[table_name].items() if kind in ("int", "float")]
+
+
+def measure_columns(table_name):
+    """Returns the numeric columns of a table that hold measurements, not ids or codes."""
+    return [column for column in numeric_columns(table_name) if not column.startswith("id") and column != "code"]
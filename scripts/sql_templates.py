@@ -0,0 +1,204 @@
+# scripts/sql_templates.py
+"""
+Statement registry for the form tables.
+
+insert_record and fetch_data used to rebuild their SQL text on every submit
+and every dropdown load. Statements are now built once per (table, columns)
+and executed on server-side prepared cursors that stay open on each pooled
+connection, so MySQL parses and plans each statement once per connection.
+Table and column names are checked before they are put in a statement:
+tables against ALLOWED_TABLES, columns against the MySQL identifier rules.
+"""
+import functools
+import re
+import threading
+from collections import OrderedDict
+
+from config import DB_PREPARED_STATEMENTS
+
+# Unquoted MySQL identifier: may start with a digit, but not be all digits
+IDENTIFIER_RE = re.compile(r"^(?!\d+$)[0-9A-Za-z_$]{1,64}$")
+
+# Tables the forms, lookups and imports may read from or write to
+ALLOWED_TABLES = frozenset({
+    "address",
+    "appli_details_chemical",
+    "applic_calibration_metrology",
+    "applic_certific_recog_metro_expertise",
+    "applic_certific_recognition_internal_indu",
+    "applic_checking_importpermmetro_equipment",
+    "applic_license_repair_metrology",
+    "applic_metro_verify",
+    "applic_prototype_approval_certificate",
+    "applicant",
+    "background_application",
+    "business_infor",
+    "certificate_calibration",
+    "certificate_of_conformity",
+    "chemical_pro_plan_annual",
+    "commercial",
+    "company",
+    "company_signatur_and_stamp",
+    "declaration_buyer_importer",
+    "distribution_network",
+    "doc_applc_certific_recogin",
+    "doc_appli_metro_verify_importforth",
+    "doc_applic_certif_recog_expertise",
+    "doc_applic_importper_metroequi",
+    "doc_applic_license_repair_metrology",
+    "doc_applic_licese_cam_metrotrand",
+    "doc_applic_metro_calibra_second",
+    "doc_applic_metro_verify_second",
+    "doc_applic_metro_verifythird",
+    "doc_applic_metrology_calibration",
+    "doc_applic_metrology_verify",
+    "doc_applic_protoapprove_certificate",
+    "doc_electri_and_electro_pro_registration",
+    "doc_establishment_factory",
+    "doc_for_inves_project_pro_safety",
+    "doc_of_modification_electri_electro_part_pro",
+    "doc_of_modification_part_pro",
+    "doc_permit_smallmediumenterprices_handicraft",
+    "doc_pro_or_spare_part_pro_registration",
+    "doc_pro_regis_license",
+    "doc_recog_standard_chemical_substance",
+    "doc_represent_company_electri_electro_or_spare_part_pro",
+    "doc_restricted_chemicals",
+    "factory",
+    "factory_inspection_report",
+    "family_infor",
+    "financial",
+    "for_of_oficial_user_only",
+    "human_resources",
+    "idcardorpaassport",
+    "infor_detail_of_modification_part_or_electri_and_electro_pro",
+    "infor_factory_manager",
+    "infor_invest_pro_safety_and_sanitary_system",
+    "infor_investment_asset",
+    "infor_machinery_facilities",
+    "infor_planed_product_output",
+    "infor_product_waste",
+    "infor_quality_controlprogram",
+    "infor_raw_material",
+    "intrument_detail_repair",
+    "intrument_infor",
+    "license",
+    "list_chemical_substance",
+    "machinery_equipment_in_factory",
+    "metrology_intrument",
+    "office_contact",
+    "patent_card",
+    "personal_infor_for_applicant",
+    "previous_chemical_usage",
+    "pro_registration_license",
+    "product",
+    "production_chain",
+    "raw_materials",
+    "raw_watersource",
+    "result_of_calibration",
+    "test_report",
+    "treatment_plant",
+    "type_of_application",
+    "water_quality",
+    "workforce",
+})
+
+# Prepared statements kept open per connection, least recently used are closed first
+MAX_PREPARED_PER_CONNECTION = 64
+
+
+def check_table(table_name):
+    """Returns the table name if it is in ALLOWED_TABLES, raises ValueError otherwise."""
+    if table_name not in ALLOWED_TABLES:
+        raise ValueError(f"Table not allowed: {table_name!r}")
+    return table_name
+
+
+def check_columns(columns):
+    """Returns the columns as a tuple if they are valid identifiers, raises ValueError otherwise."""
+    columns = tuple(columns)
+    if not columns:
+        raise ValueError("No columns given")
+    for column in columns:
+        if not isinstance(column, str) or not IDENTIFIER_RE.match(column):
+            raise ValueError(f"Invalid column name: {column!r}")
+    return columns
+
+
+def _column_list(columns):
+    return ", ".join(f"`{column}`" for column in columns)
+
+
+@functools.lru_cache(maxsize=1024)
+def insert_statement(table_name, columns, rows=1):
+    """
+    Returns the INSERT statement of a table for `rows` rows of `columns`.
+
+    :param columns: Tuple of column names.
+    :param rows: Number of rows of the multi-row VALUES list.
+    """
+    columns = check_columns(columns)
+    row_placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+    return f"INSERT INTO `{check_table(table_name)}` ({_column_list(columns)}) VALUES {', '.join([row_placeholders] * rows)}"
+
+
+@functools.lru_cache(maxsize=1024)
+def select_statement(table_name, columns):
+    """Returns the SELECT statement of `columns` (a tuple) of a whole table."""
+    return f"SELECT {_column_list(check_columns(columns))} FROM `{check_table(table_name)}`"
+
+
+class _PreparedCursors:
+    """Prepared cursors of one connection, one per statement."""
+
+    def __init__(self):
+        self.cursors = OrderedDict()  # statement -> cursor, least recently used first
+
+
+# The cursors hold their connection, so entries are dropped explicitly by discard_prepared()
+_connections = {}  # id(connection) -> _PreparedCursors
+_lock = threading.Lock()
+
+
+def prepared_cursor(connection, statement):
+    """
+    Returns the prepared cursor of a statement on a connection, creating it on first use.
+
+    The cursor stays open for later calls with the same statement: callers must
+    fetch all rows but not close it. Falls back to a plain cursor, which the
+    caller closes, when DB_PREPARED_STATEMENTS is off.
+
+    :return: Tuple (cursor, reusable); close the cursor after use when reusable is False.
+    """
+    if not DB_PREPARED_STATEMENTS:
+        return connection.cursor(), False
+
+    with _lock:
+        cache = _connections.get(id(connection))
+        if cache is None:
+            cache = _connections[id(connection)] = _PreparedCursors()
+    # A connection is used by one thread at a time (see scripts/db_pool.py)
+    cursor = cache.cursors.get(statement)
+    if cursor is not None:
+        cache.cursors.move_to_end(statement)
+        return cursor, True
+
+    cursor = connection.cursor(prepared=True)
+    cache.cursors[statement] = cursor
+    if len(cache.cursors) > MAX_PREPARED_PER_CONNECTION:
+        _, evicted = cache.cursors.popitem(last=False)
+        evicted.close()  # Deallocates the server-side statement
+    return cursor, True
+
+
+def discard_prepared(connection):
+    """Closes the prepared cursors of a connection that is about to be closed, see ConnectionPool._discard."""
+    with _lock:
+        cache = _connections.pop(id(connection), None)
+    if cache is None:
+        return
+    for cursor in cache.cursors.values():
+        try:
+            cursor.close()  # Deallocates the server-side statement
+        except Exception:
+            pass  # The connection may already be gone
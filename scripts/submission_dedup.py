@@ -0,0 +1,81 @@
+# scripts/submission_dedup.py
+"""
+Short-lived index of recent form payloads, to drop duplicate submissions.
+
+A Streamlit rerun or a second click on a form's submit button after the
+first one completed can send the same row again, and nothing in the schema
+rejects it. Every submission's payload is hashed per (session, table); a
+payload seen again within DEDUP_TTL seconds is suppressed before it reaches
+the submission queue and counted in the index's stats.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from config import SUBMIT_DEDUP_TTL
+
+
+def payload_digest(columns, values):
+    """Hashes the column/value pairs of a submission; uploads are hashed through their blob references."""
+    payload = json.dumps([list(columns), list(values)], default=str, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DedupIndex:
+    def __init__(self, ttl=120, max_entries=10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._seen = OrderedDict()  # (session_id, table, digest) -> (recorded_at, ticket_id), oldest first
+        self._lock = threading.Lock()
+        self.suppressed = 0
+        self.suppressed_by_table = {}
+
+    def lookup(self, session_id, table_name, digest):
+        """
+        Returns the ticket id of the same payload submitted within the TTL, or None.
+
+        A hit is counted as a suppressed duplicate.
+        """
+        key = (session_id, table_name, digest)
+        with self._lock:
+            self._expire()
+            entry = self._seen.get(key)
+            if entry is None:
+                return None
+            self.suppressed += 1
+            self.suppressed_by_table[table_name] = self.suppressed_by_table.get(table_name, 0) + 1
+            return entry[1]
+
+    def record(self, session_id, table_name, digest, ticket_id):
+        key = (session_id, table_name, digest)
+        with self._lock:
+            self._seen.pop(key, None)
+            self._seen[key] = (time.monotonic(), ticket_id)
+            while len(self._seen) > self.max_entries:
+                self._seen.popitem(last=False)
+
+    def forget(self, session_id, table_name, digest):
+        """Drops a payload, e.g. after its insert failed, so it can be submitted again."""
+        with self._lock:
+            self._seen.pop((session_id, table_name, digest), None)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._seen),
+                "suppressed": self.suppressed,
+                "suppressed_by_table": dict(self.suppressed_by_table),
+            }
+
+    def _expire(self):
+        deadline = time.monotonic() - self.ttl
+        while self._seen:
+            key, (recorded_at, _) = next(iter(self._seen.items()))
+            if recorded_at > deadline:
+                break
+            del self._seen[key]
+
+
+dedup_index = DedupIndex(ttl=SUBMIT_DEDUP_TTL)
@@ -0,0 +1,175 @@
+# scripts/submission_queue.py
+"""
+Background worker pool for form submissions.
+
+submit_form used to insert the row, BLOB references included, on the
+Streamlit script thread, so a slow MySQL froze the session and users
+submitted again. Submissions are now handed to a small thread pool: the
+form gets a ticket right away and polls its status. Transient errors that
+leave nothing written (no free connection, server unreachable, lock wait
+timeout, deadlock) are retried with exponential backoff, and an idempotency
+key makes a repeated submission of the same form entry return the ticket
+of the first one.
+"""
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import mysql.connector
+from config import SUBMIT_MAX_ATTEMPTS, SUBMIT_QUEUE_SIZE, SUBMIT_RETRY_BACKOFF, SUBMIT_WORKERS
+from .db_pool import PoolTimeoutError
+from .help_function import DatabaseHelper
+
+# MySQL errors worth retrying, all raised before anything was written: too many connections,
+# server unreachable, lock wait timeout and deadlock (the transaction is rolled back).
+# A connection lost during the insert or COMMIT (2006, 2013, 2055) is not retried: the row
+# may already be committed, and a retry would insert it twice.
+TRANSIENT_ERRNOS = {1040, 1205, 1213, 2003}
+UNCERTAIN_ERRNOS = {2006, 2013, 2055}
+
+# Finished tickets are kept this many seconds for status polling
+TICKET_TTL = 3600
+
+
+class QueueFullError(RuntimeError):
+    """Raised when the submission queue has no free slot."""
+
+
+class Ticket:
+    """Status of one queued submission."""
+
+    QUEUED, RUNNING, RETRYING, DONE, FAILED = "queued", "running", "retrying", "done", "failed"
+
+    def __init__(self, ticket_id, idempotency_key, table_name):
+        self.id = ticket_id
+        self.idempotency_key = idempotency_key
+        self.table_name = table_name
+        self.status = self.QUEUED
+        self.attempts = 0
+        self.message = None
+        self.inserted_id = None
+        self.submitted_at = time.time()
+        self.finished_at = None
+
+    @property
+    def finished(self):
+        return self.status in (self.DONE, self.FAILED)
+
+
+def is_transient(err):
+    if isinstance(err, PoolTimeoutError):
+        return True
+    return isinstance(err, mysql.connector.Error) and err.errno in TRANSIENT_ERRNOS
+
+
+class SubmissionQueue:
+    def __init__(self, workers=4, max_pending=32, max_attempts=4, backoff=0.5):
+        """
+        :param workers: Number of worker threads inserting rows.
+        :param max_pending: Maximum number of queued or running submissions.
+        :param max_attempts: Attempts per submission, including retries of transient errors.
+        :param backoff: Delay in seconds before the first retry, doubled on every retry.
+        """
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="submission")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._ids = itertools.count(1)
+        self._tickets = {}  # ticket id -> Ticket
+        self._by_key = {}  # idempotency key -> Ticket
+        self._lock = threading.Lock()
+
+    def submit(self, table_name, columns, values, idempotency_key, return_id=True):
+        """
+        Queues an insert and returns its ticket without waiting for the database.
+
+        :param idempotency_key: Identifies the form entry; resubmitting it returns the
+                                existing ticket unless that one failed.
+        :raise QueueFullError: When max_pending submissions are already waiting.
+        """
+        with self._lock:
+            self._prune()
+            ticket = self._by_key.get(idempotency_key)
+            if ticket is not None and ticket.status != Ticket.FAILED:
+                return ticket
+            if not self._slots.acquire(blocking=False):
+                raise QueueFullError("Too many submissions are waiting, please try again in a moment")
+            ticket = Ticket(next(self._ids), idempotency_key, table_name)
+            self._tickets[ticket.id] = ticket
+            self._by_key[idempotency_key] = ticket
+
+        self._executor.submit(self._run, ticket, table_name, list(columns), list(values), return_id)
+        return ticket
+
+    def get(self, ticket_id):
+        """Returns the ticket with this id, or None once it expired."""
+        with self._lock:
+            return self._tickets.get(ticket_id)
+
+    def stats(self):
+        with self._lock:
+            statuses = [ticket.status for ticket in self._tickets.values()]
+        return {status: statuses.count(status) for status in
+                (Ticket.QUEUED, Ticket.RUNNING, Ticket.RETRYING, Ticket.DONE, Ticket.FAILED)}
+
+    def _run(self, ticket, table_name, columns, values, return_id):
+        try:
+            while True:
+                ticket.attempts += 1
+                ticket.status = Ticket.RUNNING
+                try:
+                    ticket.inserted_id = self._insert(table_name, columns, values)
+                except (mysql.connector.Error, PoolTimeoutError) as err:
+                    if is_transient(err) and ticket.attempts < self.max_attempts:
+                        ticket.status = Ticket.RETRYING
+                        ticket.message = f"Error: {err}"
+                        delay = self.backoff * 2 ** (ticket.attempts - 1)
+                        time.sleep(delay + random.uniform(0, self.backoff))
+                        continue
+                    ticket.message = f"Error: {err}"
+                    if getattr(err, "errno", None) in UNCERTAIN_ERRNOS:
+                        ticket.message += " (the entry may have been saved, check before submitting it again)"
+                    ticket.status = Ticket.FAILED
+                    break
+                if return_id:
+                    ticket.message = f"Data added successfully to {table_name} Table in Database and  it's ID!: {ticket.inserted_id}"
+                else:
+                    ticket.inserted_id = None
+                    ticket.message = f"Data added successfully to {table_name} Table In Database!"
+                ticket.status = Ticket.DONE
+                break
+        except Exception as err:  # Never leave a ticket pending
+            ticket.message = f"Error: {err}"
+            ticket.status = Ticket.FAILED
+        finally:
+            ticket.finished_at = time.time()
+            self._slots.release()
+
+    @staticmethod
+    def _insert(table_name, columns, values):
+        db_helper = DatabaseHelper()
+        try:
+            # Inside a transaction insert_record raises, so the error code can be inspected
+            with db_helper.transaction():
+                _, _, inserted_id = db_helper.insert_record(table_name, columns, values)
+            return inserted_id
+        finally:
+            db_helper.close_connection()  # A broken connection is discarded by the pool
+
+    def _prune(self):
+        expired = [ticket for ticket in self._tickets.values()
+                   if ticket.finished_at is not None and time.time() - ticket.finished_at > TICKET_TTL]
+        for ticket in expired:
+            del self._tickets[ticket.id]
+            if self._by_key.get(ticket.idempotency_key) is ticket:
+                del self._by_key[ticket.idempotency_key]
+
+
+submission_queue = SubmissionQueue(
+    workers=SUBMIT_WORKERS,
+    max_pending=SUBMIT_QUEUE_SIZE,
+    max_attempts=SUBMIT_MAX_ATTEMPTS,
+    backoff=SUBMIT_RETRY_BACKOFF,
+)
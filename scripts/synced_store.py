@@ -0,0 +1,151 @@
+# scripts/synced_store.py
+"""
+Summaries of a WSMS table kept up to date from its snapshot and committed inserts.
+
+Running moments (scripts/moments.py) and quantile sketches
+(scripts/quantile_sketch.py) describe a table without keeping its rows.
+A SyncedStore holds one such summary and keeps it current:
+
+- a snapshot sync only reads and folds in the rows above the last folded-in
+  id (the high-water mark); Parquet part files and row groups below it are
+  skipped from their statistics;
+- updated or deleted rows are found by the snapshot refresher's checksum
+  pass (see snapshot.verify_sync), which rewrites the snapshot under a new
+  generation; the summary is then rebuilt from the whole snapshot;
+- rows committed through DatabaseHelper are added right away via its
+  INSERT_LISTENERS, one summary per INSERT statement, and dropped once the
+  snapshot contains them; no inserted row is kept.
+
+The snapshot part is saved to <directory>/<name>.npz with its high-water
+mark and generation, so a restarted process only reads the rows added since.
+"""
+import os
+import threading
+
+import numpy as np
+from .snapshot import TABLE_PRIMARY_KEYS, read_snapshot, snapshot_generation, snapshot_signature
+from .snapshot_schema import TABLE_SCHEMAS
+
+
+def as_float(value):
+    """Converts an inserted value to float, NaN when missing or not numeric."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class SyncedStore:
+    MAX_INSERT_BATCHES = 256  # Insert summaries kept between syncs; the oldest are merged beyond it
+
+    def __init__(self, table_name, summary_class, columns, directory, name=None):
+        """
+        :param summary_class: Summary type with summary_class(columns) for an empty summary,
+                              summary_class.from_rows(columns, rows), merge(other) returning a new
+                              summary, save(path, **arrays) and summary_class.load(path) -> (summary, arrays).
+                              rows is a DataFrame or a list of value lists, numeric values as floats.
+        :param columns: Summarized columns, numeric or not (such as a grouping key).
+        :param directory: Where the snapshot part of the summary is saved.
+        :param name: File name of the saved summary, defaults to the table name.
+        """
+        self.table_name = table_name
+        self.summary_class = summary_class
+        self.columns = list(columns)
+        self.path = os.path.join(directory, f"{name or table_name}.npz")
+        primary_key = TABLE_PRIMARY_KEYS[table_name]
+        self._primary_key = primary_key
+        self._read_columns = self.columns if primary_key in self.columns else [primary_key] + self.columns
+        self._numeric = [column for column in self.columns if TABLE_SCHEMAS[table_name][column] in ("int", "float")]
+
+        self._lock = threading.Lock()
+        self._base = None  # Summary of the snapshot rows with id <= _high_water_mark
+        self._high_water_mark = 0
+        self._generation = None  # Snapshot generation the base summary was built from
+        self._signature = None
+        self._batches = []  # (first_id, last_id, summary) per insert since the last sync, oldest first
+        self._recent = summary_class(self.columns)  # The _batches summaries merged
+        self._current = None  # _base merged with _recent
+
+    def record_inserts(self, first_id, columns, rows):
+        """
+        Adds rows committed by one INSERT statement, until the snapshot contains them.
+
+        :param first_id: Id of the first row, the others following consecutively.
+        :param columns: Inserted columns; the other summarized columns count as missing values.
+        :param rows: Value sequences in the order of columns.
+        """
+        if not rows:
+            return
+        positions = {column: index for index, column in enumerate(columns)}
+        batch = []
+        for offset, values in enumerate(rows):
+            row = []
+            for column in self.columns:
+                if column == self._primary_key:
+                    value = first_id + offset
+                else:
+                    value = values[positions[column]] if column in positions else None
+                row.append(as_float(value) if column in self._numeric else value)
+            batch.append(row)
+        summary = self.summary_class.from_rows(self.columns, batch)
+        last_id = first_id + len(rows) - 1
+
+        with self._lock:
+            if any(batch_first == first_id for batch_first, _, _ in self._batches):
+                return  # Already recorded
+            self._batches.append((first_id, last_id, summary))
+            if len(self._batches) > self.MAX_INSERT_BATCHES:
+                (first, _, older), (_, last, newer) = self._batches[:2]
+                self._batches[:2] = [(first, last, older.merge(newer))]
+            self._recent = self._recent.merge(summary)
+            self._current = None
+
+    def summary(self):
+        """Returns the summary of the snapshot and of the rows inserted since; treat it as read-only."""
+        with self._lock:
+            signature = snapshot_signature(self.table_name)
+            if signature != self._signature:
+                self._sync()
+                self._signature = signature
+                self._current = None
+            if self._current is None:
+                self._current = self._base.merge(self._recent) if self._batches else self._base
+            return self._current
+
+    def _reset(self):
+        self._base, self._high_water_mark = self.summary_class(self.columns), 0
+        self._generation = None
+
+    def _load(self):
+        self._reset()
+        if os.path.exists(self.path):
+            saved, arrays = self.summary_class.load(self.path)
+            if saved.columns == self.columns and "generation" in arrays:
+                self._base, self._high_water_mark = saved, int(arrays["high_water_mark"])
+                self._generation = str(arrays["generation"])
+
+    def _sync(self):
+        if self._base is None:
+            self._load()
+        generation = snapshot_generation(self.table_name)
+        if generation != self._generation:
+            # Rewritten snapshot: rows at or below the high-water mark may have changed
+            self._reset()
+        frame = read_snapshot(self.table_name, self._read_columns, after_id=self._high_water_mark)
+        if len(frame):
+            self._base = self._base.merge(self.summary_class.from_rows(self.columns, frame[self.columns]))
+            self._high_water_mark = int(frame[self._primary_key].max())
+        if len(frame) or generation != self._generation:
+            self._generation = generation
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._base.save(self.path, high_water_mark=self._high_water_mark, generation=np.array(generation))
+
+        batches = [batch for batch in self._batches if batch[0] > self._high_water_mark]
+        if len(batches) != len(self._batches):
+            # Inserts now in the snapshot leave the recent summary, which is rebuilt from the rest.
+            # A batch the high-water mark falls inside is dropped too, its rows above
+            # the mark being missing until the next sync brings them in.
+            self._batches = batches
+            self._recent = self.summary_class(self.columns)
+            for _, _, summary in batches:
+                self._recent = self._recent.merge(summary)
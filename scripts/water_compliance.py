@@ -0,0 +1,182 @@
+# scripts/water_compliance.py
+"""
+Drinking-water compliance of the water_quality samples.
+
+Every sample is checked against a limit table of the 25 water quality
+parameters. The checks run column-wise over the whole table and each
+sample's failures are packed into one uint32 bitset (bit i set when
+parameter i of PARAMETERS is out of range). A per-idTreatmentPlant index
+of violation counts and OR-ed bitsets is built at the same time, so
+questions such as "which plants exceeded arsenic, lead or nitrate" are
+answered from a few bitwise operations instead of rescanning the samples.
+The index is rebuilt once per data version.
+
+Usage:
+    python -m scripts.water_compliance arsenic_level lead_level nitrate_level
+"""
+import argparse
+import functools
+
+import numpy as np
+import pandas as pd
+from .wsms_frames import data_version, get_frame
+
+# Parameter -> (minimum, maximum, unit); None means no limit on that side.
+# Defaults follow the Cambodian Drinking Water Quality Standards, adjust them here.
+THRESHOLDS = {
+    "color": (None, 5.0, "TCU"),
+    "turbidity": (None, 5.0, "NTU"),
+    "ph_level": (6.5, 8.5, "pH"),
+    "arsenic_level": (None, 0.05, "mg/L"),
+    "total_dissolved_solids": (None, 800.0, "mg/L"),
+    "manganese_level": (None, 0.1, "mg/L"),
+    "zinc_level": (None, 3.0, "mg/L"),
+    "sulfate_level": (None, 250.0, "mg/L"),
+    "copper_level": (None, 1.0, "mg/L"),
+    "hydrogen_sulfide": (None, 0.05, "mg/L"),
+    "hardness": (None, 300.0, "mg/L"),
+    "aluminum_level": (None, 0.2, "mg/L"),
+    "chloride_level": (None, 250.0, "mg/L"),
+    "iron_level": (None, 0.3, "mg/L"),
+    "ammonia_level": (None, 1.5, "mg/L"),
+    "barium_level": (None, 0.7, "mg/L"),
+    "cadmium_level": (None, 0.003, "mg/L"),
+    "chromium_level": (None, 0.05, "mg/L"),
+    "fluoride_level": (None, 1.5, "mg/L"),
+    "lead_level": (None, 0.01, "mg/L"),
+    "mercury_level": (None, 0.001, "mg/L"),
+    "nitrate_level": (None, 50.0, "mg/L"),
+    "nitrite_level": (None, 3.0, "mg/L"),
+    "sodium_level": (None, 200.0, "mg/L"),
+    "residual_chlorine": (0.1, 1.0, "mg/L"),
+}
+
+# Bit i of a violation bitset stands for PARAMETERS[i]
+PARAMETERS = list(THRESHOLDS)
+
+
+def threshold_table():
+    """Returns the limits as a DataFrame, one row per parameter."""
+    return pd.DataFrame(
+        [(parameter, minimum, maximum, unit) for parameter, (minimum, maximum, unit) in THRESHOLDS.items()],
+        columns=["parameter", "minimum", "maximum", "unit"],
+    )
+
+
+def parameter_mask(parameters=None):
+    """Returns the bitset of the given parameters, all of them by default."""
+    if parameters is None:
+        return (1 << len(PARAMETERS)) - 1
+    mask = 0
+    for parameter in parameters:
+        if parameter not in THRESHOLDS:
+            raise ValueError(f"Unknown water quality parameter: {parameter}")
+        mask |= 1 << PARAMETERS.index(parameter)
+    return mask
+
+
+def parameter_names(bits):
+    """Returns the parameters whose bit is set in a bitset."""
+    return [parameter for i, parameter in enumerate(PARAMETERS) if bits >> i & 1]
+
+
+def violation_bits(frame):
+    """
+    Checks every sample against THRESHOLDS.
+
+    Missing values are not violations.
+
+    :return: uint32 array with one violation bitset per row of frame.
+    """
+    bits = np.zeros(len(frame), dtype=np.uint32)
+    for i, (parameter, (minimum, maximum, _)) in enumerate(THRESHOLDS.items()):
+        values = frame[parameter].to_numpy(dtype="float64", na_value=np.nan)
+        failed = np.zeros(len(frame), dtype=bool)
+        if minimum is not None:
+            failed |= values < minimum
+        if maximum is not None:
+            failed |= values > maximum
+        bits |= failed.astype(np.uint32) << np.uint32(i)
+    return bits
+
+
+class ComplianceIndex:
+    """Violation bitsets of all samples and their per-plant aggregates."""
+
+    def __init__(self, frame):
+        self.sample_ids = frame["idWaterQuality"].to_numpy()
+        self.plant_ids = frame["idTreatmentPlant"].to_numpy()
+        self.bits = violation_bits(frame)
+
+        codes, plants = pd.factorize(self.plant_ids, sort=True)
+        # Samples without a treatment plant (code -1) count towards the rates but no plant
+        codes, assigned_bits = codes[codes >= 0], self.bits[codes >= 0]
+        # Per plant: number of samples, failing samples and failures of each parameter
+        counts = {"samples": np.bincount(codes, minlength=len(plants))}
+        counts["failing_samples"] = np.bincount(codes, weights=assigned_bits != 0, minlength=len(plants)).astype(np.int64)
+        for i, parameter in enumerate(PARAMETERS):
+            failed = (assigned_bits >> np.uint32(i)) & np.uint32(1)
+            counts[parameter] = np.bincount(codes, weights=failed, minlength=len(plants)).astype(np.int64)
+        self.plant_counts = pd.DataFrame(counts, index=pd.Index(plants, name="idTreatmentPlant"))
+        # Per plant: OR of its samples' bitsets
+        plant_bits = np.zeros(len(plants), dtype=np.uint32)
+        np.bitwise_or.at(plant_bits, codes, assigned_bits)
+        self.plant_bits = pd.Series(plant_bits, index=self.plant_counts.index)
+
+    def plants_exceeding(self, parameters=None):
+        """
+        Lists the plants with at least one sample out of range for any of the parameters.
+
+        :return: DataFrame indexed by idTreatmentPlant with the sample count and one violation count per parameter.
+        """
+        mask = parameter_mask(parameters)
+        selected = (self.plant_bits.to_numpy() & np.uint32(mask)) != 0
+        columns = ["samples"] + [parameter for parameter in PARAMETERS if mask >> PARAMETERS.index(parameter) & 1]
+        return self.plant_counts.loc[selected, columns]
+
+    def failing_samples(self, parameters=None, plant_id=None):
+        """
+        Lists the samples out of range for any of the parameters.
+
+        :return: DataFrame with idWaterQuality, idTreatmentPlant and the failed parameters.
+        """
+        selected = (self.bits & np.uint32(parameter_mask(parameters))) != 0
+        if plant_id is not None:
+            selected &= self.plant_ids == plant_id
+        bits = self.bits[selected]
+        return pd.DataFrame({
+            "idWaterQuality": self.sample_ids[selected],
+            "idTreatmentPlant": self.plant_ids[selected],
+            "failed": [", ".join(parameter_names(int(value))) for value in bits],
+        })
+
+    def compliance_rate(self, parameters=None):
+        """Returns the share of samples within range for all of the parameters."""
+        if not len(self.bits):
+            return 1.0
+        return float(np.mean((self.bits & np.uint32(parameter_mask(parameters))) == 0))
+
+
+@functools.lru_cache(maxsize=2)
+def _build_index(version):
+    return ComplianceIndex(get_frame("water_quality"))
+
+
+def get_compliance_index():
+    """Returns the compliance index of the current water_quality snapshot."""
+    return _build_index(data_version())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="List treatment plants exceeding drinking-water limits.")
+    parser.add_argument("parameters", nargs="*", help="Parameters checked, defaults to all")
+    args = parser.parse_args(argv)
+
+    index = get_compliance_index()
+    parameters = args.parameters or None
+    print(f"{len(index.bits)} samples, {index.compliance_rate(parameters):.1%} compliant")
+    print(index.plants_exceeding(parameters).to_string())
+
+
+if __name__ == "__main__":
+    main()
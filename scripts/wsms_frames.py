@@ -0,0 +1,58 @@
+# scripts/wsms_frames.py
+"""
+Shared, memoized WSMS frames for the dashboard.
+
+Every visualization used to re-read the snapshot CSVs and rebuild the same
+raw_watersource -> treatment_plant -> commercial -> financial merge chain.
+The tables and their joins are now built on first use once per data version
+(the mtime and size of the snapshot files) and shared by all dashboard
+functions.
+The returned frames are shared: copy them before modifying in place.
+"""
+import functools
+
+import pandas as pd
+from .snapshot import TABLE_PRIMARY_KEYS, read_snapshot, snapshot_signature
+
+# Pre-joined frame name -> (left frame, right frame, join column)
+_JOINS = {
+    "source_staff": ("raw_watersource", "human_resources", "idRawWaterSource"),
+    "source_plant": ("raw_watersource", "treatment_plant", "idRawWaterSource"),
+    "plant_quality": ("water_quality", "source_plant", "idTreatmentPlant"),
+    "commercial_plant": ("commercial", "source_plant", "idTreatmentPlant"),
+    "commercial_financial": ("commercial_plant", "financial", "idCommercial"),
+    "network": ("commercial_financial", "distribution_network", "idCommercial"),
+}
+
+# Pre-joined frame name -> description of the join
+JOINED_FRAMES = {name: f"{left} x {right} on {on}" for name, (left, right, on) in _JOINS.items()}
+
+
+def data_version():
+    """Identifies the current snapshots by the modification time and size of their files."""
+    return tuple((table_name, *snapshot_signature(table_name)) for table_name in TABLE_PRIMARY_KEYS)
+
+
+@functools.lru_cache(maxsize=len(TABLE_PRIMARY_KEYS) + len(JOINED_FRAMES))
+def _build_frame(name, version):
+    # Frames are loaded on first use, so a dashboard section only reads the tables it plots
+    if name in TABLE_PRIMARY_KEYS:
+        return read_snapshot(name)
+
+    left, right, on = _JOINS[name]
+    frame = pd.merge(_build_frame(left, version), _build_frame(right, version), on=on)
+    if name == "commercial_plant":
+        frame.drop(columns=['code_x', 'code_y'], inplace=True)
+    return frame
+
+
+def get_frame(name):
+    """
+    Returns a WSMS table or pre-joined frame for the current data version.
+
+    :param name: A WSMS table name or one of the JOINED_FRAMES names.
+    :return: The shared DataFrame, rebuilt only when the snapshot files change.
+    """
+    if name not in TABLE_PRIMARY_KEYS and name not in JOINED_FRAMES:
+        raise ValueError(f"Unknown WSMS frame: {name}")
+    return _build_frame(name, data_version())